@@ -1,6 +1,7 @@
 import json
 import os
 import sys
+import threading
 
 
 def is_dev_environment():
@@ -53,46 +54,146 @@ def get_asset_path(filename):
     return os.path.join(base_path, 'assets', filename)
 
 
-def save_vault_directory(vault_directory):
-    # Ensure config directory exists
-    config_dir = os.path.dirname(CONFIG_FILE)
-    if not os.path.exists(config_dir):
-        os.makedirs(config_dir, exist_ok=True)
+class ConfigService:
+    """Loads the config file once and serves cached values until its mtime changes"""
+
+    def __init__(self, config_file):
+        self.config_file = config_file
+        self._lock = threading.RLock()
+        self._data = None
+        self._mtime = None
+        self._paths = {}
 
-    config = {}
-    if os.path.exists(CONFIG_FILE):
+    def _file_mtime(self):
         try:
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-        except Exception as e:
-            print(f"Error reading existing config: {e}")
-            config = {}
+            return os.stat(self.config_file).st_mtime_ns
+        except OSError:
+            return None
+
+    def _ensure_loaded(self):
+        mtime = self._file_mtime()
+        if self._data is not None and mtime == self._mtime:
+            return
+
+        data = {}
+        if mtime is not None:
+            try:
+                with open(self.config_file, 'r') as f:
+                    data = json.load(f)
+            except Exception as e:
+                print(f"Error reading config: {e}")
+
+        self._data = data
+        self._mtime = mtime
+        self._paths = {}
+
+    def exists(self):
+        with self._lock:
+            self._ensure_loaded()
+            return self._mtime is not None
+
+    def get(self, key, default=None):
+        with self._lock:
+            self._ensure_loaded()
+            return self._data.get(key, default)
+
+    def update(self, values):
+        """Merge values into the config file and refresh the cache"""
+        with self._lock:
+            config_dir = os.path.dirname(self.config_file)
+            if not os.path.exists(config_dir):
+                os.makedirs(config_dir, exist_ok=True)
+
+            self._ensure_loaded()
+            config = dict(self._data)
+            config.update(values)
+
+            try:
+                with open(self.config_file, 'w') as f:
+                    json.dump(config, f, indent=2)
+            except Exception as e:
+                print(f"Error saving config: {e}")
+                return False
+
+            self.invalidate()
+            return True
+
+    def cached_path(self, name, resolver):
+        """Return a derived path, resolving it only once per config version"""
+        with self._lock:
+            self._ensure_loaded()
+            if name not in self._paths:
+                self._paths[name] = resolver()
+            return self._paths[name]
+
+    def invalidate(self):
+        with self._lock:
+            self._data = None
+            self._mtime = None
+            self._paths = {}
+
+
+_config_service = ConfigService(CONFIG_FILE)
+
+
+def get_config_service():
+    return _config_service
+
+
+# =============================================================================
+# TYPED SETTINGS
+# =============================================================================
+
+SETTINGS = {
+    "vault_directory": (str, None),
+    "is_dev_environment": (bool, False),
+}
 
-    config['vault_directory'] = vault_directory
-    # Store environment info for debugging
-    config['is_dev_environment'] = is_dev_environment()
+
+def register_setting(name, setting_type, default=None):
+    """Declare a setting so get_setting/set_setting can validate it"""
+    SETTINGS[name] = (setting_type, default)
+
+
+def get_setting(name):
+    setting_type, default = SETTINGS[name]
+    value = _config_service.get(name, default)
+    if value is None or isinstance(value, setting_type):
+        return value
 
     try:
-        with open(CONFIG_FILE, 'w') as f:
-            json.dump(config, f, indent=2)
-        return True
-    except Exception as e:
-        print(f"Error saving config: {e}")
-        return False
+        return setting_type(value)
+    except (TypeError, ValueError):
+        print(f"Invalid value for setting {name}: {value!r}")
+        return default
+
+
+def set_setting(name, value):
+    setting_type, _ = SETTINGS[name]
+    if value is not None and not isinstance(value, setting_type):
+        raise TypeError(f"Setting {name} expects {setting_type.__name__}")
+    return _config_service.update({name: value})
+
+
+# =============================================================================
+# VAULT PATHS
+# =============================================================================
+
+def save_vault_directory(vault_directory):
+    return _config_service.update({
+        'vault_directory': vault_directory,
+        # Store environment info for debugging
+        'is_dev_environment': is_dev_environment(),
+    })
 
 
 def get_vault_directory():
-    if os.path.exists(CONFIG_FILE):
-        try:
-            with open(CONFIG_FILE, 'r') as f:
-                config = json.load(f)
-            return config.get('vault_directory')
-        except Exception as e:
-            print(f"Error reading config: {e}")
+    if _config_service.exists():
+        return get_setting('vault_directory')
     return get_default_vault_directory()
 
 
-def get_current_auth_path():
+def _resolve_auth_path():
     vault_dir = get_vault_directory()
     if vault_dir:
         auth_dir = os.path.join(vault_dir, "auth")
@@ -103,16 +204,25 @@ def get_current_auth_path():
     return None
 
 
-def get_current_vault_path():
+def _resolve_vault_path():
     vault_dir = get_vault_directory()
     if vault_dir:
         return os.path.join(vault_dir, "vault.enc")
     return None
 
 
+def get_current_auth_path():
+    return _config_service.cached_path("auth", _resolve_auth_path)
+
+
+def get_current_vault_path():
+    return _config_service.cached_path("vault", _resolve_vault_path)
+
+
 def update_config_paths(vault_directory):
     # Save to persistent config file
     if save_vault_directory(vault_directory):
+        _config_service.invalidate()
         initialize_paths()
         return True
     return False
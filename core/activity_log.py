@@ -0,0 +1,250 @@
+"""
+Encrypted, append-only activity log.
+
+Each event is encrypted on its own with the vault key and appended as one line
+to the current segment file. Segments rotate at a fixed size and only the
+newest few are kept. The most recent events also live in an in-memory ring
+buffer, filled at startup from the tail segments only, so the Recent Activity
+panel never waits on the full log.
+"""
+
+import base64
+import os
+import threading
+import time
+from collections import deque
+
+SEGMENT_PREFIX = "activity_"
+SEGMENT_SUFFIX = ".log"
+SEGMENT_MAX_BYTES = 256 * 1024
+MAX_SEGMENTS = 8
+RING_SIZE = 50
+
+ENTRY_ADDED = "entry_added"
+ENTRY_UPDATED = "entry_updated"
+ENTRY_DELETED = "entry_deleted"
+FOLDER_CREATED = "folder_created"
+FOLDER_RENAMED = "folder_renamed"
+FOLDER_DELETED = "folder_deleted"
+AUTOFILL = "autofill"
+BACKUP = "backup"
+
+
+def get_activity_directory():
+    """Activity segments live next to the vault they describe"""
+    from config import get_vault_path
+    directory = os.path.join(os.path.dirname(get_vault_path()), "activity")
+    os.makedirs(directory, exist_ok=True)
+    return directory
+
+
+def describe_event(event):
+    """Short human description of an activity event"""
+    action = event.get("action")
+    title = event.get("title") or "Entry"
+    folder = event.get("folder") or "Folder"
+
+    descriptions = {
+        ENTRY_ADDED: f"{title} added",
+        ENTRY_UPDATED: f"{title} updated",
+        ENTRY_DELETED: f"{title} deleted",
+        FOLDER_CREATED: f"Folder {folder} created",
+        FOLDER_RENAMED: f"Folder renamed to {folder}",
+        FOLDER_DELETED: f"Folder {folder} deleted",
+        AUTOFILL: f"{title} auto-filled",
+        BACKUP: "Vault backed up" if event.get("success", True) else "Backup failed",
+    }
+    return descriptions.get(action, action or "Activity")
+
+
+class ActivityLog:
+    """Segmented encrypted event log with an in-memory tail"""
+
+    def __init__(self, key, directory=None, ring_size=RING_SIZE,
+                 segment_max_bytes=SEGMENT_MAX_BYTES, max_segments=MAX_SEGMENTS):
+        self.key = key
+        self.directory = directory or get_activity_directory()
+        self.segment_max_bytes = segment_max_bytes
+        self.max_segments = max_segments
+
+        self._lock = threading.Lock()
+        self._recent = deque(maxlen=ring_size)
+        self._subscribers = []
+        self._load_tail()
+
+    # =============================================================================
+    # SEGMENTS
+    # =============================================================================
+
+    def _segments(self):
+        """Segment numbers on disk, oldest first"""
+        numbers = []
+        for name in os.listdir(self.directory):
+            if name.startswith(SEGMENT_PREFIX) and name.endswith(SEGMENT_SUFFIX):
+                try:
+                    numbers.append(int(name[len(SEGMENT_PREFIX):-len(SEGMENT_SUFFIX)]))
+                except ValueError:
+                    continue
+        return sorted(numbers)
+
+    def _segment_path(self, number):
+        return os.path.join(self.directory, f"{SEGMENT_PREFIX}{number:06d}{SEGMENT_SUFFIX}")
+
+    def _current_segment(self):
+        segments = self._segments()
+        if not segments:
+            return self._segment_path(1)
+
+        path = self._segment_path(segments[-1])
+        if os.path.getsize(path) < self.segment_max_bytes:
+            return path
+
+        # Rotate, dropping the oldest segments beyond the limit
+        for number in segments[:max(0, len(segments) + 1 - self.max_segments)]:
+            try:
+                os.remove(self._segment_path(number))
+            except OSError:
+                pass
+        return self._segment_path(segments[-1] + 1)
+
+    # =============================================================================
+    # RECORDS
+    # =============================================================================
+
+    def _encrypt(self, event):
+        from security.encryption import encrypt_vault
+        return base64.b64encode(encrypt_vault(event, self.key)).decode('ascii')
+
+    def _decrypt(self, line):
+        from security.encryption import decrypt_vault
+        return decrypt_vault(base64.b64decode(line), self.key)
+
+    def _read_segment(self, number):
+        events = []
+        with open(self._segment_path(number), 'r', encoding='ascii') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    events.append(self._decrypt(line))
+                except Exception:
+                    # Torn write or a record from before a password change
+                    continue
+        return events
+
+    def _load_tail(self):
+        """Fill the ring buffer from the newest segments only"""
+        tail = []
+        try:
+            for number in reversed(self._segments()):
+                tail = self._read_segment(number) + tail
+                if len(tail) >= self._recent.maxlen:
+                    break
+        except Exception as e:
+            print(f"Error reading activity log: {e}")
+        self._recent.extend(tail[-self._recent.maxlen:])
+
+    def append(self, action, **details):
+        """Record an event on disk and in the ring buffer"""
+        event = {"ts": time.time(), "action": action}
+        event.update(details)
+
+        try:
+            line = self._encrypt(event)
+            with self._lock:
+                with open(self._current_segment(), 'a', encoding='ascii') as f:
+                    f.write(line + "\n")
+                self._recent.append(event)
+        except Exception as e:
+            print(f"Error writing activity log: {e}")
+            return None
+
+        for callback in list(self._subscribers):
+            try:
+                callback(event)
+            except Exception as e:
+                print(f"Activity subscriber failed: {e}")
+        return event
+
+    def recent(self, limit=None):
+        """Newest events first, served from memory"""
+        with self._lock:
+            events = list(self._recent)
+        events.reverse()
+        return events[:limit] if limit else events
+
+    def subscribe(self, callback):
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    # =============================================================================
+    # VAULT MODEL EVENTS
+    # =============================================================================
+
+    def on_vault_changed(self, event, payload):
+        """VaultModel subscriber that records every mutation"""
+        from core import vault_model
+
+        entry = payload.get("entry") or {}
+        details = {
+            "folder": payload.get("folder"),
+            "entry_id": vault_model.entry_id(entry) if entry else None,
+            "title": _entry_title(entry),
+        }
+
+        if event == vault_model.ENTRY_ADDED:
+            self.append(ENTRY_ADDED, **details)
+        elif event == vault_model.ENTRY_CHANGED:
+            self.append(ENTRY_UPDATED, **details)
+        elif event == vault_model.ENTRY_REMOVED:
+            self.append(ENTRY_DELETED, **details)
+        elif event == vault_model.FOLDER_ADDED:
+            self.append(FOLDER_CREATED, folder=payload.get("folder"))
+        elif event == vault_model.FOLDER_RENAMED:
+            self.append(FOLDER_RENAMED, folder=payload.get("folder"), old_folder=payload.get("old_folder"))
+        elif event == vault_model.FOLDER_REMOVED:
+            self.append(FOLDER_DELETED, folder=payload.get("folder"), entry_count=payload.get("entry_count"))
+
+
+def _entry_title(entry):
+    for field in ['Title', 'title', 'Name', 'name', 'Username', 'username']:
+        if entry.get(field):
+            return str(entry[field])
+    return None
+
+
+_activity_log = None
+
+
+def open_activity_log(key):
+    """Open the log for an unlocked vault, reusing it if the key is unchanged"""
+    global _activity_log
+    if _activity_log is None or _activity_log.key != key:
+        try:
+            _activity_log = ActivityLog(key)
+        except Exception as e:
+            print(f"Error opening activity log: {e}")
+            _activity_log = None
+    return _activity_log
+
+
+def get_activity_log():
+    return _activity_log
+
+
+def close_activity_log():
+    """Drop the open log and its key when the vault is locked"""
+    global _activity_log
+    _activity_log = None
+
+
+def log_activity(action, **details):
+    """Record an event if a vault is unlocked, otherwise do nothing"""
+    if _activity_log:
+        return _activity_log.append(action, **details)
+    return None
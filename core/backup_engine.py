@@ -0,0 +1,373 @@
+"""
+Incremental, content-addressed vault backups.
+
+A snapshot is a small manifest listing the SHA-256 of each chunk of the
+encrypted vault file. Chunk boundaries are content-defined: a rolling hash over
+the bytes picks the cut points, so an edit only changes the chunks around it
+and every later cut lands where it did before. vault_format writes unchanged
+folders back as their original ciphertext, so those folders come out as the
+same chunks from one save to the next. Chunks are stored once under their hash,
+so snapshots only upload chunks the target does not already hold, and
+unchanged vaults are skipped entirely. Old snapshots are pruned with a grandfather-father-son policy
+and chunks no longer referenced by any snapshot are garbage collected.
+
+Targets provide list_objects(prefix), put_object(name, data), get_object(id)
+and delete_object(id).
+"""
+
+import hashlib
+import json
+import os
+import threading
+from datetime import datetime
+
+from config import register_setting
+
+SNAPSHOT_PREFIX = "vault_backup_"
+MANIFEST_SUFFIX = ".manifest.json"
+CHUNK_PREFIX = "vault_chunk_"
+MIN_CHUNK_SIZE = 4 * 1024
+MAX_CHUNK_SIZE = 256 * 1024
+# Cut where the top 14 bits of the rolling hash are zero, one byte in 16 KiB on average
+CHUNK_MASK = ((1 << 14) - 1) << 50
+TIMESTAMP_FORMAT = "%Y%m%d_%H%M%S"
+
+# Engines for different targets share one state file when fanned out
+_state_lock = threading.Lock()
+# Manual and scheduled backups can hit the same target at once
+_target_locks = {}
+_target_locks_guard = threading.Lock()
+
+register_setting("backup_keep_last", int, 10)
+register_setting("backup_keep_daily", int, 7)
+register_setting("backup_keep_weekly", int, 4)
+register_setting("backup_keep_monthly", int, 12)
+
+
+def get_retention_policy():
+    from config import get_setting
+    return {
+        "last": get_setting("backup_keep_last"),
+        "daily": get_setting("backup_keep_daily"),
+        "weekly": get_setting("backup_keep_weekly"),
+        "monthly": get_setting("backup_keep_monthly"),
+    }
+
+
+# Gear table for the rolling hash, fixed so cut points match across runs
+_GEAR = [int.from_bytes(hashlib.sha256(bytes([i])).digest()[:8], 'big') for i in range(256)]
+
+
+def split_chunks(data, min_size=MIN_CHUNK_SIZE, max_size=MAX_CHUNK_SIZE):
+    """Cut data where a gear hash of the preceding bytes matches CHUNK_MASK"""
+    gear = _GEAR
+    length = len(data)
+    start = 0
+
+    while start < length:
+        end = min(start + max_size, length)
+        cut = end
+        h = 0
+        for i in range(start + min_size, end):
+            h = ((h << 1) + gear[data[i]]) & 0xFFFFFFFFFFFFFFFF
+            if not h & CHUNK_MASK:
+                cut = i + 1
+                break
+        yield data[start:cut]
+        start = cut
+
+
+def hash_file(path):
+    sha256 = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(MAX_CHUNK_SIZE), b""):
+            sha256.update(block)
+    return sha256.hexdigest()
+
+
+def _target_lock(target_key):
+    """One lock per target so a prune never runs while another backup is mid-upload"""
+    with _target_locks_guard:
+        return _target_locks.setdefault(target_key, threading.RLock())
+
+
+def parse_created_time(obj):
+    """Upload time a target reported for an object, None if it gave none"""
+    try:
+        return datetime.fromisoformat(obj["createdTime"].replace("Z", "+00:00"))
+    except (KeyError, AttributeError, ValueError):
+        return None
+
+
+def parse_snapshot_time(name):
+    """Timestamp encoded in a snapshot or legacy full-backup name, None if not a snapshot"""
+    if not name.startswith(SNAPSHOT_PREFIX):
+        return None
+    try:
+        stamp = name[len(SNAPSHOT_PREFIX):len(SNAPSHOT_PREFIX) + 15]
+        return datetime.strptime(stamp, TIMESTAMP_FORMAT)
+    except ValueError:
+        return None
+
+
+def select_retained(snapshots, policy):
+    """Pick the snapshots a GFS policy keeps from a list of (time, object) pairs"""
+    ordered = sorted(snapshots, key=lambda s: s[0], reverse=True)
+    # The newest snapshot always survives, whatever the policy says
+    keep = {0} if ordered else set()
+
+    for index, _ in enumerate(ordered[:policy.get("last", 0)]):
+        keep.add(index)
+
+    buckets = (
+        ("daily", lambda t: t.date()),
+        ("weekly", lambda t: tuple(t.isocalendar()[:2])),
+        ("monthly", lambda t: (t.year, t.month)),
+    )
+    for policy_name, bucket_of in buckets:
+        # Newest snapshot in each of the most recent N periods
+        seen = set()
+        for index, (timestamp, _) in enumerate(ordered):
+            bucket = bucket_of(timestamp)
+            if bucket in seen:
+                continue
+            if len(seen) >= policy.get(policy_name, 0):
+                break
+            seen.add(bucket)
+            keep.add(index)
+
+    return [ordered[i][1] for i in sorted(keep)]
+
+
+class BackupIntegrityError(Exception):
+    """A snapshot is incomplete or does not match its recorded hashes"""
+
+
+def get_engine_state_path():
+    from core.google_drive_backup import get_backup_data_directory
+    return os.path.join(get_backup_data_directory(), "backup_engine_state.json")
+
+
+class BackupEngine:
+    """Incremental snapshots of the vault file onto a backup target"""
+
+    def __init__(self, target, policy=None, state_path=None):
+        self.target = target
+        self.policy = policy
+        self.state_path = state_path or get_engine_state_path()
+        self.target_key = getattr(target, "name", type(target).__name__)
+
+    # =============================================================================
+    # LOCAL STATE (last snapshot per target)
+    # =============================================================================
+
+    def _load_state(self):
+        try:
+            with open(self.state_path, 'r') as f:
+                return json.load(f).get(self.target_key, {})
+        except (OSError, ValueError):
+            return {}
+
+    def _save_state(self, target_state):
+        with _state_lock:
+            self._write_state(target_state)
+
+    def _write_state(self, target_state):
+        try:
+            try:
+                with open(self.state_path, 'r') as f:
+                    state = json.load(f)
+            except (OSError, ValueError):
+                state = {}
+
+            state[self.target_key] = target_state
+            temp_path = self.state_path + ".tmp"
+            with open(temp_path, 'w') as f:
+                json.dump(state, f, indent=2)
+            os.replace(temp_path, self.state_path)
+        except Exception as e:
+            print(f"Error saving backup engine state: {e}")
+
+    # =============================================================================
+    # SNAPSHOTS
+    # =============================================================================
+
+    def list_snapshots(self):
+        """Manifests and legacy full backups on the target, newest first"""
+        snapshots = []
+        for obj in self.target.list_objects(SNAPSHOT_PREFIX):
+            timestamp = parse_snapshot_time(obj["name"])
+            if timestamp:
+                snapshots.append((timestamp, obj))
+        snapshots.sort(key=lambda s: s[0], reverse=True)
+        return snapshots
+
+    def read_manifest(self, obj):
+        return json.loads(self.target.get_object(obj["id"]).decode('utf-8'))
+
+    def _latest_vault_hash(self, snapshots):
+        manifests = [obj for _, obj in snapshots if obj["name"].endswith(MANIFEST_SUFFIX)]
+        if not manifests:
+            return None
+
+        newest = manifests[0]
+        state = self._load_state()
+        if state.get("manifest_id") == newest["id"]:
+            return state.get("sha256")
+
+        sha256 = self.read_manifest(newest).get("sha256")
+        self._save_state({"manifest_id": newest["id"], "sha256": sha256})
+        return sha256
+
+    def backup(self, vault_path):
+        """Snapshot the vault, uploading only chunks the target lacks"""
+        if not os.path.exists(vault_path):
+            return False, "Vault file not found"
+
+        with _target_lock(self.target_key):
+            return self._backup(vault_path)
+
+    def _backup(self, vault_path):
+        try:
+            snapshots = self.list_snapshots()
+            vault_hash = hash_file(vault_path)
+            if vault_hash == self._latest_vault_hash(snapshots):
+                return True, "Vault unchanged since the last backup"
+
+            # Chunk one read of the file in case the vault is saved meanwhile
+            with open(vault_path, 'rb') as f:
+                data = f.read()
+
+            stored = {obj["name"] for obj in self.target.list_objects(CHUNK_PREFIX)}
+            chunk_hashes = []
+            uploaded = 0
+
+            for chunk in split_chunks(data):
+                chunk_hash = hashlib.sha256(chunk).hexdigest()
+                chunk_hashes.append(chunk_hash)
+
+                name = CHUNK_PREFIX + chunk_hash
+                if name not in stored:
+                    self.target.put_object(name, chunk)
+                    stored.add(name)
+                    uploaded += 1
+
+            vault_hash = hashlib.sha256(data).hexdigest()
+            manifest = {
+                "version": 2,
+                "created": datetime.now().isoformat(),
+                "size": len(data),
+                "sha256": vault_hash,
+                "chunks": chunk_hashes
+            }
+            # Chunks are written first so a manifest never references missing data
+            name = f"{SNAPSHOT_PREFIX}{datetime.now().strftime(TIMESTAMP_FORMAT)}{MANIFEST_SUFFIX}"
+            manifest_id = self.target.put_object(name, json.dumps(manifest).encode('utf-8'))
+            self._save_state({"manifest_id": manifest_id, "sha256": vault_hash})
+
+            try:
+                self.prune()
+            except Exception as e:
+                print(f"Error pruning old backups: {e}")
+
+            return True, f"Backup {name} saved ({uploaded} of {len(chunk_hashes)} chunks uploaded)"
+
+        except Exception as e:
+            return False, f"Backup error: {str(e)}"
+
+    def download_snapshot(self, obj, dest_path):
+        """Stream a snapshot into dest_path, verifying every chunk and the whole file"""
+        temp_path = dest_path + ".part"
+
+        try:
+            # Held so a prune can't drop chunks partway through the download
+            with _target_lock(self.target_key), open(temp_path, 'wb') as f:
+                if obj["name"].endswith(MANIFEST_SUFFIX):
+                    self._write_chunks(self.read_manifest(obj), f)
+                else:
+                    # Legacy full backup, nothing recorded to verify against
+                    self.target.download_object(obj["id"], f)
+            os.replace(temp_path, dest_path)
+        finally:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+
+    def read_snapshot_head(self, obj, enough):
+        """Leading bytes of a snapshot, fetching verified chunks until enough(data) is true"""
+        with _target_lock(self.target_key):
+            if not obj["name"].endswith(MANIFEST_SUFFIX):
+                return self.target.get_object(obj["id"])
+
+            data = b""
+            for chunk in self._verified_chunks(self.read_manifest(obj)):
+                data += chunk
+                if enough(data):
+                    break
+            return data
+
+    def _verified_chunks(self, manifest):
+        """A manifest's chunks in order, each checked against its hash"""
+        chunk_ids = {o["name"]: o["id"] for o in self.target.list_objects(CHUNK_PREFIX)}
+
+        for chunk_hash in manifest["chunks"]:
+            chunk_id = chunk_ids.get(CHUNK_PREFIX + chunk_hash)
+            if not chunk_id:
+                raise BackupIntegrityError(f"Backup is missing chunk {chunk_hash[:12]}")
+
+            chunk = self.target.get_object(chunk_id)
+            if hashlib.sha256(chunk).hexdigest() != chunk_hash:
+                raise BackupIntegrityError(f"Chunk {chunk_hash[:12]} is corrupted")
+            yield chunk
+
+    def _write_chunks(self, manifest, f):
+        file_hash = hashlib.sha256()
+        size = 0
+
+        for chunk in self._verified_chunks(manifest):
+            f.write(chunk)
+            file_hash.update(chunk)
+            size += len(chunk)
+
+        if size != manifest["size"] or file_hash.hexdigest() != manifest["sha256"]:
+            raise BackupIntegrityError("Restored vault does not match the backup manifest")
+
+    # =============================================================================
+    # RETENTION
+    # =============================================================================
+
+    def prune(self):
+        """Apply the retention policy, then drop chunks no snapshot references"""
+        with _target_lock(self.target_key):
+            return self._prune()
+
+    def _prune(self):
+        snapshots = self.list_snapshots()
+        retained = select_retained(snapshots, self.policy or get_retention_policy())
+        retained_ids = {obj["id"] for obj in retained}
+
+        expired = [obj for _, obj in snapshots if obj["id"] not in retained_ids]
+        if not expired:
+            return 0
+
+        for obj in expired:
+            self.target.delete_object(obj["id"])
+
+        referenced = set()
+        manifest_times = []
+        for obj in retained:
+            if obj["name"].endswith(MANIFEST_SUFFIX):
+                referenced.update(self.read_manifest(obj).get("chunks", []))
+                manifest_times.append(parse_created_time(obj))
+
+        # Chunks newer than every manifest may belong to a backup another process is still writing
+        newest_manifest = max((t for t in manifest_times if t), default=None)
+
+        for obj in self.target.list_objects(CHUNK_PREFIX):
+            if obj["name"][len(CHUNK_PREFIX):] in referenced:
+                continue
+            created = parse_created_time(obj)
+            if newest_manifest and created and created >= newest_manifest:
+                continue
+            self.target.delete_object(obj["id"])
+
+        return len(expired)
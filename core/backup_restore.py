@@ -0,0 +1,154 @@
+"""
+Restoring the vault from backup snapshots.
+
+Snapshots are downloaded next to the live vault, verified against their
+manifest and decrypted with the current key before anything is swapped in.
+Backups taken before the vault moved to a random vault key open with the key
+derived from the password used at the time, and are re-encrypted under the
+current key when restored. The previous vault is kept as vault.enc.bak.
+"""
+
+import base64
+import json
+import os
+import shutil
+from concurrent.futures import ThreadPoolExecutor
+
+
+class RestoreError(Exception):
+    """A snapshot could not be verified or restored"""
+
+
+class OlderKeyRequired(RestoreError):
+    """The backup predates the current vault key, the password used back then opens it"""
+
+
+def backup_password_key(password, auth_path=None):
+    """Key a backup from before the random vault key was encrypted with"""
+    from security.encryption import derive_key
+
+    if auth_path is None:
+        from config import get_auth_path
+        auth_path = get_auth_path()
+
+    with open(auth_path, 'r') as f:
+        auth_data = json.load(f)
+    # The vault salt never changes, only the password it is combined with
+    return derive_key(password, base64.b64decode(auth_data["vault_salt"]))
+
+
+def list_all_snapshots(targets=None):
+    """Snapshots from every target, listed concurrently, newest first"""
+    from core.backup_engine import BackupEngine
+    from core.backup_targets import get_backup_targets
+
+    if targets is None:
+        targets = get_backup_targets()
+    if not targets:
+        return []
+
+    def list_target(target):
+        try:
+            return [(target, timestamp, obj) for timestamp, obj in BackupEngine(target).list_snapshots()]
+        except Exception as e:
+            print(f"Error listing backups on {target.display_name}: {e}")
+            return []
+
+    snapshots = []
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        for target_snapshots in executor.map(list_target, targets):
+            snapshots.extend(target_snapshots)
+
+    snapshots.sort(key=lambda s: s[1], reverse=True)
+    return snapshots
+
+
+def _open_with_keys(token, key, older_key, read):
+    """read(token, key) with the current key, then the older one, returns (result, key that worked)"""
+    for candidate in (key, older_key):
+        if candidate is None:
+            continue
+        try:
+            return read(token, candidate), candidate
+        except Exception:
+            continue
+
+    if older_key is None:
+        raise OlderKeyRequired("Backup cannot be opened with your current vault key")
+    raise OlderKeyRequired("Backup cannot be opened with that password either")
+
+
+def decrypt_vault_file(path, key, older_key=None):
+    """Decrypt a downloaded vault, returns (data, key that opened it)
+
+    Raises OlderKeyRequired when neither key fits.
+    """
+    from core.vault_format import decode_vault, materialize
+
+    with open(path, 'rb') as f:
+        token = f.read()
+
+    # Decrypt every folder so a damaged one fails here, not after the swap
+    data, opened_with = _open_with_keys(token, key, older_key, lambda t, k: materialize(decode_vault(t, k)))
+    if not isinstance(data, dict):
+        raise RestoreError("Backup does not contain a vault")
+    return data, opened_with
+
+
+def summarize_vault(data):
+    """Folder names with their entry counts"""
+    from core.vault_format import entry_count
+    return {folder: entry_count(folder_data) for folder, folder_data in data.items()}
+
+
+def _holds_folder_index(head):
+    from core.vault_format import index_size
+
+    size = index_size(head)
+    return size is not None and len(head) >= size
+
+
+def preview_snapshot(target, obj, key, older_key=None):
+    """Folder names and entry counts of a snapshot, read from its header alone
+
+    Only the chunks holding the folder index are fetched. Full verification
+    is left to restore_snapshot.
+    """
+    from core.backup_engine import BackupEngine
+    from core.vault_format import decode_vault
+
+    head = BackupEngine(target).read_snapshot_head(obj, _holds_folder_index)
+    data, _ = _open_with_keys(head, key, older_key, decode_vault)
+    if not isinstance(data, dict):
+        raise RestoreError("Backup does not contain a vault")
+    return summarize_vault(data)
+
+
+def restore_snapshot(target, obj, key, vault_path=None, older_key=None):
+    """Verify a snapshot and swap it in for the live vault, returns the restored data"""
+    from core.backup_engine import BackupEngine
+    from core.vault_format import encode_vault
+
+    if vault_path is None:
+        from config import get_vault_path
+        vault_path = get_vault_path()
+
+    # Same directory as the vault so the final swap is an atomic rename
+    restore_path = vault_path + ".restore"
+    try:
+        BackupEngine(target).download_snapshot(obj, restore_path)
+        data, opened_with = decrypt_vault_file(restore_path, key, older_key)
+        if opened_with != key:
+            # The live vault must open with the current key
+            with open(restore_path, 'wb') as f:
+                f.write(encode_vault(data, key))
+                f.flush()
+                os.fsync(f.fileno())
+
+        if os.path.exists(vault_path):
+            shutil.copy2(vault_path, vault_path + ".bak")
+        os.replace(restore_path, vault_path)
+        return data
+    finally:
+        if os.path.exists(restore_path):
+            os.remove(restore_path)
@@ -0,0 +1,294 @@
+"""
+Automatic backups driven by vault saves.
+
+The scheduler counts saves reported by the VaultModel and queues a backup job
+after enough saves or once the vault has been dirty for long enough. Jobs run
+when the user has been idle for a while and no more often than the rate limit
+allows. The queue and dirty state live on disk so pending work survives a
+restart.
+"""
+
+import ctypes
+import json
+import os
+import sys
+import threading
+import time
+import uuid
+
+from config import register_setting
+
+POLL_SECONDS = 30
+MAX_ATTEMPTS = 5
+RETRY_BASE_DELAY = 60
+RETRY_MAX_DELAY = 3600
+NO_TARGETS_MESSAGE = "Vault changes are waiting to be backed up. Connect a backup destination in the Security Dashboard."
+
+register_setting("auto_backup_enabled", bool, True)
+register_setting("auto_backup_save_threshold", int, 10)
+register_setting("auto_backup_dirty_minutes", int, 30)
+register_setting("auto_backup_idle_seconds", int, 60)
+register_setting("auto_backup_min_interval_minutes", int, 15)
+
+
+def get_queue_path():
+    from core.google_drive_backup import get_backup_data_directory
+    return os.path.join(get_backup_data_directory(), "backup_queue.json")
+
+
+def input_idle_seconds():
+    """Seconds since the last keyboard or mouse input anywhere on the desktop, None if unknown"""
+    if sys.platform != "win32":
+        return None
+
+    class LASTINPUTINFO(ctypes.Structure):
+        _fields_ = [("cbSize", ctypes.c_uint), ("dwTime", ctypes.c_uint)]
+
+    try:
+        user32 = ctypes.WinDLL("user32")
+        kernel32 = ctypes.WinDLL("kernel32")
+        kernel32.GetTickCount.restype = ctypes.c_uint
+
+        info = LASTINPUTINFO(cbSize=ctypes.sizeof(LASTINPUTINFO))
+        if not user32.GetLastInputInfo(ctypes.byref(info)):
+            return None
+        # Both tick counts wrap after 49.7 days
+        return ((kernel32.GetTickCount() - info.dwTime) & 0xFFFFFFFF) / 1000
+    except Exception as e:
+        print(f"Error reading input idle time: {e}")
+        return None
+
+
+class BackupScheduler:
+    """Queues and runs vault backups in the background"""
+
+    def __init__(self, targets_provider, vault_path_provider=None, queue_path=None, on_result=None,
+                 save_threshold=None, dirty_minutes=None, idle_seconds=None, min_interval_minutes=None,
+                 idle_provider=input_idle_seconds):
+        from config import get_setting
+
+        self.targets_provider = targets_provider
+        self.vault_path_provider = vault_path_provider
+        self.idle_provider = idle_provider
+        self.queue_path = queue_path or get_queue_path()
+        self.on_result = on_result
+
+        self.save_threshold = save_threshold or get_setting("auto_backup_save_threshold")
+        self.dirty_seconds = (dirty_minutes or get_setting("auto_backup_dirty_minutes")) * 60
+        self.idle_seconds = idle_seconds if idle_seconds is not None else get_setting("auto_backup_idle_seconds")
+        self.min_interval = (min_interval_minutes if min_interval_minutes is not None
+                             else get_setting("auto_backup_min_interval_minutes")) * 60
+
+        self._lock = threading.RLock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._thread = None
+        self._last_activity = 0
+        self._state = self._load_state()
+
+    # =============================================================================
+    # PERSISTED QUEUE
+    # =============================================================================
+
+    def _load_state(self):
+        state = {"jobs": [], "saves": 0, "dirty_since": None, "last_run": 0}
+        try:
+            with open(self.queue_path, 'r') as f:
+                state.update(json.load(f))
+        except (OSError, ValueError):
+            pass
+        return state
+
+    def _save_state(self):
+        try:
+            temp_path = self.queue_path + ".tmp"
+            with open(temp_path, 'w') as f:
+                json.dump(self._state, f, indent=2)
+            os.replace(temp_path, self.queue_path)
+        except Exception as e:
+            print(f"Error saving backup queue: {e}")
+
+    def pending_jobs(self):
+        with self._lock:
+            return list(self._state["jobs"])
+
+    def enqueue(self, reason):
+        """Queue a backup job, coalescing with one that is already waiting"""
+        with self._lock:
+            if not self._state["jobs"]:
+                self._state["jobs"].append({
+                    "id": uuid.uuid4().hex,
+                    "reason": reason,
+                    "created": time.time(),
+                    "attempts": 0,
+                    "next_attempt": 0
+                })
+                self._save_state()
+        self._wake.set()
+
+    # =============================================================================
+    # TRIGGERS
+    # =============================================================================
+
+    def on_vault_changed(self, event, payload):
+        """VaultModel subscriber, any change counts as user activity"""
+        from core.vault_model import VAULT_SAVED
+
+        self._last_activity = time.time()
+        if event != VAULT_SAVED:
+            return
+
+        with self._lock:
+            self._state["saves"] += 1
+            if not self._state["dirty_since"]:
+                self._state["dirty_since"] = time.time()
+
+            if self._state["saves"] >= self.save_threshold:
+                self.enqueue("saves")
+            else:
+                self._save_state()
+
+    def _check_dirty_timeout(self, now):
+        with self._lock:
+            dirty_since = self._state["dirty_since"]
+            if dirty_since and now - dirty_since >= self.dirty_seconds:
+                self.enqueue("dirty")
+
+    # =============================================================================
+    # WORKER
+    # =============================================================================
+
+    def _due_job(self, now):
+        with self._lock:
+            for job in self._state["jobs"]:
+                if job["next_attempt"] <= now:
+                    return job
+        return None
+
+    def _user_idle_seconds(self, now):
+        """Time since the last input, or since the last vault change where input can't be read"""
+        vault_idle = now - self._last_activity
+        input_idle = self.idle_provider() if self.idle_provider else None
+        if input_idle is None:
+            return vault_idle
+        return min(input_idle, vault_idle)
+
+    def _run_targets(self, targets):
+        from core.backup_targets import backup_to_targets, summarize_results
+
+        if self.vault_path_provider:
+            vault_path = self.vault_path_provider()
+        else:
+            from config import get_vault_path
+            vault_path = get_vault_path()
+
+        return summarize_results(backup_to_targets(vault_path, targets))
+
+    def _hold_for_targets(self, job):
+        """Keep the job and dirty state until a target is connected, telling the user once"""
+        with self._lock:
+            if job.get("waiting_for_targets"):
+                return
+            job["waiting_for_targets"] = True
+            self._save_state()
+
+        print(f"Automatic backup waiting: {NO_TARGETS_MESSAGE}")
+        if self.on_result:
+            try:
+                self.on_result(False, NO_TARGETS_MESSAGE)
+            except Exception as e:
+                print(f"Backup result callback failed: {e}")
+
+    def _finish_job(self, job, success, now):
+        with self._lock:
+            if success:
+                self._state["jobs"] = [j for j in self._state["jobs"] if j["id"] != job["id"]]
+                self._state["last_run"] = now
+                self._save_state()
+                return True
+
+            job["attempts"] += 1
+            if job["attempts"] >= MAX_ATTEMPTS:
+                self._state["jobs"] = [j for j in self._state["jobs"] if j["id"] != job["id"]]
+            else:
+                delay = min(RETRY_MAX_DELAY, RETRY_BASE_DELAY * (2 ** (job["attempts"] - 1)))
+                job["next_attempt"] = now + delay
+            self._save_state()
+            return job["attempts"] >= MAX_ATTEMPTS
+
+    def run_pending(self):
+        """Run the next due job if the user is idle and the rate limit allows"""
+        from config import get_setting
+
+        now = time.time()
+        if not get_setting("auto_backup_enabled"):
+            return False
+
+        self._check_dirty_timeout(now)
+        job = self._due_job(now)
+        if not job:
+            return False
+        if self._user_idle_seconds(now) < self.idle_seconds:
+            return False
+        if now - self._state["last_run"] < self.min_interval:
+            return False
+
+        try:
+            targets = self.targets_provider()
+        except Exception as e:
+            print(f"Error finding backup targets: {e}")
+            return False
+        if not targets:
+            self._hold_for_targets(job)
+            return False
+
+        with self._lock:
+            # Saves made while the backup runs mark the vault dirty again
+            saves, dirty_since = self._state["saves"], self._state["dirty_since"]
+            self._state["saves"], self._state["dirty_since"] = 0, None
+
+        try:
+            success, message = self._run_targets(targets)
+        except Exception as e:
+            success, message = False, str(e)
+
+        if not success:
+            with self._lock:
+                self._state["saves"] += saves
+                self._state["dirty_since"] = self._state["dirty_since"] or dirty_since
+
+        final = self._finish_job(job, success, time.time())
+        if success or final:
+            print(f"Automatic backup {'finished' if success else 'gave up'}: {message}")
+            if self.on_result:
+                try:
+                    self.on_result(success, message)
+                except Exception as e:
+                    print(f"Backup result callback failed: {e}")
+        else:
+            print(f"Automatic backup failed, will retry: {message}")
+        return True
+
+    def _run(self):
+        while not self._stopping.is_set():
+            try:
+                self.run_pending()
+            except Exception as e:
+                print(f"Backup scheduler error: {e}")
+            self._wake.wait(POLL_SECONDS)
+            self._wake.clear()
+
+    # =============================================================================
+    # LIFECYCLE
+    # =============================================================================
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def stop(self):
+        self._stopping.set()
+        self._wake.set()
@@ -0,0 +1,193 @@
+"""
+Backup destinations.
+
+Every target stores opaque named objects (snapshot manifests and chunks written
+by the backup engine). Google Drive and a local directory (which also covers a
+mounted NAS share) implement the same interface, and a backup can be fanned out
+to all configured targets at once.
+"""
+
+import os
+import shutil
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+
+from config import register_setting
+
+register_setting("backup_local_directory", str, None)
+
+# Temp files older than this are leftovers from an interrupted write
+STALE_TEMP_SECONDS = 60 * 60
+
+
+class BackupTarget(ABC):
+    """Interface for a place backups can be written to"""
+    name = "target"
+    display_name = "Backup target"
+
+    def is_available(self) -> bool:
+        return True
+
+    @abstractmethod
+    def list_objects(self, prefix: str = ""):
+        """Objects as dicts with id, name, size and createdTime, newest first"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def put_object(self, name: str, data: bytes) -> str:
+        """Store an object and return its id"""
+        raise NotImplementedError
+
+    @abstractmethod
+    def get_object(self, object_id: str) -> bytes:
+        raise NotImplementedError
+
+    def download_object(self, object_id: str, dest):
+        """Write an object into an open binary file, streaming where the target can"""
+        dest.write(self.get_object(object_id))
+
+    @abstractmethod
+    def delete_object(self, object_id: str):
+        raise NotImplementedError
+
+
+class LocalDirectoryTarget(BackupTarget):
+    """Backups in a local folder or mounted network share"""
+    display_name = "Local folder"
+
+    def __init__(self, directory: str):
+        self.directory = os.path.abspath(directory)
+        self.name = f"local:{self.directory}"
+
+    def is_available(self) -> bool:
+        return os.path.isdir(self.directory)
+
+    def _path(self, object_id: str) -> str:
+        # Object ids are bare file names, never paths
+        if os.path.basename(object_id) != object_id or object_id.startswith("."):
+            raise ValueError(f"Invalid backup object name: {object_id}")
+        return os.path.join(self.directory, object_id)
+
+    def list_objects(self, prefix: str = ""):
+        objects = []
+        now = datetime.now().timestamp()
+
+        with os.scandir(self.directory) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+
+                stat = entry.stat()
+                if entry.name.startswith(".") and entry.name.endswith(".tmp"):
+                    if now - stat.st_mtime > STALE_TEMP_SECONDS:
+                        try:
+                            os.remove(entry.path)
+                        except OSError:
+                            pass
+                    continue
+
+                if entry.name.startswith(prefix):
+                    objects.append({
+                        "id": entry.name,
+                        "name": entry.name,
+                        "size": stat.st_size,
+                        "createdTime": datetime.fromtimestamp(stat.st_mtime).astimezone().isoformat()
+                    })
+
+        objects.sort(key=lambda o: o["createdTime"], reverse=True)
+        return objects
+
+    def put_object(self, name: str, data: bytes) -> str:
+        """Write atomically so a crash never leaves a truncated object behind"""
+        path = self._path(name)
+        temp_path = os.path.join(self.directory, f".{name}.{os.getpid()}.tmp")
+
+        try:
+            with open(temp_path, 'wb') as f:
+                f.write(data)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(temp_path, path)
+        except Exception:
+            if os.path.exists(temp_path):
+                os.remove(temp_path)
+            raise
+
+        return name
+
+    def get_object(self, object_id: str) -> bytes:
+        with open(self._path(object_id), 'rb') as f:
+            return f.read()
+
+    def download_object(self, object_id: str, dest):
+        with open(self._path(object_id), 'rb') as f:
+            shutil.copyfileobj(f, dest)
+
+    def delete_object(self, object_id: str):
+        try:
+            os.remove(self._path(object_id))
+        except FileNotFoundError:
+            pass
+
+
+# =============================================================================
+# CONFIGURED TARGETS
+# =============================================================================
+
+def get_local_backup_directory():
+    from config import get_setting
+    return get_setting("backup_local_directory")
+
+
+def set_local_backup_directory(directory):
+    from config import set_setting
+    return set_setting("backup_local_directory", directory)
+
+
+def get_backup_targets(available_only=True):
+    """All configured backup targets"""
+    targets = []
+
+    try:
+        from core.google_drive_backup import get_google_drive_backup
+        targets.append(get_google_drive_backup())
+    except Exception as e:
+        print(f"Error loading Google Drive target: {e}")
+
+    local_directory = get_local_backup_directory()
+    if local_directory:
+        targets.append(LocalDirectoryTarget(local_directory))
+
+    if available_only:
+        targets = [target for target in targets if target.is_available()]
+    return targets
+
+
+def backup_to_targets(vault_path, targets=None):
+    """Back up to every target concurrently, returns [(target, success, message)]"""
+    from core.backup_engine import BackupEngine
+
+    if targets is None:
+        targets = get_backup_targets()
+    if not targets:
+        return []
+
+    def run(target):
+        try:
+            return (target,) + tuple(BackupEngine(target).backup(vault_path))
+        except Exception as e:
+            return target, False, str(e)
+
+    with ThreadPoolExecutor(max_workers=len(targets)) as executor:
+        return list(executor.map(run, targets))
+
+
+def summarize_results(results):
+    """Collapse fan-out results into (success, message)"""
+    failures = [f"{target.display_name}: {message}" for target, success, message in results if not success]
+    if failures:
+        return False, "; ".join(failures)
+    if len(results) == 1:
+        return True, results[0][2]
+    return True, f"Backed up to {', '.join(target.display_name for target, _, _ in results)}"
@@ -0,0 +1,226 @@
+"""
+Compact in-memory storage for vault entries.
+
+A plain entry is a dict that repeats its folder's field names and carries a
+second dict for "_meta". Here a folder shares one FieldLayout (interned field
+names mapped to positions) and each entry is a slotted record holding a single
+tuple of values, with the metadata fields stored inline. Records behave like
+dicts for reading and writing, so callers that do entry.get("username") or
+entry["_meta"]["id"] keep working. Use to_plain() before serializing.
+"""
+
+import sys
+from collections.abc import MutableMapping
+
+META_KEY = "_meta"
+
+# Absent field, distinct from a stored None
+_MISSING = object()
+
+
+class FieldLayout:
+    """Field names shared by every record in a folder"""
+    __slots__ = ("fields", "index")
+
+    def __init__(self, fields=()):
+        self.fields = []
+        self.index = {}
+        for field in fields:
+            self.add(field)
+
+    def add(self, field):
+        """Position of a field, appending it if new"""
+        position = self.index.get(field)
+        if position is None:
+            if isinstance(field, str):
+                field = sys.intern(field)
+            position = len(self.fields)
+            self.fields.append(field)
+            self.index[field] = position
+        return position
+
+
+def _meta_field(name):
+    # Tuple keys never collide with user field names
+    return (META_KEY, name)
+
+
+class CompactEntry(MutableMapping):
+    """Dict-like entry backed by a shared layout and one value tuple"""
+    __slots__ = ("_layout", "_values")
+
+    def __init__(self, layout, values=()):
+        self._layout = layout
+        self._values = tuple(values)
+
+    @classmethod
+    def from_mapping(cls, layout, entry):
+        values = []
+        for key, value in entry.items():
+            if key == META_KEY:
+                for meta_key, meta_value in value.items():
+                    _place(values, layout.add(_meta_field(meta_key)), meta_value)
+            else:
+                _place(values, layout.add(key), value)
+        return cls(layout, values)
+
+    # =============================================================================
+    # RAW FIELD ACCESS
+    # =============================================================================
+
+    def _get(self, field):
+        position = self._layout.index.get(field)
+        if position is None or position >= len(self._values):
+            return _MISSING
+        return self._values[position]
+
+    def _set(self, field, value):
+        values = list(self._values)
+        _place(values, self._layout.add(field), value)
+        self._values = tuple(values)
+
+    def _present(self, meta):
+        """Field names with a value, either user fields or metadata fields"""
+        fields = self._layout.fields
+        for position, value in enumerate(self._values):
+            if value is _MISSING:
+                continue
+            field = fields[position]
+            if isinstance(field, tuple) == meta:
+                yield field[1] if meta else field
+
+    # =============================================================================
+    # MAPPING API
+    # =============================================================================
+
+    def __getitem__(self, key):
+        if key == META_KEY:
+            # Always present so setdefault(META_KEY, {}) writes through
+            return EntryMeta(self)
+        value = self._get(key)
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        if key == META_KEY:
+            items = list(value.items())
+            for meta_key in list(self._present(True)):
+                self._set(_meta_field(meta_key), _MISSING)
+            for meta_key, meta_value in items:
+                self._set(_meta_field(meta_key), meta_value)
+        else:
+            self._set(key, value)
+
+    def __delitem__(self, key):
+        if key == META_KEY:
+            self[META_KEY] = {}
+        elif self._get(key) is _MISSING:
+            raise KeyError(key)
+        else:
+            self._set(key, _MISSING)
+
+    def __iter__(self):
+        yield from self._present(False)
+        if next(self._present(True), None) is not None:
+            yield META_KEY
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return repr(self.to_dict())
+
+    def copy(self):
+        return self.to_dict()
+
+    def to_dict(self):
+        entry = {field: self[field] for field in self._present(False)}
+        meta = self[META_KEY]
+        if meta:
+            entry[META_KEY] = dict(meta)
+        return entry
+
+
+class EntryMeta(MutableMapping):
+    """View of a record's inline "_meta" fields"""
+    __slots__ = ("_entry",)
+
+    def __init__(self, entry):
+        self._entry = entry
+
+    def __getitem__(self, key):
+        value = self._entry._get(_meta_field(key))
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def __setitem__(self, key, value):
+        self._entry._set(_meta_field(key), value)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._entry._set(_meta_field(key), _MISSING)
+
+    def __iter__(self):
+        return self._entry._present(True)
+
+    def __len__(self):
+        return sum(1 for _ in self)
+
+    def __repr__(self):
+        return repr(dict(self))
+
+
+def _place(values, position, value):
+    if position >= len(values):
+        values.extend([_MISSING] * (position + 1 - len(values)))
+    values[position] = value
+
+
+class CompactEntries(list):
+    """Entry list of a folder, storing everything added to it as compact records"""
+    __slots__ = ("layout",)
+
+    def __init__(self, entries=(), schema=()):
+        self.layout = FieldLayout(schema)
+        super().__init__(self._compact(entry) for entry in entries)
+
+    def _compact(self, entry):
+        if isinstance(entry, CompactEntry) and entry._layout is self.layout:
+            return entry
+        return CompactEntry.from_mapping(self.layout, entry)
+
+    def append(self, entry):
+        super().append(self._compact(entry))
+
+    def insert(self, index, entry):
+        super().insert(index, self._compact(entry))
+
+    def extend(self, entries):
+        super().extend(self._compact(entry) for entry in entries)
+
+    def __iadd__(self, entries):
+        self.extend(entries)
+        return self
+
+    def __setitem__(self, index, value):
+        if isinstance(index, slice):
+            value = [self._compact(entry) for entry in value]
+        else:
+            value = self._compact(value)
+        super().__setitem__(index, value)
+
+
+def compact_folder(folder):
+    """Switch a plain folder dict over to compact entries in place"""
+    entries = folder.get("entries")
+    if entries is not None and not isinstance(entries, CompactEntries):
+        folder["entries"] = CompactEntries(entries, folder.get("schema", []))
+    return folder
+
+
+def to_plain(entries):
+    """Entries as plain dicts, ready for JSON"""
+    return [entry.to_dict() if isinstance(entry, CompactEntry) else entry for entry in entries]
@@ -5,23 +5,98 @@ Uses OAuth 2.0 for secure authentication
 """
 
 import os
+import sys
 import json
 import base64
 from datetime import datetime, timedelta
-from typing import Optional, Tuple, Dict, Any
+from typing import Optional, Tuple, Dict, Any, List
 
+from core.backup_targets import BackupTarget
 
-class GoogleDriveBackup:
+DRIVE_API_BASE = "https://www.googleapis.com"
+BACKUP_FOLDER_NAME = "Vault Backups"
+BACKUP_FILE_PREFIX = "vault_backup_"
+
+# Resumable upload chunks must be multiples of 256 KiB
+UPLOAD_CHUNK_SIZE = 8 * 256 * 1024
+UPLOAD_CHUNK_TIMEOUT = 60
+UPLOAD_RETRIES = 6
+UPLOAD_BASE_DELAY = 2.0
+UPLOAD_MAX_DELAY = 60.0
+# Fresh sessions to try when Drive keeps discarding the one in use
+UPLOAD_SESSION_RESTARTS = 3
+RETRYABLE_STATUS_CODES = (429, 500, 502, 503, 504)
+DOWNLOAD_BLOCK_SIZE = 1024 * 1024
+
+
+class UploadRetryableError(Exception):
+    """Transient Drive error, the upload can be resumed"""
+
+
+class UploadFolderMissingError(Exception):
+    """The backup folder the upload targets no longer exists"""
+
+
+def get_backup_data_directory():
+    """Get writable directory for Drive tokens and backup state"""
+    if getattr(sys, 'frozen', False):
+        app_data = os.path.join(os.path.expanduser("~"), "AppData", "Local", "TheVault")
+        os.makedirs(app_data, exist_ok=True)
+        return app_data
+    else:
+        from gui.update_manager import get_app_directory
+        return get_app_directory()
+
+
+class GoogleDriveBackup(BackupTarget):
     """Manages Google Drive backups with OAuth authentication"""
+    name = "google_drive"
+    display_name = "Google Drive"
 
-    def __init__(self):
+    def __init__(self, api_base: str = DRIVE_API_BASE):
+        self.api_base = api_base
         self.access_token = None
         self.refresh_token = None
         self.token_expires = None
+        self._state = None
 
         # Load user tokens if they exist
         self._load_credentials()
 
+    def _get_app_directory(self) -> str:
+        return get_backup_data_directory()
+
+    def is_available(self) -> bool:
+        return self.is_authenticated()
+
+    # =============================================================================
+    # PERSISTED STATE (folder ID cache)
+    # =============================================================================
+
+    def _state_path(self) -> str:
+        return os.path.join(self._get_app_directory(), "gdrive_state.json")
+
+    def _load_state(self) -> Dict[str, Any]:
+        if self._state is None:
+            try:
+                with open(self._state_path(), 'r') as f:
+                    self._state = json.load(f)
+            except (OSError, ValueError):
+                self._state = {}
+        return self._state
+
+    def _save_state(self):
+        try:
+            with open(self._state_path(), 'w') as f:
+                json.dump(self._load_state(), f, indent=2)
+        except Exception as e:
+            print(f"Error saving Google Drive state: {e}")
+
+    def _invalidate_folder_cache(self):
+        state = self._load_state()
+        if state.pop("folder_id", None):
+            self._save_state()
+
     @property
     def client_id(self):
         """Get client ID (app-level credential)"""
@@ -38,8 +113,7 @@ class GoogleDriveBackup:
         """Load stored OAuth credentials"""
         try:
             # Load tokens from user config (user-specific)
-            from core.vault_manager import get_app_directory
-            config_path = os.path.join(get_app_directory(), "gdrive_tokens.json")
+            config_path = os.path.join(self._get_app_directory(), "gdrive_tokens.json")
 
             if os.path.exists(config_path):
                 with open(config_path, 'r') as f:
@@ -79,8 +153,7 @@ class GoogleDriveBackup:
     def _save_tokens(self):
         """Save OAuth tokens to file"""
         try:
-            from core.vault_manager import get_app_directory
-            config_path = os.path.join(get_app_directory(), "gdrive_tokens.json")
+            config_path = os.path.join(self._get_app_directory(), "gdrive_tokens.json")
 
             tokens = {
                 "access_token": self.access_token,
@@ -105,6 +178,12 @@ class GoogleDriveBackup:
 
         return True
 
+    def _auth_headers(self) -> Dict[str, str]:
+        """Authorization header for an API call, refreshing an expired access token first"""
+        if not self.is_authenticated():
+            raise Exception("Google Drive is not connected")
+        return {"Authorization": f"Bearer {self.access_token}"}
+
     def get_auth_url(self, port: int = 8080) -> Optional[str]:
         """Get OAuth authorization URL"""
         if not self.client_id:
@@ -277,172 +356,304 @@ class GoogleDriveBackup:
 
         return False
 
-    def upload_vault_backup(self, vault_path: str) -> Tuple[bool, str]:
-        """Upload vault file to Google Drive"""
-        if not self.is_authenticated():
-            return False, "Not authenticated with Google Drive"
-
-        if not os.path.exists(vault_path):
-            return False, "Vault file not found"
-
-        try:
-            import requests
+    # =============================================================================
+    # RESUMABLE UPLOADS
+    # =============================================================================
 
-            # Read vault file
-            with open(vault_path, 'rb') as f:
-                vault_data = f.read()
+    def _upload_stream(self, f, size: int, filename: str, parent_id: str) -> str:
+        """Resumable upload of a seekable stream with retry and backoff"""
+        import time
+        import requests
 
-            # Prepare metadata
-            timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-            filename = f"vault_backup_{timestamp}.enc"
+        failures = 0
+        restarts = 0
+        session_uri = None
 
-            metadata = {
-                "name": filename,
-                "parents": [self._get_or_create_vault_folder()]
-            }
+        while True:
+            try:
+                if session_uri is None:
+                    session_uri = self._start_upload_session(filename, parent_id, size)
+
+                file_id = self._send_chunks(session_uri, f, size)
+                if file_id is None:
+                    # Session expired on Drive's side, start over
+                    session_uri = None
+                    restarts += 1
+                    if restarts > UPLOAD_SESSION_RESTARTS:
+                        raise Exception("Drive kept discarding the upload session")
+                    continue
+
+                return file_id
+
+            except (requests.ConnectionError, requests.Timeout, UploadRetryableError) as e:
+                failures += 1
+                if failures > UPLOAD_RETRIES:
+                    raise
+                delay = min(UPLOAD_MAX_DELAY, UPLOAD_BASE_DELAY * (2 ** (failures - 1)))
+                print(f"Backup upload interrupted: {e} - retrying in {delay:.0f}s")
+                time.sleep(delay)
+
+            except UploadFolderMissingError:
+                self._invalidate_folder_cache()
+                raise
+
+    def _start_upload_session(self, filename: str, parent_id: str, size: int) -> str:
+        """Open a resumable upload session, returns its URI"""
+        import requests
+
+        response = requests.post(
+            f"{self.api_base}/upload/drive/v3/files",
+            params={"uploadType": "resumable", "fields": "id"},
+            headers={
+                **self._auth_headers(),
+                "X-Upload-Content-Type": "application/octet-stream",
+                "X-Upload-Content-Length": str(size),
+            },
+            json={"name": filename, "parents": [parent_id]},
+            timeout=30
+        )
+
+        if response.status_code == 404:
+            raise UploadFolderMissingError("Backup folder no longer exists")
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            raise UploadRetryableError(f"Starting upload failed: {response.status_code}")
+        if response.status_code != 200 or "Location" not in response.headers:
+            raise Exception(f"Starting upload failed: {response.status_code}")
+        return response.headers["Location"]
+
+    def _query_upload_offset(self, session_uri: str, total_size: int):
+        """Ask Drive how many bytes it has, returns (offset, file_id or None)"""
+        import requests
+
+        response = requests.put(
+            session_uri,
+            headers={"Content-Range": f"bytes */{total_size}", "Content-Length": "0"},
+            timeout=30
+        )
+        return self._parse_upload_response(response, total_size)
+
+    def _parse_upload_response(self, response, total_size: int):
+        if response.status_code in (200, 201):
+            return total_size, response.json().get("id")
+        if response.status_code == 308:
+            # Range is inclusive and absent when nothing has been stored yet
+            received = response.headers.get("Range")
+            return (int(received.split("-")[-1]) + 1 if received else 0), None
+        if response.status_code in (404, 410):
+            return None, None
+        if response.status_code in RETRYABLE_STATUS_CODES:
+            raise UploadRetryableError(f"Upload chunk failed: {response.status_code}")
+        raise Exception(f"Upload chunk failed: {response.status_code}")
+
+    def _send_chunks(self, session_uri: str, f, total_size: int) -> Optional[str]:
+        """Upload the remaining chunks of a stream, returns the file ID or None if the session is gone"""
+        import requests
+
+        offset, file_id = self._query_upload_offset(session_uri, total_size)
+        if offset is None:
+            return None
 
-            # Upload file
-            files = {
-                'data': ('metadata', json.dumps(metadata), 'application/json; charset=UTF-8'),
-                'file': (filename, vault_data, 'application/octet-stream')
-            }
+        while file_id is None:
+            f.seek(offset)
+            chunk = f.read(UPLOAD_CHUNK_SIZE)
+            end = offset + len(chunk) - 1
 
-            headers = {"Authorization": f"Bearer {self.access_token}"}
+            if chunk:
+                content_range = f"bytes {offset}-{end}/{total_size}"
+            else:
+                content_range = f"bytes */{total_size}"
 
-            response = requests.post(
-                "https://www.googleapis.com/upload/drive/v3/files?uploadType=multipart",
-                headers=headers,
-                files=files,
-                timeout=30
+            response = requests.put(
+                session_uri,
+                headers={"Content-Range": content_range, "Content-Length": str(len(chunk))},
+                data=chunk,
+                timeout=UPLOAD_CHUNK_TIMEOUT
             )
+            offset, file_id = self._parse_upload_response(response, total_size)
+            if offset is None:
+                return None
 
-            if response.status_code == 200:
-                # Update last backup time
-                self._update_last_backup_time()
-                return True, f"Backup uploaded successfully as {filename}"
-            else:
-                return False, f"Upload failed: {response.status_code}"
-
-        except Exception as e:
-            return False, f"Upload error: {str(e)}"
+        return file_id
 
     def _get_or_create_vault_folder(self) -> str:
-        """Get or create the Vault Backups folder in Google Drive"""
+        """Get or create the Vault Backups folder in Google Drive, cached across runs"""
+        state = self._load_state()
+        if state.get("folder_id"):
+            return state["folder_id"]
+
+        headers = self._auth_headers()
         try:
             import requests
 
-            headers = {"Authorization": f"Bearer {self.access_token}"}
-
             # Search for existing folder
             search_params = {
-                "q": "name='Vault Backups' and mimeType='application/vnd.google-apps.folder'",
-                "fields": "files(id, name)"
+                "q": f"name='{BACKUP_FOLDER_NAME}' and mimeType='application/vnd.google-apps.folder' and trashed=false",
+                "fields": "files(id)",
+                "pageSize": 1
             }
 
             response = requests.get(
-                "https://www.googleapis.com/drive/v3/files",
+                f"{self.api_base}/drive/v3/files",
                 headers=headers,
                 params=search_params,
                 timeout=10
             )
 
+            folder_id = None
             if response.status_code == 200:
                 files = response.json().get("files", [])
                 if files:
-                    return files[0]["id"]
-
-            # Create new folder
-            folder_metadata = {
-                "name": "Vault Backups",
-                "mimeType": "application/vnd.google-apps.folder"
-            }
-
-            response = requests.post(
-                "https://www.googleapis.com/drive/v3/files",
-                headers=headers,
-                json=folder_metadata,
-                timeout=10
-            )
-
-            if response.status_code == 200:
-                return response.json()["id"]
+                    folder_id = files[0]["id"]
+
+            if not folder_id:
+                # Create new folder
+                folder_metadata = {
+                    "name": BACKUP_FOLDER_NAME,
+                    "mimeType": "application/vnd.google-apps.folder"
+                }
+
+                response = requests.post(
+                    f"{self.api_base}/drive/v3/files",
+                    headers=headers,
+                    params={"fields": "id"},
+                    json=folder_metadata,
+                    timeout=10
+                )
+
+                if response.status_code == 200:
+                    folder_id = response.json()["id"]
+
+            if folder_id:
+                state["folder_id"] = folder_id
+                self._save_state()
+                return folder_id
 
         except Exception as e:
             print(f"Error managing vault folder: {e}")
 
         return "root"  # Fallback to root folder
 
-    def get_backup_status(self) -> Dict[str, Any]:
-        """Get current backup status information"""
-        status = {
-            "connected": self.is_authenticated(),
-            "last_backup": self._get_last_backup_time(),
-            "backup_count": 0,
-            "error": None
-        }
+    def list_backups(self, page_size: int = 1000) -> List[Dict[str, Any]]:
+        """List backup files newest first, following pagination"""
+        return self.list_objects(BACKUP_FILE_PREFIX, page_size)
 
-        if status["connected"]:
-            try:
-                status["backup_count"] = self._get_backup_count()
-            except Exception as e:
-                status["error"] = str(e)
+    # =============================================================================
+    # OBJECT STORE (used by the backup engine)
+    # =============================================================================
 
-        return status
+    def list_objects(self, prefix: str = "", page_size: int = 1000) -> List[Dict[str, Any]]:
+        """List files in the backup folder whose name starts with prefix, newest first"""
+        import requests
 
-    def _get_backup_count(self) -> int:
-        """Get number of backup files in Google Drive"""
-        try:
-            import requests
+        folder_id = self._get_or_create_vault_folder()
 
-            headers = {"Authorization": f"Bearer {self.access_token}"}
-            folder_id = self._get_or_create_vault_folder()
-
-            search_params = {
-                "q": f"'{folder_id}' in parents and name contains 'vault_backup_'",
-                "fields": "files(id)"
-            }
+        params = {
+            "q": f"'{folder_id}' in parents and name contains '{prefix}' and trashed=false",
+            "fields": "nextPageToken, files(id, name, size, createdTime)",
+            "orderBy": "createdTime desc",
+            "pageSize": page_size
+        }
 
+        objects = []
+        while True:
+            # Refreshed per page, a long listing can outlive the token
             response = requests.get(
-                "https://www.googleapis.com/drive/v3/files",
-                headers=headers,
-                params=search_params,
+                f"{self.api_base}/drive/v3/files",
+                headers=self._auth_headers(),
+                params=params,
                 timeout=10
             )
 
-            if response.status_code == 200:
-                return len(response.json().get("files", []))
-
-        except Exception as e:
-            print(f"Error getting backup count: {e}")
+            if response.status_code == 404:
+                self._invalidate_folder_cache()
+            if response.status_code != 200:
+                raise Exception(f"Listing backups failed: {response.status_code}")
 
-        return 0
+            result = response.json()
+            # 'contains' also matches mid-word, keep true prefix matches only
+            objects.extend(f for f in result.get("files", []) if f["name"].startswith(prefix))
 
-    def _update_last_backup_time(self):
-        """Update the last backup timestamp"""
-        try:
-            timestamp_file = os.path.join(self._get_app_directory(), "last_gdrive_backup.txt")
+            page_token = result.get("nextPageToken")
+            if not page_token:
+                return objects
+            params["pageToken"] = page_token
 
-            with open(timestamp_file, 'w') as f:
-                f.write(datetime.now().isoformat())
+    def put_object(self, name: str, data: bytes) -> str:
+        """Upload an object into the backup folder through a resumable session, returns its file ID"""
+        import io
 
-        except Exception as e:
-            print(f"Error updating backup timestamp: {e}")
-
-    def _get_last_backup_time(self) -> Optional[str]:
-        """Get the last backup timestamp"""
         try:
-            timestamp_file = os.path.join(self._get_app_directory(), "last_gdrive_backup.txt")
+            return self._upload_stream(io.BytesIO(data), len(data), name, self._get_or_create_vault_folder())
+        except UploadFolderMissingError:
+            # The cached folder was deleted, the retry finds or creates it again
+            return self._upload_stream(io.BytesIO(data), len(data), name, self._get_or_create_vault_folder())
+
+    def get_object(self, object_id: str) -> bytes:
+        import requests
+
+        response = requests.get(
+            f"{self.api_base}/drive/v3/files/{object_id}",
+            headers=self._auth_headers(),
+            params={"alt": "media"},
+            timeout=30
+        )
+
+        if response.status_code != 200:
+            raise Exception(f"Downloading backup object failed: {response.status_code}")
+        return response.content
+
+    def download_object(self, object_id: str, dest):
+        """Stream a file's content into dest without holding it in memory"""
+        import requests
+
+        with requests.get(
+            f"{self.api_base}/drive/v3/files/{object_id}",
+            headers=self._auth_headers(),
+            params={"alt": "media"},
+            stream=True,
+            timeout=30
+        ) as response:
+            if response.status_code != 200:
+                raise Exception(f"Downloading backup object failed: {response.status_code}")
+
+            for block in response.iter_content(chunk_size=DOWNLOAD_BLOCK_SIZE):
+                dest.write(block)
+
+    def delete_object(self, object_id: str):
+        import requests
+
+        response = requests.delete(
+            f"{self.api_base}/drive/v3/files/{object_id}",
+            headers=self._auth_headers(),
+            timeout=10
+        )
+
+        # Already gone is as good as deleted
+        if response.status_code not in (204, 404):
+            raise Exception(f"Deleting backup object failed: {response.status_code}")
+
+    def get_backup_status(self) -> Dict[str, Any]:
+        """Get current backup status information in a single listing"""
+        status = {
+            "connected": self.is_authenticated(),
+            "last_backup": None,
+            "backup_count": 0,
+            "error": None
+        }
 
-            if os.path.exists(timestamp_file):
-                with open(timestamp_file, 'r') as f:
-                    timestamp_str = f.read().strip()
-                    timestamp = datetime.fromisoformat(timestamp_str)
-                    return timestamp.strftime("%Y-%m-%d %H:%M:%S")
+        if status["connected"]:
+            try:
+                backups = self.list_backups()
+                status["backup_count"] = len(backups)
 
-        except Exception as e:
-            print(f"Error reading backup timestamp: {e}")
+                if backups:
+                    created = backups[0]["createdTime"].replace("Z", "+00:00")
+                    newest = datetime.fromisoformat(created).astimezone()
+                    status["last_backup"] = newest.strftime("%Y-%m-%d %H:%M:%S")
+            except Exception as e:
+                status["error"] = str(e)
 
-        return None
+        return status
 
     def disconnect(self):
         """Remove stored authentication"""
@@ -452,6 +663,9 @@ class GoogleDriveBackup:
             if os.path.exists(config_path):
                 os.remove(config_path)
 
+            # The next account may not see the cached folder
+            self._invalidate_folder_cache()
+
             self.access_token = None
             self.refresh_token = None
             self.token_expires = None
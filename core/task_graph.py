@@ -0,0 +1,85 @@
+"""
+Runs a small graph of CPU-bound tasks on a thread pool.
+
+Each task names a function and its arguments; an argument wrapped in
+Dep("other") is replaced by that task's result. Tasks start as soon as their
+dependencies finish, so independent key derivations run on separate cores
+instead of one after another. PBKDF2 (hashlib and cryptography) and bcrypt
+release the GIL while they hash, so threads get the parallelism without
+starting worker processes that re-import the app.
+"""
+
+import os
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+
+class Dep:
+    """Placeholder for the result of another task"""
+    __slots__ = ("name",)
+
+    def __init__(self, name):
+        self.name = name
+
+
+def _dependencies(args):
+    return {arg.name for arg in args if isinstance(arg, Dep)}
+
+
+def _resolve(args, results):
+    return tuple(results[arg.name] if isinstance(arg, Dep) else arg for arg in args)
+
+
+def _run_serial(tasks, check):
+    results = {}
+    pending = dict(tasks)
+    while pending:
+        ready = [name for name, (_, args) in pending.items() if _dependencies(args) <= results.keys()]
+        if not ready:
+            raise ValueError(f"Unresolvable task dependencies: {', '.join(pending)}")
+        for name in ready:
+            func, args = pending.pop(name)
+            results[name] = func(*_resolve(args, results))
+            if check:
+                check(name, results[name])
+    return results
+
+
+def run_task_graph(tasks, check=None, max_workers=None):
+    """Run {name: (func, args)} and return {name: result}
+
+    check(name, result) is called as each task finishes and may raise to
+    abandon the remaining work early, e.g. once a key fails verification.
+    """
+    for name, (_, args) in tasks.items():
+        missing = _dependencies(args) - tasks.keys()
+        if missing:
+            raise ValueError(f"Task {name} depends on unknown tasks: {', '.join(missing)}")
+
+    workers = max_workers or min(len(tasks), os.cpu_count() or 1)
+    if workers <= 1:
+        return _run_serial(tasks, check)
+
+    executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="task_graph")
+    results = {}
+    pending = dict(tasks)
+    running = {}
+    try:
+        while pending or running:
+            for name in [n for n, (_, args) in pending.items() if _dependencies(args) <= results.keys()]:
+                func, args = pending.pop(name)
+                running[executor.submit(func, *_resolve(args, results))] = name
+
+            if not running:
+                raise ValueError(f"Unresolvable task dependencies: {', '.join(pending)}")
+
+            done, _ = wait(running, return_when=FIRST_COMPLETED)
+            for future in done:
+                name = running.pop(future)
+                results[name] = future.result()
+                if check:
+                    check(name, results[name])
+    finally:
+        # Don't wait on work that an early failure made pointless, a started hash runs out on its own
+        executor.shutdown(wait=not running, cancel_futures=True)
+
+    return results
@@ -0,0 +1,257 @@
+"""
+Vault file format with per-folder encryption.
+
+Layout: MAGIC, a 4-byte header length, the encrypted header, then one
+encrypted blob per folder. The header holds each folder's name, schema, entry
+count, newest modification time and blob length, so unlocking only decrypts
+the header. A folder's entries are decrypted the first time they are read and
+kept in an LRU of loaded folders. Unchanged folders are written back as their
+original ciphertext, so a save only re-encrypts folders that changed.
+
+Vaults in the original single-blob format still load. They are rewritten in
+this format on their next save.
+"""
+
+import struct
+from collections import OrderedDict
+from collections.abc import MutableMapping
+
+MAGIC = b"TVAULT2\x00"
+HEADER_LENGTH = struct.Struct(">I")
+FORMAT_VERSION = 2
+MAX_LOADED_FOLDERS = 16
+
+
+class FolderCache:
+    """Bounds how many folders are decrypted at once and announces loads/unloads"""
+
+    def __init__(self, key, max_loaded=MAX_LOADED_FOLDERS):
+        self.key = key
+        self.max_loaded = max_loaded
+        self._loaded = OrderedDict()
+        self._listeners = []
+
+    def subscribe(self, callback):
+        """Register callback(event, folder) for "loaded" and "unloaded" events"""
+        if callback not in self._listeners:
+            self._listeners.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._listeners:
+            self._listeners.remove(callback)
+
+    def _notify(self, event, folder):
+        for callback in list(self._listeners):
+            try:
+                callback(event, folder)
+            except Exception as e:
+                print(f"Folder cache listener failed on {event}: {e}")
+
+    def touch(self, folder):
+        self._loaded[id(folder)] = folder
+        self._loaded.move_to_end(id(folder))
+
+        while len(self._loaded) > self.max_loaded:
+            _, oldest = self._loaded.popitem(last=False)
+            self._notify("unloaded", oldest)
+            oldest.unload()
+
+    def discard(self, folder):
+        self._loaded.pop(id(folder), None)
+
+    def loaded_folders(self):
+        return list(self._loaded.values())
+
+
+class LazyFolder(MutableMapping):
+    """A folder whose entries stay encrypted until first read"""
+
+    def __init__(self, cache, schema, count=0, modified=None, blob=None, entries=None):
+        self.cache = cache
+        self.schema = list(schema)
+        self.count = count
+        self.modified = modified
+        self.blob = blob
+        self._entries = entries
+        self.dirty = entries is not None
+
+    # =============================================================================
+    # LOADING
+    # =============================================================================
+
+    @property
+    def is_loaded(self):
+        return self._entries is not None
+
+    def _load(self):
+        if self._entries is None:
+            from core.entry_storage import CompactEntries
+            from security.encryption import decrypt_vault
+
+            entries = decrypt_vault(self.blob, self.cache.key).get("entries", []) if self.blob else []
+            self._entries = CompactEntries(entries, self.schema)
+            self.dirty = False
+            self.cache.touch(self)
+            self.cache._notify("loaded", self)
+        else:
+            self.cache.touch(self)
+        return self._entries
+
+    def unload(self):
+        """Drop decrypted entries, keeping any unsaved changes as fresh ciphertext"""
+        if self._entries is None:
+            return
+        if self.dirty:
+            self.blob = self._encrypt()
+        self._entries = None
+        self.dirty = False
+        self.cache.discard(self)
+
+    def mark_dirty(self):
+        self.dirty = True
+
+    def _encrypt(self):
+        from core.entry_storage import to_plain
+        from security.encryption import encrypt_vault
+
+        self.count = len(self._entries)
+        self.modified = max((e.get("_meta", {}).get("modified") or 0 for e in self._entries), default=0) or None
+        return encrypt_vault({"entries": to_plain(self._entries)}, self.cache.key)
+
+    def ciphertext(self):
+        """Blob to write on save, re-encrypting only if the folder changed"""
+        if self._entries is not None and (self.dirty or self.blob is None):
+            self.blob = self._encrypt()
+            self.dirty = False
+        return self.blob
+
+    def entry_count(self):
+        return len(self._entries) if self._entries is not None else self.count
+
+    def loaded_entries(self):
+        """Decrypted entries, or an empty list without decrypting anything"""
+        return self._entries if self._entries is not None else []
+
+    # =============================================================================
+    # MAPPING API ({"schema": [...], "entries": [...]})
+    # =============================================================================
+
+    def __getitem__(self, name):
+        if name == "schema":
+            return self.schema
+        if name == "entries":
+            return self._load()
+        raise KeyError(name)
+
+    def __setitem__(self, name, value):
+        if name == "schema":
+            self.schema = list(value)
+        elif name == "entries":
+            from core.entry_storage import CompactEntries
+            self._entries = CompactEntries(value, self.schema)
+            self.dirty = True
+            self.cache.touch(self)
+        else:
+            raise KeyError(name)
+
+    def __delitem__(self, name):
+        raise KeyError(name)
+
+    def __iter__(self):
+        return iter(("schema", "entries"))
+
+    def __len__(self):
+        return 2
+
+
+def entry_count(folder_data):
+    """Number of entries in a folder without decrypting a lazy one"""
+    if isinstance(folder_data, LazyFolder):
+        return folder_data.entry_count()
+    return len(folder_data.get("entries", []))
+
+
+def get_folder_cache(data):
+    """The cache shared by a decoded vault's lazy folders, if any"""
+    for folder in data.values():
+        if isinstance(folder, LazyFolder):
+            return folder.cache
+    return None
+
+
+# =============================================================================
+# ENCODING
+# =============================================================================
+
+def encode_vault(data, key):
+    from core.entry_storage import to_plain
+    from security.encryption import encrypt_vault
+
+    folders = []
+    blobs = []
+    for name, folder in data.items():
+        if isinstance(folder, LazyFolder):
+            blob = folder.ciphertext() or encrypt_vault({"entries": []}, key)
+            count, modified = folder.entry_count(), folder.modified
+        else:
+            entries = folder.get("entries", [])
+            blob = encrypt_vault({"entries": to_plain(entries)}, key)
+            count = len(entries)
+            modified = max((e.get("_meta", {}).get("modified") or 0 for e in entries), default=0) or None
+
+        folders.append({
+            "name": name,
+            "schema": list(folder.get("schema", [])),
+            "count": count,
+            "modified": modified,
+            "length": len(blob)
+        })
+        blobs.append(blob)
+
+    header = encrypt_vault({"version": FORMAT_VERSION, "folders": folders}, key)
+    return b"".join([MAGIC, HEADER_LENGTH.pack(len(header)), header] + blobs)
+
+
+def index_size(prefix):
+    """Bytes from the start of a vault file through its encrypted header
+
+    None for the original format or when prefix is too short to tell.
+    """
+    start = len(MAGIC) + HEADER_LENGTH.size
+    if len(prefix) < start or not prefix.startswith(MAGIC):
+        return None
+    (header_length,) = HEADER_LENGTH.unpack_from(prefix, len(MAGIC))
+    return start + header_length
+
+
+def decode_vault(token, key, max_loaded=MAX_LOADED_FOLDERS):
+    """Decode a vault file, decrypting only the folder index"""
+    from security.encryption import decrypt_vault
+
+    if not token.startswith(MAGIC):
+        # Original format, one blob holding the whole vault
+        return decrypt_vault(token, key)
+
+    offset = len(MAGIC)
+    (header_length,) = HEADER_LENGTH.unpack_from(token, offset)
+    offset += HEADER_LENGTH.size
+    header = decrypt_vault(token[offset:offset + header_length], key)
+    offset += header_length
+
+    cache = FolderCache(key, max_loaded)
+    data = {}
+    for folder in header.get("folders", []):
+        blob = token[offset:offset + folder["length"]]
+        offset += folder["length"]
+        data[folder["name"]] = LazyFolder(cache, folder.get("schema", []), folder.get("count", 0),
+                                          folder.get("modified"), blob)
+
+    return data
+
+
+def materialize(data):
+    """Plain dict copy with every folder decrypted"""
+    from core.entry_storage import to_plain
+
+    return {name: {"schema": list(folder.get("schema", [])), "entries": to_plain(folder["entries"])}
+            for name, folder in data.items()}
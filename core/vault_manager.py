@@ -2,9 +2,9 @@ import base64
 import json
 import os
 import re
-from auth.auth_manager import verify_recovery_key, verify_login, derive_recovery_key_hash, generate_recovery_key, hash_new_password
+from auth.auth_manager import verify_recovery_key, verify_login, derive_recovery_key_hash, generate_recovery_key, hash_new_password, derive_key_from_recovery
 from config import get_vault_path, get_auth_path
-from security.encryption import decrypt_vault, encrypt_vault, derive_key, decrypt_password_with_recovery_key, encrypt_password_with_recovery_key
+from security.encryption import derive_key, decrypt_password_with_recovery_key, generate_data_key, wrap_data_key, unwrap_data_key
 try:
     from dev_tools.dev_manager import DEV_MODE_ACTIVE, get_mock_credentials, get_mock_credentials, get_current_mock_data
 except ImportError:
@@ -22,7 +22,10 @@ def load_vault(key: bytes):
     with open(vault_path, "rb") as f:
         token = f.read()
 
-    data = decrypt_vault(token, key)
+    from core.vault_format import decode_vault
+
+    # Only the folder index is decrypted here, folders decrypt on first use
+    data = decode_vault(token, key)
     data = {k.decode('utf-8') if isinstance(k, bytes) else k: v for k, v in data.items()}
 
     # Track decrypt time
@@ -40,10 +43,18 @@ def save_vault(data: dict, key: bytes):
     import time
     save_start = time.time()
 
+    from core.vault_format import encode_vault
+
     vault_path = get_vault_path()
-    token = encrypt_vault(data, key)
-    with open(vault_path, "wb") as f:
+    token = encode_vault(data, key)
+
+    # Write beside the vault and swap, a crash mid-save keeps the old file
+    temp_path = vault_path + ".tmp"
+    with open(temp_path, "wb") as f:
         f.write(token)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, vault_path)
 
     # Track save performance
     save_time = (time.time() - save_start) * 1000
@@ -58,6 +69,89 @@ def save_vault(data: dict, key: bytes):
 
 
 
+def write_auth_file(auth_path, auth_data):
+    """Replace the auth file atomically, it holds the only copies of the wrapped vault key"""
+    temp_path = auth_path + ".tmp"
+    with open(temp_path, 'w') as f:
+        json.dump(auth_data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(temp_path, auth_path)
+
+
+def _vault_opens_with(key):
+    """True if the vault file on disk decrypts with key"""
+    from core.vault_format import decode_vault
+
+    with open(get_vault_path(), "rb") as f:
+        token = f.read()
+    try:
+        decode_vault(token, key)
+        return True
+    except ValueError:
+        return False
+
+
+def migrate_legacy_vault_key(auth_path, auth_data, password_key):
+    """Re-encrypt a vault that used the password key directly under a new random vault key
+
+    The wrapped new key is written to the auth file as pending before the
+    vault is replaced, so after a crash at any point one of the two keys
+    still opens the vault file on disk.
+    """
+    from core.vault_format import materialize
+
+    pending = auth_data.get("pending_wrapped_key")
+    if pending:
+        data_key = unwrap_data_key(pending, password_key)
+        if _vault_opens_with(data_key):
+            # Crashed after the vault was replaced, only the auth file is left
+            auth_data["wrapped_key"] = auth_data.pop("pending_wrapped_key")
+            write_auth_file(auth_path, auth_data)
+            return data_key
+    else:
+        data_key = generate_data_key()
+        auth_data["pending_wrapped_key"] = wrap_data_key(data_key, password_key)
+        write_auth_file(auth_path, auth_data)
+
+    save_vault(materialize(load_vault(password_key)), data_key)
+
+    auth_data["wrapped_key"] = auth_data.pop("pending_wrapped_key")
+    write_auth_file(auth_path, auth_data)
+    print("Vault re-encrypted under a random vault key")
+    return data_key
+
+
+def new_credential_tasks(auth_data, password, recovery_key):
+    """Key derivations for a new password and recovery key, none depending on another
+
+    Fresh salts are stored in auth_data; run the tasks with run_task_graph
+    and pass the results to store_new_credentials.
+    """
+    recovery_salt = os.urandom(16)
+    wrap_salt = os.urandom(16)
+    auth_data["recovery_salt"] = base64.b64encode(recovery_salt).decode('utf-8')
+    auth_data["recovery_wrap_salt"] = base64.b64encode(wrap_salt).decode('utf-8')
+
+    return {
+        "password_hash": (hash_new_password, (password,)),
+        "password_key": (derive_key, (password, base64.b64decode(auth_data["vault_salt"]))),
+        "recovery_hash": (derive_recovery_key_hash, (recovery_key, recovery_salt)),
+        "recovery_wrap_key": (derive_key_from_recovery, (recovery_key, wrap_salt)),
+    }
+
+
+def store_new_credentials(auth_data, data_key, results):
+    """Store the password hash, recovery hash and both wrapped copies of the vault key"""
+    auth_data["password"] = results["password_hash"].decode('utf-8')
+    auth_data["recovery_hash"] = results["recovery_hash"]
+    auth_data["wrapped_key"] = wrap_data_key(data_key, results["password_key"])
+    auth_data["recovery_wrapped_key"] = wrap_data_key(data_key, results["recovery_wrap_key"])
+    # The password no longer needs to be recoverable
+    auth_data.pop("encrypted_password", None)
+    auth_data.pop("pending_wrapped_key", None)
+
+
 def is_password_strong(password):
     if len(password) < 8:
         return False
@@ -102,31 +196,26 @@ def handle_first_setup(input_username, input_password, vault_directory=None):
     password = input_password
 
     try:
-        hashed_password = hash_new_password(password)
-        vault_salt = base64.b64encode(os.urandom(16)).decode('utf-8')
+        from core.task_graph import run_task_graph
+
+        auth_data = {
+            "username": username,
+            "vault_salt": base64.b64encode(os.urandom(16)).decode('utf-8')
+        }
 
         # Recovery key setup
         recovery_key = generate_recovery_key()
-        recovery_salt = os.urandom(16)
-        recovery_hash = derive_recovery_key_hash(recovery_key, recovery_salt)
-
-        encrypted_password = encrypt_password_with_recovery_key(password, recovery_key)
-
-        # Write auth file with encrypted password
-        with open(auth_path, 'w') as f:
-            json.dump({
-                "username": username,
-                "password": hashed_password.decode('utf-8'),
-                "vault_salt": vault_salt,
-                "recovery_salt": base64.b64encode(recovery_salt).decode('utf-8'),
-                "recovery_hash": recovery_hash,
-                "encrypted_password": encrypted_password
-            }, f, indent=2)
+
+        # The vault is encrypted with a random key, wrapped by both the password and the recovery key
+        key = generate_data_key()
+        results = run_task_graph(new_credential_tasks(auth_data, password, recovery_key))
+        store_new_credentials(auth_data, key, results)
+        write_auth_file(auth_path, auth_data)
 
         # Create and encrypt empty vault
-        key = derive_key(password, base64.b64decode(vault_salt))
+        from core.vault_format import encode_vault
         empty_vault = {}
-        encrypted_vault = encrypt_vault(empty_vault, key)
+        encrypted_vault = encode_vault(empty_vault, key)
 
         # Write vault file
         with open(vault_path, 'wb') as f:
@@ -149,6 +238,49 @@ def handle_first_setup(input_username, input_password, vault_directory=None):
         return False, f"Error creating account: {e}"
 
 
+def decrypt_password_after_check(recovery_key_valid, encrypted_password, recovery_key):
+    """Legacy recovery decrypt, scheduled after recovery_check so a wrong key is reported as such"""
+    return decrypt_password_with_recovery_key(encrypted_password, recovery_key)
+
+
+def recovery_unlock_tasks(auth_data, recovery_key):
+    """Key derivations that check a recovery key and recover the vault key with it"""
+    from core.task_graph import Dep
+
+    tasks = {
+        "recovery_check": (verify_recovery_key, (recovery_key, auth_data["recovery_hash"],
+                                                 base64.b64decode(auth_data["recovery_salt"]))),
+    }
+
+    if "recovery_wrapped_key" in auth_data:
+        tasks["old_recovery_wrap_key"] = (derive_key_from_recovery,
+                                          (recovery_key, base64.b64decode(auth_data["recovery_wrap_salt"])))
+    else:
+        # Older vaults keep the password encrypted with the recovery key instead. A wrong key
+        # makes the decrypt raise ValueError, so it waits until recovery_check has passed
+        tasks["old_password"] = (decrypt_password_after_check,
+                                 (Dep("recovery_check"), auth_data["encrypted_password"], recovery_key))
+        tasks["old_password_key"] = (derive_key, (Dep("old_password"), base64.b64decode(auth_data["vault_salt"])))
+    return tasks
+
+
+def unwrap_recovered_key(auth_data, results):
+    if "old_recovery_wrap_key" in results:
+        return unwrap_data_key(auth_data["recovery_wrapped_key"], results["old_recovery_wrap_key"])
+    if "wrapped_key" in auth_data:
+        return unwrap_data_key(auth_data["wrapped_key"], results["old_password_key"])
+    return results["old_password_key"]
+
+
+class InvalidRecoveryKey(Exception):
+    pass
+
+
+def _require_valid_recovery_key(name, result):
+    if name == "recovery_check" and not result:
+        raise InvalidRecoveryKey()
+
+
 def recover_password(input_recovery_key, new_password, confirm_password):
 
     try:
@@ -177,67 +309,35 @@ def recover_password(input_recovery_key, new_password, confirm_password):
         if "recovery_salt" not in auth_data or "recovery_hash" not in auth_data:
             return False, "No recovery key found for this vault.", None
 
-        if "encrypted_password" not in auth_data:
+        if "recovery_wrapped_key" not in auth_data and "encrypted_password" not in auth_data:
             return False, "This vault was created before password recovery was supported.", None
 
-        # Verify recovery key
-        recovery_salt = base64.b64decode(auth_data["recovery_salt"])
-        stored_hash = auth_data["recovery_hash"]
-
-        if not verify_recovery_key(input_recovery_key.strip().upper(), stored_hash, recovery_salt):
-            return False, "Invalid recovery key.", None
-
-        # Recovery key is valid - decrypt the old password
-        try:
-            old_password = decrypt_password_with_recovery_key(auth_data["encrypted_password"],
-                                                              input_recovery_key.strip().upper())
-        except ValueError as e:
-            return False, f"Failed to decrypt stored password: {str(e)}", None
+        from core.task_graph import run_task_graph
 
-        # Hash new password
-        new_hashed = hash_new_password(new_password)
-        auth_data["password"] = new_hashed.decode('utf-8')
+        # Verifying the recovery key, unlocking the vault key and deriving the
+        # new credentials are independent, so all of them run concurrently
+        recovery_key = input_recovery_key.strip().upper()
+        tasks = recovery_unlock_tasks(auth_data, recovery_key)
 
         # Generate new recovery key
         new_recovery_key = generate_recovery_key()
-        new_recovery_salt = os.urandom(16)
-        new_recovery_hash = derive_recovery_key_hash(new_recovery_key, new_recovery_salt)
+        new_auth_data = dict(auth_data)
+        tasks.update(new_credential_tasks(new_auth_data, new_password, new_recovery_key))
 
-        # Encrypt new password with new recovery key
-        new_encrypted_password = encrypt_password_with_recovery_key(new_password, new_recovery_key)
-
-        # Update auth data
-        auth_data["recovery_salt"] = base64.b64encode(new_recovery_salt).decode('utf-8')
-        auth_data["recovery_hash"] = new_recovery_hash
-        auth_data["encrypted_password"] = new_encrypted_password
-
-        # Save updated auth data
-        with open(auth_path, 'w') as f:
-            json.dump(auth_data, f)
-
-        # Re-encrypt vault with new password
-        vault_path = get_vault_path()
-        if os.path.exists(vault_path):
-            try:
-                # Read encrypted vault data
-                with open(vault_path, 'rb') as f:
-                    encrypted_vault_data = f.read()
-
-                # Decrypt vault with old password
-                vault_salt = base64.b64decode(auth_data["vault_salt"])
-                old_vault_key = derive_key(old_password, vault_salt)
-                vault_data = decrypt_vault(encrypted_vault_data, old_vault_key)
-
-                # Re-encrypt vault with new password
-                new_vault_key = derive_key(new_password, vault_salt)
-                new_encrypted_vault = encrypt_vault(vault_data, new_vault_key)
-
-                # Save re-encrypted vault
-                with open(vault_path, 'wb') as f:
-                    f.write(new_encrypted_vault)
+        try:
+            results = run_task_graph(tasks, check=_require_valid_recovery_key)
+            data_key = unwrap_recovered_key(auth_data, results)
+            if "wrapped_key" not in auth_data and "recovery_wrapped_key" not in auth_data:
+                # The old password must not keep opening the vault after the reset
+                data_key = migrate_legacy_vault_key(auth_path, auth_data, data_key)
+        except InvalidRecoveryKey:
+            return False, "Invalid recovery key.", None
+        except ValueError as e:
+            return False, f"Failed to unlock vault key: {str(e)}", None
 
-            except Exception as e:
-                return False, f"Password reset successful but vault re-encryption failed: {str(e)}", None
+        # Only the wrapped key changes, the vault file is left untouched
+        store_new_credentials(new_auth_data, data_key, results)
+        write_auth_file(auth_path, new_auth_data)
 
         return True, "Password reset successful. Your vault data has been preserved. Please save your new recovery key.", new_recovery_key
 
@@ -267,8 +367,24 @@ def user_verification(input_username, input_password):
     if verify_login(input_password, stored_hashed_password, input_username, stored_username):
         print("Login successful.")
         vault_salt = base64.b64decode(auth_data["vault_salt"])
-        key = derive_key(input_password, vault_salt)
-        return key, stored_username
+        password_key = derive_key(input_password, vault_salt)
+
+        if "wrapped_key" in auth_data:
+            try:
+                return unwrap_data_key(auth_data["wrapped_key"], password_key), stored_username
+            except ValueError as e:
+                print(f"Error unwrapping vault key: {e}")
+                return None, None
+
+        # Older vaults are encrypted with the password key itself, move them to a random vault key
+        try:
+            return migrate_legacy_vault_key(auth_path, auth_data, password_key), stored_username
+        except Exception as e:
+            print(f"Error moving vault to a random vault key: {e}")
+            # Keep working with the old key while the vault file is still under it
+            if _vault_opens_with(password_key):
+                return password_key, stored_username
+            return None, None
 
     print("Login failed.")
     return None, None
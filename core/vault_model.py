@@ -0,0 +1,321 @@
+"""
+Observable in-memory vault model.
+
+Wraps the decrypted vault dict ({folder: {"schema": [...], "entries": [...]}})
+and notifies subscribers of each change so views can update incrementally.
+
+Every entry carries a "_meta" dict with a stable id and created/modified/
+accessed timestamps. Entries stay addressable by list position for the views,
+but ids survive reordering and deletes, and a modified-time index answers
+"most recent" and "changed since" queries without scanning every folder.
+
+Folders decoded lazily (see core.vault_format) join the index when they are
+decrypted and leave it when the folder cache evicts them. Entries are held as
+compact records (see core.entry_storage); mutations index the stored record,
+not the dict the caller passed in.
+"""
+
+import time
+import uuid
+from bisect import bisect_right, insort
+
+ENTRY_ADDED = "entry_added"
+ENTRY_CHANGED = "entry_changed"
+ENTRY_REMOVED = "entry_removed"
+FOLDER_ADDED = "folder_added"
+FOLDER_RENAMED = "folder_renamed"
+FOLDER_REMOVED = "folder_removed"
+SCHEMA_CHANGED = "schema_changed"
+VAULT_RESET = "vault_reset"
+VAULT_SAVED = "vault_saved"
+
+META_KEY = "_meta"
+
+
+def entry_id(entry):
+    return entry.get(META_KEY, {}).get("id")
+
+
+def entry_meta(entry):
+    return entry.get(META_KEY, {})
+
+
+class VaultModel:
+    """Vault data with fine-grained change events"""
+
+    def __init__(self, data=None, key=None):
+        self.data = data if data is not None else {}
+        self.key = key
+        self._subscribers = []
+        self._folder_cache = None
+        self._rebuild_index()
+
+    # =============================================================================
+    # SUBSCRIPTIONS
+    # =============================================================================
+
+    def subscribe(self, callback):
+        """Register callback(event, payload) for every change"""
+        if callback not in self._subscribers:
+            self._subscribers.append(callback)
+
+    def unsubscribe(self, callback):
+        if callback in self._subscribers:
+            self._subscribers.remove(callback)
+
+    def _emit(self, event, **payload):
+        for callback in list(self._subscribers):
+            try:
+                callback(event, payload)
+            except Exception as e:
+                print(f"Vault model subscriber failed on {event}: {e}")
+
+    # =============================================================================
+    # METADATA INDEX
+    # =============================================================================
+
+    def _rebuild_index(self):
+        """Index every decrypted entry and follow the folder cache for the rest"""
+        from core.entry_storage import compact_folder
+        from core.vault_format import get_folder_cache
+
+        self._folder_of = {}
+        self._entries = {}
+        self._modified_index = []
+        self._folder_modified = {}
+
+        if self._folder_cache:
+            self._folder_cache.unsubscribe(self._on_folder_cache)
+        self._folder_cache = get_folder_cache(self.data)
+        if self._folder_cache:
+            self._folder_cache.subscribe(self._on_folder_cache)
+
+        for folder_name, folder in self.data.items():
+            if isinstance(folder, dict):
+                compact_folder(folder)
+            if getattr(folder, "modified", None):
+                self._folder_modified[folder_name] = folder.modified
+            self._index_folder(folder_name, self._loaded_entries(folder))
+
+    def _loaded_entries(self, folder):
+        """Entries already in memory, without decrypting a lazy folder"""
+        if hasattr(folder, "loaded_entries"):
+            return folder.loaded_entries()
+        return folder.get("entries", [])
+
+    def _index_folder(self, folder_name, entries):
+        assigned = False
+        for entry in entries:
+            meta = entry.setdefault(META_KEY, {})
+            if not meta.get("id"):
+                # Older entries have no history, their times stay unknown
+                meta.update({"id": uuid.uuid4().hex, "created": None,
+                             "modified": None, "accessed": None})
+                assigned = True
+            self._index_entry(folder_name, entry)
+
+        if assigned:
+            # Keep the new ids stable across sessions
+            self._mark_dirty(folder_name)
+
+    def _on_folder_cache(self, event, folder):
+        folder_name = next((name for name, f in self.data.items() if f is folder), None)
+        if folder_name is None:
+            return
+
+        if event == "loaded":
+            self._index_folder(folder_name, folder.loaded_entries())
+        elif event == "unloaded":
+            for entry in folder.loaded_entries():
+                meta = entry[META_KEY]
+                self._folder_of.pop(meta["id"], None)
+                self._entries.pop(meta["id"], None)
+                key = (meta.get("modified") or 0, meta["id"])
+                position = bisect_right(self._modified_index, key) - 1
+                if position >= 0 and self._modified_index[position] == key:
+                    del self._modified_index[position]
+
+    def _mark_dirty(self, folder_name):
+        folder = self.data.get(folder_name)
+        if hasattr(folder, "mark_dirty"):
+            folder.mark_dirty()
+
+    def _index_entry(self, folder_name, entry):
+        meta = entry[META_KEY]
+        self._folder_of[meta["id"]] = folder_name
+        self._entries[meta["id"]] = entry
+        modified = meta.get("modified") or 0
+        insort(self._modified_index, (modified, meta["id"]))
+        if modified > self._folder_modified.get(folder_name, 0):
+            self._folder_modified[folder_name] = modified
+
+    def _unindex_entry(self, entry):
+        meta = entry[META_KEY]
+        folder_name = self._folder_of.pop(meta["id"], None)
+        self._entries.pop(meta["id"], None)
+        key = (meta.get("modified") or 0, meta["id"])
+        position = bisect_right(self._modified_index, key) - 1
+        if position >= 0 and self._modified_index[position] == key:
+            del self._modified_index[position]
+
+        if folder_name and self._folder_modified.get(folder_name) == key[0]:
+            entries = self.data.get(folder_name, {}).get("entries", [])
+            self._folder_modified[folder_name] = max(
+                (entry_meta(e).get("modified") or 0 for e in entries if e is not entry), default=0
+            )
+
+    def _new_meta(self, old_entry=None):
+        now = time.time()
+        if old_entry is not None and entry_id(old_entry):
+            meta = dict(entry_meta(old_entry))
+            meta["modified"] = now
+            return meta
+        return {"id": uuid.uuid4().hex, "created": now, "modified": now, "accessed": None}
+
+    def locate(self, entry_id_value):
+        """Current (folder, index) of an entry id, or (None, None)"""
+        folder_name = self._folder_of.get(entry_id_value)
+        if folder_name is None:
+            return None, None
+        for index, entry in enumerate(self.get_entries(folder_name)):
+            if entry_id(entry) == entry_id_value:
+                return folder_name, index
+        return None, None
+
+    def get_entry(self, entry_id_value):
+        return self._entries.get(entry_id_value)
+
+    def recent_entries(self, limit=10):
+        """Most recently modified entries as (folder, entry), newest first"""
+        results = []
+        for modified, entry_id_value in reversed(self._modified_index):
+            if not modified or len(results) >= limit:
+                break
+            results.append((self._folder_of[entry_id_value], self.get_entry(entry_id_value)))
+        return results
+
+    def modified_since(self, timestamp):
+        """Ids of entries modified after timestamp, oldest first"""
+        start = bisect_right(self._modified_index, (timestamp, chr(0x10FFFF)))
+        return [entry_id_value for _, entry_id_value in self._modified_index[start:]]
+
+    def folder_last_modified(self, folder_name):
+        """Newest modification time in a folder, None if unknown"""
+        return self._folder_modified.get(folder_name) or None
+
+    def touch_entry(self, entry_id_value):
+        """Record that an entry was viewed or used, saved with the next write"""
+        entry = self.get_entry(entry_id_value)
+        if entry is not None:
+            entry[META_KEY]["accessed"] = time.time()
+            self._mark_dirty(self._folder_of[entry_id_value])
+
+    # =============================================================================
+    # QUERIES
+    # =============================================================================
+
+    def folder_names(self):
+        return list(self.data.keys())
+
+    def has_folder(self, folder_name):
+        return folder_name in self.data
+
+    def get_folder(self, folder_name):
+        return self.data.get(folder_name)
+
+    def get_entries(self, folder_name):
+        folder = self.data.get(folder_name)
+        return folder.get("entries", []) if folder else []
+
+    # =============================================================================
+    # MUTATIONS
+    # =============================================================================
+
+    def reset(self, data, key=None):
+        self.data = data if data is not None else {}
+        if key is not None:
+            self.key = key
+        self._rebuild_index()
+        self._emit(VAULT_RESET)
+
+    def add_entry(self, folder_name, entry):
+        entries = self.data[folder_name].setdefault("entries", [])
+        entry[META_KEY] = self._new_meta()
+        entries.append(entry)
+        entry = entries[-1]
+        self._index_entry(folder_name, entry)
+        self._mark_dirty(folder_name)
+        index = len(entries) - 1
+        self._emit(ENTRY_ADDED, folder=folder_name, index=index, entry=entry)
+        return index
+
+    def update_entry(self, folder_name, index, entry):
+        entries = self.data[folder_name]["entries"]
+        old_entry = entries[index]
+        entry[META_KEY] = self._new_meta(old_entry)
+        self._unindex_entry(old_entry)
+        entries[index] = entry
+        entry = entries[index]
+        self._index_entry(folder_name, entry)
+        self._mark_dirty(folder_name)
+        self._emit(ENTRY_CHANGED, folder=folder_name, index=index, entry=entry, old_entry=old_entry)
+
+    def remove_entry(self, folder_name, index):
+        entry = self.data[folder_name]["entries"].pop(index)
+        self._unindex_entry(entry)
+        self._mark_dirty(folder_name)
+        self._emit(ENTRY_REMOVED, folder=folder_name, index=index, entry=entry)
+        return entry
+
+    def add_folder(self, folder_name, schema):
+        if folder_name in self.data:
+            raise ValueError(f"Folder '{folder_name}' already exists")
+
+        from core.entry_storage import CompactEntries
+
+        self.data[folder_name] = {"schema": list(schema), "entries": CompactEntries(schema=schema)}
+        self._emit(FOLDER_ADDED, folder=folder_name)
+
+    def update_schema(self, folder_name, schema):
+        self.data[folder_name]["schema"] = list(schema)
+        self._emit(SCHEMA_CHANGED, folder=folder_name, schema=list(schema))
+
+    def rename_folder(self, old_name, new_name):
+        if old_name == new_name:
+            return
+        if new_name in self.data:
+            raise ValueError(f"Folder '{new_name}' already exists")
+
+        # Rebuild in place so the folder keeps its position and callers
+        # holding a reference to self.data stay in sync
+        items = list(self.data.items())
+        self.data.clear()
+        for name, folder in items:
+            self.data[new_name if name == old_name else name] = folder
+
+        for entry in self._loaded_entries(self.data[new_name]):
+            self._folder_of[entry_id(entry)] = new_name
+        if old_name in self._folder_modified:
+            self._folder_modified[new_name] = self._folder_modified.pop(old_name)
+        self._emit(FOLDER_RENAMED, folder=new_name, old_folder=old_name)
+
+    def remove_folder(self, folder_name):
+        from core.vault_format import entry_count
+
+        folder = self.data.pop(folder_name)
+        for entry in self._loaded_entries(folder):
+            self._unindex_entry(entry)
+        self._folder_modified.pop(folder_name, None)
+        if self._folder_cache:
+            self._folder_cache.discard(folder)
+        self._emit(FOLDER_REMOVED, folder=folder_name, entry_count=entry_count(folder))
+        return folder
+
+    # =============================================================================
+    # PERSISTENCE
+    # =============================================================================
+
+    def save(self):
+        from core.vault_manager import save_vault
+        save_vault(self.data, self.key)
+        self._emit(VAULT_SAVED)
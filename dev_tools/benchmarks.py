@@ -0,0 +1,166 @@
+import random
+import statistics
+import sys
+import time
+
+
+# Stylesheets the vault window set on every card and folder row before style classes,
+# keyed by the style class that replaced them
+LEGACY_STYLES = {
+    "passwordCard": """
+            QWidget {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #404043, stop:1 #373739);
+                border: 1px solid rgba(255, 255, 255, 0.12);
+                border-radius: 12px;
+                cursor: pointer;
+            }
+            QWidget:hover {
+                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+                    stop:0 #4a4a4d, stop:1 #404043);
+                border: 1px solid rgba(255, 255, 255, 0.25);
+            }
+        """,
+    "passwordCardTitle": """
+            color: #ffffff;
+            background: transparent;
+            font-weight: 600;
+            border: none;
+            padding: 0px;
+        """,
+    "passwordCardUsername": """
+                color: #b0b0b0;
+                background: transparent;
+                font-weight: 400;
+                border: none;
+                padding: 0px;
+            """,
+    "folderItem": """
+                QWidget {
+                    background: transparent;
+                    border: none;
+                    border-radius: 8px;
+                }
+                QWidget:hover {
+                    background: rgba(255, 255, 255, 0.06);
+                }
+            """,
+    "folderItem:selected": """
+                QWidget {
+                    background: rgba(76, 175, 80, 0.2);
+                    border: 2px solid #4CAF50;
+                    border-radius: 8px;
+                }
+            """,
+    "folderItemAccent": """
+            QWidget {
+                background: #{accent};
+                border-radius: 8px;
+                border: none;
+            }
+        """,
+    "folderItemIcon": "color: white; font-size: 18px; background: transparent; border: none;",
+    "folderItemName": "color: #ffffff; background: transparent; border: none;",
+    "folderItemCount": "color: #999999; background: transparent; border: none;",
+}
+
+
+def legacy_set_style_class(widget, style_class, **properties):
+    """Stand-in for set_style_class that parses the old inline stylesheet on the widget"""
+    if properties.get("selected"):
+        style_class += ":selected"
+    stylesheet = LEGACY_STYLES[style_class]
+    if "accent" in properties:
+        stylesheet = stylesheet.replace("{accent}", properties["accent"])
+    widget.setStyleSheet(stylesheet)
+
+
+def _card_factory():
+    """The vault window's own card and folder row builders, without building a whole window"""
+    from gui.windows.vault_window import VaultWindow
+
+    methods = ("create_password_card", "create_folder_list_item", "get_entry_display_name", "get_entry_username")
+    return type("CardFactory", (), {name: getattr(VaultWindow, name) for name in methods})()
+
+
+def _build(host, factory, vault_data):
+    layout = host.layout()
+    for folder_name, folder_data in vault_data.items():
+        entries = folder_data.get("entries", [])
+        schema = folder_data.get("schema", [])
+        layout.addWidget(factory.create_folder_list_item(folder_name, len(entries)))
+        for index, entry in enumerate(entries):
+            layout.addWidget(factory.create_password_card(index, entry, schema))
+
+
+def _clear(host):
+    layout = host.layout()
+    while layout.count():
+        child = layout.takeAt(0)
+        if child.widget():
+            child.widget().deleteLater()
+
+
+def benchmark_card_creation(preset="large", rounds=7, seed=None):
+    """Time the vault window's card and folder rows with inline stylesheets vs compiled style classes
+
+    Both arms run the real builders from vault_window. The inline arm swaps
+    set_style_class for the stylesheets it replaced and uses the theme as it
+    was before style classes. Arms alternate in a shuffled order every round
+    so warm-up and caching don't favour either one.
+    """
+    from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout
+    from dev_tools.mock_data import get_mock_vault_data
+    from gui.styles import themes
+    from gui.windows import vault_window
+
+    app = QApplication.instance() or QApplication(sys.argv)
+    vault_data = get_mock_vault_data(preset)
+    card_count = sum(len(folder.get("entries", [])) for folder in vault_data.values())
+    factory = _card_factory()
+
+    arms = {
+        "inline setStyleSheet": (themes.DARK_THEME, legacy_set_style_class),
+        "style classes": (themes.compile_theme(), themes.set_style_class),
+    }
+
+    host = QWidget()
+    QVBoxLayout(host)
+    host.show()
+
+    order = random.Random(seed)
+    timings = {label: [] for label in arms}
+    try:
+        for _ in range(rounds):
+            labels = list(arms)
+            order.shuffle(labels)
+            for label in labels:
+                stylesheet, style_function = arms[label]
+                host.setStyleSheet(stylesheet)
+                vault_window.set_style_class = style_function
+                app.processEvents()
+
+                start = time.perf_counter()
+                _build(host, factory, vault_data)
+                app.processEvents()
+                timings[label].append((time.perf_counter() - start) * 1000)
+
+                _clear(host)
+                app.processEvents()
+    finally:
+        vault_window.set_style_class = themes.set_style_class
+        host.close()
+
+    results = {label: statistics.median(samples) for label, samples in timings.items()}
+
+    print(f"Card creation for {card_count} entries in {len(vault_data)} folders "
+          f"({preset} preset, median of {rounds} interleaved rounds):")
+    for label, elapsed in results.items():
+        spread = f"{min(timings[label]):.1f}-{max(timings[label]):.1f}ms"
+        print(f"  {label}: {elapsed:.1f}ms ({elapsed / max(card_count, 1):.3f}ms per card, range {spread})")
+
+    return results
+
+
+if __name__ == "__main__":
+    benchmark_card_creation(sys.argv[1] if len(sys.argv) > 1 else "large")
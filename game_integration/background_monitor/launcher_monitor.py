@@ -0,0 +1,278 @@
+"""
+One polling thread for every launcher profile.
+
+Each tick reads the active window and mouse position once and hands them to
+a LauncherDetector per registered profile. The process list is only read when
+a profile waiting on its launcher to exit needs it. Detectors keep the signal
+and methods the overlays already use (username_field_detected,
+start_monitoring, reset_overlay_flag, ...), so a detector can be switched on
+or off without touching the others.
+"""
+
+import threading
+import time
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+from game_integration.background_monitor.launcher_profiles import (
+    RESET_ON_EXIT, RESET_ON_LEAVE, USERNAME_REGION, get_profiles
+)
+
+POLL_INTERVAL_SECONDS = 0.2
+
+# Not fetched yet this tick, distinct from a fetched None
+_UNSET = object()
+
+
+class DesktopSnapshot:
+    """Desktop state for one tick, each part fetched at most once"""
+
+    def __init__(self):
+        self._active_window = _UNSET
+        self._mouse = _UNSET
+        self._processes = _UNSET
+
+    def active_window(self):
+        if self._active_window is _UNSET:
+            try:
+                import pygetwindow as gw
+                self._active_window = gw.getActiveWindow()
+            except Exception:
+                self._active_window = None
+        return self._active_window
+
+    def mouse_position(self):
+        if self._mouse is _UNSET:
+            try:
+                import pyautogui
+                self._mouse = pyautogui.position()
+            except Exception as e:
+                print(f"Mouse position error: {e}")
+                self._mouse = None
+        return self._mouse
+
+    def process_names(self):
+        """Names of running processes, None if they can't be listed"""
+        if self._processes is _UNSET:
+            try:
+                import psutil
+                self._processes = [proc.info['name'] or "" for proc in psutil.process_iter(['name'])]
+            except Exception:
+                self._processes = None
+        return self._processes
+
+
+def find_window(profile):
+    """First open window of a profile's launcher, None if it isn't open"""
+    try:
+        import pygetwindow as gw
+        for title in profile.window_titles:
+            windows = gw.getWindowsWithTitle(title)
+            if windows:
+                return windows[0]
+    except Exception as e:
+        print(f"{profile.display_name} window lookup error: {e}")
+    return None
+
+
+def _relative_position(window, mouse):
+    if mouse is None or not window.width or not window.height:
+        return None
+    return (mouse.x - window.left) / window.width, (mouse.y - window.top) / window.height
+
+
+# =============================================================================
+# DETECTOR
+# =============================================================================
+
+class LauncherDetector(QObject):
+    """Trigger state for one launcher profile"""
+    username_field_detected = pyqtSignal()
+
+    def __init__(self, profile, scheduler):
+        super().__init__()
+        self.profile = profile
+        self.scheduler = scheduler
+        self.monitoring = False
+        self.overlay_shown = False
+        self.last_trigger_time = 0
+        self.was_active = False
+        self.overlay_was_closed = False
+
+    def start_monitoring(self):
+        if self.monitoring:
+            return
+        self.monitoring = True
+        self.scheduler.start()
+        print(f"Started {self.profile.display_name} monitoring")
+
+    def stop_monitoring(self):
+        self.monitoring = False
+
+    def reset_overlay_flag(self):
+        """Called when the overlay is closed"""
+        self.overlay_shown = False
+
+        # Don't show again until the reset policy allows it
+        if self.profile.reset_policy == RESET_ON_EXIT:
+            self.overlay_was_closed = True
+            print(f"{self.profile.display_name} overlay closed - won't trigger again until it is restarted")
+        elif self.is_active():
+            self.overlay_was_closed = True
+            print(f"{self.profile.display_name} overlay closed - won't trigger again until user leaves it")
+        else:
+            self.overlay_was_closed = False
+            print(f"{self.profile.display_name} overlay closed - can trigger again")
+
+    def reset_overlay_flag_after_resize(self):
+        """Reset overlay flag after resize (keep detection active)"""
+        self.overlay_shown = False
+        print(f"{self.profile.display_name} overlay hidden after resize - detection still active")
+
+    def is_active(self):
+        """Check if the launcher is the active window"""
+        window = DesktopSnapshot().active_window()
+        return window is not None and self.profile.matches_title(window.title)
+
+    def is_running(self, snapshot=None):
+        """Check if the launcher process is running, falling back to its windows"""
+        snapshot = snapshot or DesktopSnapshot()
+        processes = snapshot.process_names() if self.profile.process_names else None
+        if processes is not None:
+            return any(self.profile.matches_process(name) for name in processes)
+        return find_window(self.profile) is not None
+
+    def is_standard_size(self):
+        """Check if the launcher window is at the size its field regions expect"""
+        window = find_window(self.profile)
+        if window is None:
+            return False
+        is_standard = self.profile.is_standard_size(window)
+        print(f"{self.profile.display_name} size check: {window.width}x{window.height} - Standard: {is_standard}")
+        return is_standard
+
+    # =============================================================================
+    # POLLING
+    # =============================================================================
+
+    def poll(self, snapshot):
+        """Advance the trigger state by one scheduler tick"""
+        profile = self.profile
+        window = snapshot.active_window()
+        active = window is not None and profile.matches_title(window.title)
+
+        if (profile.reset_policy == RESET_ON_EXIT and self.overlay_was_closed and
+                not self.is_running(snapshot)):
+            print(f"{profile.display_name} closed - resetting autofill availability")
+            self.overlay_was_closed = False
+            self.was_active = False
+
+        if not active:
+            if self.was_active and profile.reset_policy == RESET_ON_LEAVE:
+                print(f"User left {profile.display_name} - resetting autofill availability")
+                self.overlay_was_closed = False
+            self.was_active = False
+            return
+
+        if self.was_active:
+            return
+        self.was_active = True
+
+        if self.overlay_shown:
+            return
+        if self.overlay_was_closed:
+            print(f"Click detected but overlay was already closed in this {profile.display_name} session")
+            return
+
+        if self._is_trigger_click(window, snapshot.mouse_position()):
+            print(f"{profile.display_name.upper()} LOGIN CLICKED - TRIGGERING OVERLAY!")
+            self.overlay_shown = True
+            self.last_trigger_time = time.time()
+            self.username_field_detected.emit()
+
+    def _is_trigger_click(self, window, mouse):
+        relative = _relative_position(window, mouse)
+        if relative is None:
+            return False
+        relative_x, relative_y = relative
+
+        if not self.profile.is_standard_size(window):
+            # Field positions are unknown at this size, any click in the window offers the resize
+            return 0 <= relative_x <= 1 and 0 <= relative_y <= 1
+
+        in_field = self.profile.region_contains(USERNAME_REGION, relative_x, relative_y)
+        print(f"{self.profile.display_name} click at ({relative_x:.1%}, {relative_y:.1%}) - "
+              f"In username field: {in_field}")
+        return in_field
+
+
+# =============================================================================
+# SCHEDULER
+# =============================================================================
+
+class LauncherScheduler:
+    """Polls every monitored launcher profile from a single thread"""
+
+    def __init__(self, profiles=None, interval=POLL_INTERVAL_SECONDS):
+        self.interval = interval
+        self.detectors = {}
+        self._lock = threading.Lock()
+        self._thread = None
+        for profile in (get_profiles() if profiles is None else profiles):
+            self.add_profile(profile)
+
+    def add_profile(self, profile):
+        """Detector for a profile, created on first request"""
+        detector = self.detectors.get(profile.name)
+        if detector is None:
+            detector = LauncherDetector(profile, self)
+            self.detectors[profile.name] = detector
+        return detector
+
+    def detector(self, name):
+        return self.detectors.get(name)
+
+    @property
+    def running(self):
+        return self._thread is not None
+
+    def start(self):
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._loop, daemon=True)
+                self._thread.start()
+
+    def stop(self):
+        """Stop every detector, the thread exits on its next tick"""
+        for detector in list(self.detectors.values()):
+            detector.stop_monitoring()
+
+    def poll_once(self):
+        snapshot = DesktopSnapshot()
+        for detector in list(self.detectors.values()):
+            if not detector.monitoring:
+                continue
+            try:
+                detector.poll(snapshot)
+            except Exception as e:
+                print(f"{detector.profile.display_name} detection error: {e}")
+
+    def _loop(self):
+        while True:
+            with self._lock:
+                if not any(detector.monitoring for detector in self.detectors.values()):
+                    # Nothing left to watch, start() brings the thread back
+                    self._thread = None
+                    return
+            self.poll_once()
+            time.sleep(self.interval)
+
+
+_launcher_scheduler = None
+
+
+def get_launcher_scheduler():
+    global _launcher_scheduler
+    if _launcher_scheduler is None:
+        _launcher_scheduler = LauncherScheduler()
+    return _launcher_scheduler
@@ -0,0 +1,174 @@
+"""
+Launcher profiles for autofill detection.
+
+A profile describes one game launcher as data: the window titles and process
+names that identify it, where its username field sits (as fractions of the
+window size), the window size autofill expects, when a dismissed overlay may
+show again, which vault folders hold its accounts and the steps that fill its
+login form. The shared scheduler in launcher_monitor runs every registered
+profile and one overlay serves them all, so supporting another launcher means
+registering a profile rather than writing a detector or an overlay.
+"""
+
+from game_integration.injection import PASSWORD_FIELD, USERNAME_FIELD, field, hotkey, key, wait
+
+# A dismissed overlay can show again once the user switches away from the launcher
+RESET_ON_LEAVE = "leave"
+# ...or only once the launcher process has exited
+RESET_ON_EXIT = "exit"
+
+USERNAME_REGION = "username"
+
+# Epic loads the password screen after the email is submitted
+EPIC_PASSWORD_STAGE_SECONDS = 1.0
+
+
+class LauncherProfile:
+    """How to recognise a launcher and its login form"""
+
+    def __init__(self, name, display_name, window_titles, process_names=(), field_regions=None,
+                 standard_size=None, size_tolerance=10, reset_policy=RESET_ON_LEAVE, vault_folders=(),
+                 game_name=None, analytics_name=None, fill_steps=()):
+        self.name = name
+        self.display_name = display_name
+        # What the user calls the accounts, e.g. "Valorant" for the Riot Client
+        self.game_name = game_name or display_name
+        # Prefix of the profile's autofill counters in analytics
+        self.analytics_name = analytics_name or name
+        self.window_titles = tuple(window_titles)
+        self.process_names = tuple(process_names)
+        # {region: (left, top, right, bottom)} relative to the window
+        self.field_regions = dict(field_regions or {})
+        # (width, height) the field regions were measured at, None if they scale with the window
+        self.standard_size = standard_size
+        self.size_tolerance = size_tolerance
+        self.reset_policy = reset_policy
+        self.vault_folders = list(vault_folders)
+        # Injection steps, field() steps are filled from the chosen account
+        self.fill_steps = list(fill_steps)
+
+    def matches_title(self, title):
+        return bool(title) and any(pattern in title for pattern in self.window_titles)
+
+    def matches_process(self, process_name):
+        return any(pattern in process_name for pattern in self.process_names)
+
+    def is_standard_size(self, window):
+        """True if the window is at the size the field regions expect"""
+        if self.standard_size is None:
+            return True
+        width, height = self.standard_size
+        return (abs(window.width - width) <= self.size_tolerance and
+                abs(window.height - height) <= self.size_tolerance)
+
+    def region_contains(self, region, relative_x, relative_y):
+        bounds = self.field_regions.get(region)
+        if bounds is None:
+            return False
+        left, top, right, bottom = bounds
+        return left <= relative_x <= right and top <= relative_y <= bottom
+
+    # =============================================================================
+    # DISPLAY TEXT
+    # =============================================================================
+
+    def account_prompt(self):
+        return f"Select {self.game_name} Account"
+
+    def empty_message(self):
+        return f"No {self.game_name} accounts found"
+
+    def folder_instruction(self):
+        """Folder names to create accounts in, one spelling per name ignoring case"""
+        names = {}
+        # Capitalised spellings first so they are the ones shown
+        for folder in sorted(self.vault_folders, key=lambda f: not f[:1].isupper()):
+            names.setdefault(folder.lower(), folder)
+
+        quoted = [f"'{folder}'" for folder in names.values()]
+        if len(quoted) > 2:
+            listed = ", ".join(quoted[:-1]) + f", or {quoted[-1]}"
+        else:
+            listed = " or ".join(quoted)
+        return f"Create accounts in folders named:\n{listed}"
+
+    def resize_title(self):
+        return f"{self.game_name} Auto-Fill"
+
+    def resize_message(self):
+        return f"{self.display_name}'s resizable window requires standardization for reliable auto-fill"
+
+
+# =============================================================================
+# REGISTRY
+# =============================================================================
+
+_profiles = {}
+
+
+def register_profile(profile):
+    """Add a profile, replacing any registered under the same name"""
+    _profiles[profile.name] = profile
+    return profile
+
+
+def get_profile(name):
+    return _profiles.get(name)
+
+
+def get_profiles():
+    return list(_profiles.values())
+
+
+# =============================================================================
+# BUILT-IN PROFILES
+# =============================================================================
+
+register_profile(LauncherProfile(
+    name="riot",
+    display_name="Riot Client",
+    window_titles=["Riot Client"],
+    process_names=["RiotClientServices", "Riot Client"],
+    field_regions={USERNAME_REGION: (0.035, 0.275, 0.225, 0.325)},
+    reset_policy=RESET_ON_LEAVE,
+    vault_folders=['valorant', 'Valorant', 'val'],
+    game_name="Valorant",
+    analytics_name="valorant",
+    fill_steps=[
+        field(USERNAME_FIELD),
+        key('tab'),
+        field(PASSWORD_FIELD),
+        key('enter'),
+    ],
+))
+
+register_profile(LauncherProfile(
+    name="epic",
+    display_name="Epic Games Launcher",
+    window_titles=["Epic Games Launcher"],
+    process_names=["EpicGamesLauncher", "Epic Games Launcher"],
+    # Measured on a 1200x800 window, other sizes get the resize prompt first
+    field_regions={USERNAME_REGION: (0.318, 0.710, 0.672, 0.761)},
+    standard_size=(1200, 800),
+    reset_policy=RESET_ON_EXIT,
+    vault_folders=['epic', 'Epic', 'epic games', 'Epic Games', 'epicgames', 'EpicGames'],
+    game_name="Epic Games",
+    analytics_name="epic",
+    fill_steps=[
+        # Stage 1: Email
+        hotkey('ctrl', 'a'),
+        field(USERNAME_FIELD),
+        key('enter'),
+
+        # Stage 2: Password, once the password screen has loaded
+        wait(EPIC_PASSWORD_STAGE_SECONDS),
+        key('tab'),
+        field(PASSWORD_FIELD),
+
+        # 3 tabs to sign-in button
+        key('tab'),
+        key('tab'),
+        key('tab'),
+        key('enter'),
+    ],
+))
@@ -1,22 +1,194 @@
-from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QLineEdit
-from PyQt6.QtCore import Qt, pyqtSignal
+from PyQt6.QtWidgets import QWidget, QVBoxLayout, QLabel, QPushButton, QLineEdit, QScrollArea, QStackedWidget
+from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QFont
 
+from game_integration.background_monitor.launcher_profiles import get_profile
+
+USERNAME_FIELDS = ['Username', 'username', 'User', 'user', 'Email', 'email']
+PASSWORD_FIELDS = ['Password', 'password', 'Pass', 'pass']
+TITLE_FIELDS = ['Title', 'title', 'Name', 'name']
+
+# =============================================================================
+# STYLES
+# =============================================================================
+
+OVERLAY_STYLE = """
+    VaultOverlay {
+        background: #2d2d30;
+        border: 2px solid #4CAF50;
+        border-radius: 15px;
+    }
+    QLabel {
+        background: transparent;
+        border: none;
+        color: #ffffff;
+    }
+    QWidget#titleWidget {
+        background: transparent;
+        border: none;
+    }
+    QLineEdit {
+        background: rgba(255, 255, 255, 0.1);
+        border: 1px solid rgba(255, 255, 255, 0.15);
+        border-radius: 8px;
+        padding: 8px 12px;
+        color: #ffffff;
+        selection-background-color: #4CAF50;
+    }
+    QLineEdit:focus {
+        border: 2px solid #4CAF50;
+        background: rgba(255, 255, 255, 0.15);
+        padding: 7px 11px;
+    }
+    QLineEdit::placeholder {
+        color: #888888;
+    }
+"""
+
+UNLOCK_BUTTON_STYLE = """
+    QPushButton {
+        border: none;
+        border-radius: 12px;
+        padding: 12px 24px;
+        font-weight: 600;
+        text-transform: uppercase;
+        letter-spacing: 1px;
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #4CAF50, stop:1 #45a049);
+        color: white;
+    }
+    QPushButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #45a049, stop:1 #3d8b40);
+    }
+    QPushButton:pressed {
+        background: #3d8b40;
+    }
+"""
+
+CANCEL_BUTTON_STYLE = """
+    QPushButton {
+        background: rgba(255, 255, 255, 0.1);
+        color: #ffffff;
+        border: 2px solid rgba(255, 255, 255, 0.25);
+        border-radius: 12px;
+        padding: 12px 24px;
+        font-weight: 600;
+        text-transform: uppercase;
+        letter-spacing: 1px;
+    }
+    QPushButton:hover {
+        background: rgba(255, 255, 255, 0.15);
+        border: 2px solid rgba(255, 255, 255, 0.35);
+    }
+    QPushButton:pressed {
+        background: rgba(255, 255, 255, 0.2);
+    }
+"""
+
+AUTOFILL_MODE_BUTTON_STYLE = """
+    QPushButton {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #4CAF50, stop:1 #45a049);
+        color: white;
+        border: none;
+        border-radius: 12px;
+        padding: 15px 30px;
+        font-weight: 600;
+    }
+    QPushButton:hover {
+        background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
+            stop:0 #45a049, stop:1 #3d8b40);
+    }
+    QPushButton:pressed {
+        background: #3d8b40;
+    }
+"""
+
+EXIT_BUTTON_STYLE = """
+    QPushButton {
+        background: rgba(255, 255, 255, 0.1);
+        color: #ffffff;
+        border: 2px solid rgba(255, 255, 255, 0.25);
+        border-radius: 12px;
+        padding: 12px 24px;
+        font-weight: 600;
+    }
+    QPushButton:hover {
+        background: rgba(255, 255, 255, 0.15);
+        border: 2px solid rgba(255, 255, 255, 0.35);
+    }
+    QPushButton:pressed {
+        background: rgba(255, 255, 255, 0.2);
+    }
+"""
+
+ACCOUNT_BUTTON_STYLE = """
+    QPushButton {
+        background: rgba(255, 255, 255, 0.08);
+        border: 1px solid rgba(255, 255, 255, 0.15);
+        border-radius: 8px;
+        color: #ffffff;
+        font-weight: bold;
+        font-size: 12px;
+        text-align: left;
+        padding-left: 15px;
+    }
+    QPushButton:hover {
+        background: rgba(255, 255, 255, 0.15);
+        border: 1px solid rgba(255, 255, 255, 0.25);
+    }
+    QPushButton:pressed {
+        background: rgba(255, 255, 255, 0.2);
+    }
+"""
+
+SCROLL_AREA_STYLE = """
+    QScrollArea {
+        border: none;
+        background: transparent;
+    }
+    QScrollArea > QWidget > QWidget {
+        background: transparent;
+    }
+    QScrollBar:vertical {
+        background: rgba(255, 255, 255, 0.1);
+        width: 12px;
+        border-radius: 6px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background: rgba(255, 255, 255, 0.3);
+        border-radius: 6px;
+        min-height: 20px;
+    }
+    QScrollBar::handle:vertical:hover {
+        background: rgba(255, 255, 255, 0.5);
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        border: none;
+        background: none;
+        height: 0px;
+    }
+"""
+
 
 class VaultOverlay(QWidget):
+    """Autofill popup for one launcher profile, pages are built once and switched in a stack"""
     finished = pyqtSignal()
     account_selected = pyqtSignal(dict)
 
-    def __init__(self, main_app=None):
+    def __init__(self, profile, main_app=None):
         super().__init__()
+        self.profile = profile
         self.main_app = main_app
         self.vault_data = None
         self.vault_key = None
+        self.account_buttons = []
+        self.error_labels = {}
         self.init_overlay()
 
     def init_overlay(self):
-
-
         self.setWindowFlags(
             Qt.WindowType.FramelessWindowHint |
             Qt.WindowType.WindowStaysOnTopHint |
@@ -24,76 +196,48 @@ class VaultOverlay(QWidget):
         )
 
         self.setFixedSize(420, 550)
-
-        self.setStyleSheet("""
-            VaultOverlay {
-                background: #2d2d30;
-                border: 2px solid #4CAF50;
-                border-radius: 15px;
-            }
-            QLabel {
-                background: transparent;
-                border: none;
-                color: #ffffff;
-            }
-            QWidget#titleWidget {
-                background: transparent;
-                border: none;
-            }
-            QLineEdit {
-                background: rgba(255, 255, 255, 0.1);
-                border: 1px solid rgba(255, 255, 255, 0.15);
-                border-radius: 8px;
-                padding: 8px 12px;
-                color: #ffffff;
-                selection-background-color: #4CAF50;
-            }
-            QLineEdit:focus {
-                border: 2px solid #4CAF50;
-                background: rgba(255, 255, 255, 0.15);
-                padding: 7px 11px;
-            }
-            QLineEdit::placeholder {
-                color: #888888;
-            }
-        """)
+        self.setStyleSheet(OVERLAY_STYLE)
 
         self.layout = QVBoxLayout(self)
         self.layout.setContentsMargins(30, 30, 30, 30)
-        self.layout.setSpacing(20)
+
+        self.stack = QStackedWidget()
+        self.layout.addWidget(self.stack)
+
+        self.login_page = self._build_login_page()
+        self.accounts_page = self._build_accounts_page()
+        # Only launchers whose field regions need a set window size offer the resize
+        self.resize_page = self._build_resize_page() if self.profile.standard_size else None
+        for page in (self.login_page, self.accounts_page, self.resize_page):
+            if page is not None:
+                self.stack.addWidget(page)
 
         self.center_on_screen()
 
-        # Check if vault is already open
-        if self.is_vault_already_open():
-            print("Vault is already open - skipping authentication")
-            self.load_vault_from_main_app()
-            self.show_account_list()
-        else:
-            print("Vault is not open - showing login")
-            self.show_vault_login()
+    # =============================================================================
+    # PAGE CONSTRUCTION
+    # =============================================================================
 
-    def show_vault_login(self):
-        """Show vault password entry with clean styling"""
-        self.clear_layout()
+    def _new_page(self):
+        page = QWidget()
+        layout = QVBoxLayout(page)
+        layout.setContentsMargins(0, 0, 0, 0)
+        layout.setSpacing(20)
+        return page, layout
+
+    def _build_header(self, layout, subtitle_text):
+        from gui.widgets.modern_widgets import LogoWidget
 
-        # Title section with logo
         title_layout = QVBoxLayout()
         title_layout.setSpacing(5)
+        title_layout.addWidget(LogoWidget())
 
-        # Logo
-        from gui.widgets.modern_widgets import LogoWidget
-        logo_label = LogoWidget()
-        title_layout.addWidget(logo_label)
-
-        # App title
         app_title = QLabel("TheVault")
         app_title.setFont(QFont("Segoe UI", 28, QFont.Weight.Bold))
         app_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
         app_title.setStyleSheet("color: #ffffff; background: transparent;")
 
-        # Subtitle
-        subtitle = QLabel("Auto-Fill Authentication")
+        subtitle = QLabel(subtitle_text)
         subtitle.setFont(QFont("Segoe UI", 14))
         subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
         subtitle.setObjectName("subtitle")
@@ -102,160 +246,183 @@ class VaultOverlay(QWidget):
         title_layout.addWidget(app_title)
         title_layout.addWidget(subtitle)
 
-
         title_widget = QWidget()
         title_widget.setObjectName("titleWidget")
         title_widget.setLayout(title_layout)
-        self.layout.addWidget(title_widget)
-
-        self.layout.addSpacing(15)
+        layout.addWidget(title_widget)
+        return subtitle
+
+    def _build_error_label(self, page, layout):
+        error_label = QLabel("")
+        error_label.setStyleSheet("color: #ff4757; font-size: 10px; background: transparent;")
+        error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        error_label.hide()
+        layout.addWidget(error_label)
+        self.error_labels[page] = error_label
+        return error_label
+
+    def _build_button(self, layout, text, style, slot, height=45, font_size=11):
+        button = QPushButton(text)
+        button.setMinimumHeight(height)
+        button.setFont(QFont("Segoe UI", font_size, QFont.Weight.Medium))
+        button.setStyleSheet(style)
+        button.clicked.connect(slot)
+        layout.addWidget(button)
+        return button
+
+    def _build_login_page(self):
+        page, layout = self._new_page()
+        self._build_header(layout, "Auto-Fill Authentication")
+        layout.addSpacing(15)
 
-        # Password input
         self.password_input = QLineEdit()
         self.password_input.setEchoMode(QLineEdit.EchoMode.Password)
         self.password_input.setPlaceholderText("Enter vault password")
         self.password_input.setFixedHeight(40)
-        self.password_input.setStyleSheet("""
-           QLineEdit {
-               background: rgba(255, 255, 255, 0.1);
-               border: 1px solid rgba(255, 255, 255, 0.15);
-               border-radius: 8px;
-               padding: 8px 12px;
-               color: #ffffff;
-               selection-background-color: #4CAF50;
-           }
-           QLineEdit:focus {
-               border: 2px solid #4CAF50;
-               background: rgba(255, 255, 255, 0.15);
-               padding: 7px 11px;
-           }
-           QLineEdit::placeholder {
-               color: #888888;
-           }
-       """)
         self.password_input.returnPressed.connect(self.verify_vault_password)
-        self.layout.addWidget(self.password_input)
-
-        # Error label
-        self.error_label = QLabel("")
-        self.error_label.setStyleSheet("color: #ff4757; font-size: 10px; background: transparent;")
-        self.error_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        self.error_label.hide()
-        self.layout.addWidget(self.error_label)
-
-        self.layout.addSpacing(10)
-
-        # Unlock button
-        unlock_btn = QPushButton("Unlock Vault")
-        unlock_btn.setMinimumHeight(45)
-        unlock_btn.setFont(QFont("Segoe UI", 11, QFont.Weight.Medium))
-        unlock_btn.setStyleSheet("""
-           QPushButton {
-               border: none;
-               border-radius: 12px;
-               padding: 12px 24px;
-               font-weight: 600;
-               text-transform: uppercase;
-               letter-spacing: 1px;
-               background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                   stop:0 #4CAF50, stop:1 #45a049);
-               color: white;
-           }
-           QPushButton:hover {
-               background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                   stop:0 #45a049, stop:1 #3d8b40);
-           }
-           QPushButton:pressed {
-               background: #3d8b40;
-           }
-       """)
-        unlock_btn.clicked.connect(self.verify_vault_password)
-        self.layout.addWidget(unlock_btn)
-
-        # Cancel button
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.setMinimumHeight(45)
-        cancel_btn.setFont(QFont("Segoe UI", 11, QFont.Weight.Medium))
-        cancel_btn.setStyleSheet("""
-           QPushButton {
-               background: rgba(255, 255, 255, 0.1);
-               color: #ffffff;
-               border: 2px solid rgba(255, 255, 255, 0.25);
-               border-radius: 12px;
-               padding: 12px 24px;
-               font-weight: 600;
-               text-transform: uppercase;
-               letter-spacing: 1px;
-           }
-           QPushButton:hover {
-               background: rgba(255, 255, 255, 0.15);
-               border: 2px solid rgba(255, 255, 255, 0.35);
-           }
-           QPushButton:pressed {
-               background: rgba(255, 255, 255, 0.2);
-           }
-       """)
-        cancel_btn.clicked.connect(self.close_overlay)
-        self.layout.addWidget(cancel_btn)
+        layout.addWidget(self.password_input)
+
+        self.error_label = self._build_error_label(page, layout)
+        layout.addSpacing(10)
+
+        self._build_button(layout, "Unlock Vault", UNLOCK_BUTTON_STYLE, self.verify_vault_password)
+        self._build_button(layout, "Cancel", CANCEL_BUTTON_STYLE, self.close_overlay)
+        return page
+
+    def _build_accounts_page(self):
+        page, layout = self._new_page()
+        self._build_header(layout, self.profile.account_prompt())
+        layout.addSpacing(10)
+
+        self.no_accounts_label = QLabel(self.profile.empty_message())
+        self.no_accounts_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.no_accounts_label.setStyleSheet("color: #888888; font-size: 14px; background: transparent;")
+        layout.addWidget(self.no_accounts_label)
+
+        self.instruction_label = QLabel(self.profile.folder_instruction())
+        self.instruction_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        self.instruction_label.setStyleSheet(
+            "color: #b0b0b0; font-size: 12px; font-style: italic; background: transparent;")
+        layout.addWidget(self.instruction_label)
+
+        self.accounts_scroll = QScrollArea()
+        self.accounts_scroll.setWidgetResizable(True)
+        self.accounts_scroll.setFixedHeight(220)
+        self.accounts_scroll.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
+        self.accounts_scroll.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
+        self.accounts_scroll.setStyleSheet(SCROLL_AREA_STYLE)
+
+        accounts_widget = QWidget()
+        accounts_widget.setStyleSheet("background: transparent;")
+        self.accounts_layout = QVBoxLayout(accounts_widget)
+        self.accounts_layout.setSpacing(8)
+        self.accounts_layout.setContentsMargins(5, 5, 5, 5)
+        self.accounts_layout.addStretch()
+
+        self.accounts_scroll.setWidget(accounts_widget)
+        layout.addWidget(self.accounts_scroll)
+
+        self._build_error_label(page, layout)
+        layout.addSpacing(25)
+        self._build_button(layout, "Cancel", CANCEL_BUTTON_STYLE, self.close_overlay)
+        return page
+
+    def _build_resize_page(self):
+        page, layout = self._new_page()
+        self._build_header(layout, self.profile.resize_title())
+        layout.addSpacing(20)
+
+        message = QLabel(self.profile.resize_message())
+        message.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        message.setStyleSheet("color: #ffffff; font-size: 12px; background: transparent;")
+        message.setWordWrap(True)
+        layout.addWidget(message)
 
-        self.password_input.setFocus()
+        self._build_error_label(page, layout)
+        layout.addSpacing(30)
 
-    def is_vault_already_open(self):
-        """Check if main vault app is open and logged in"""
-        try:
-            if not self.main_app:
-                print("DEBUG: No main app reference")
-                return False
+        self._build_button(layout, "Auto-Fill Mode", AUTOFILL_MODE_BUTTON_STYLE, self.handle_autofill_mode,
+                           height=50, font_size=12)
+        layout.addSpacing(15)
+        self._build_button(layout, "Exit", EXIT_BUTTON_STYLE, self.close_overlay)
+        layout.addStretch()
+        return page
 
-            print(f"DEBUG: Main app exists: {type(self.main_app)}")
+    # =============================================================================
+    # PAGES
+    # =============================================================================
 
-            if not hasattr(self.main_app, 'stacked_widget'):
-                print("DEBUG: No stacked widget")
-                return False
+    def _show_page(self, page):
+        self.error_labels[page].hide()
+        self.stack.setCurrentWidget(page)
 
-            current_widget = self.main_app.stacked_widget.currentWidget()
-            print(f"DEBUG: Current widget: {type(current_widget)}")
-
-            # Check if vault window exists
-            if not hasattr(self.main_app, 'vault_window'):
-                print("DEBUG: No vault window attribute")
-                return False
+    def show_vault_login(self):
+        """Show vault password entry"""
+        self.password_input.clear()
+        self._show_page(self.login_page)
+        self.password_input.setFocus()
 
-            print(f"DEBUG: Vault window: {type(self.main_app.vault_window)}")
-            print(f"DEBUG: Current widget == vault window: {current_widget == self.main_app.vault_window}")
+    def show_account_list(self):
+        """Show the profile's accounts, or where to create them if there are none"""
+        accounts = self.find_accounts(self.profile.vault_folders)
+
+        self.no_accounts_label.setVisible(not accounts)
+        self.instruction_label.setVisible(not accounts)
+        self.accounts_scroll.setVisible(bool(accounts))
+
+        self._update_account_rows(accounts)
+        self._show_page(self.accounts_page)
+
+    def show_resize_prompt(self):
+        """Offer to resize the launcher to the size its field regions expect"""
+        self._show_page(self.resize_page)
+
+    def _update_account_rows(self, accounts):
+        """Reuse the existing row buttons, only adding rows when the list grows"""
+        while len(self.account_buttons) < len(accounts):
+            button = QPushButton()
+            button.setFixedHeight(40)
+            button.setStyleSheet(ACCOUNT_BUTTON_STYLE)
+            button.account = None
+            button.clicked.connect(lambda checked, b=button: self._on_account_clicked(b))
+            # Rows go above the trailing stretch
+            self.accounts_layout.insertWidget(len(self.account_buttons), button)
+            self.account_buttons.append(button)
+
+        for button, account in zip(self.account_buttons, accounts):
+            button.account = account
+            button.setText(account['title'])
+            button.show()
+
+        for button in self.account_buttons[len(accounts):]:
+            button.account = None
+            button.hide()
+
+    def _on_account_clicked(self, button):
+        if button.account is not None:
+            self.select_account(button.account)
+
+    # =============================================================================
+    # VAULT ACCESS
+    # =============================================================================
 
-            if current_widget != self.main_app.vault_window:
-                print("DEBUG: Not currently on vault window")
+    def is_vault_already_open(self):
+        """Check if main vault app is open and logged in"""
+        try:
+            vault_window = getattr(self.main_app, 'vault_window', None)
+            if vault_window is None or not hasattr(self.main_app, 'stacked_widget'):
                 return False
 
-            # Check vault data
-            vault_window = self.main_app.vault_window
-            print(f"DEBUG: Vault window has vault_data attr: {hasattr(vault_window, 'vault_data')}")
-
-            if hasattr(vault_window, 'vault_data'):
-                print(f"DEBUG: Vault data: {vault_window.vault_data}")
-                print(f"DEBUG: Vault data type: {type(vault_window.vault_data)}")
-
-            print(f"DEBUG: Vault window has vault_key attr: {hasattr(vault_window, 'vault_key')}")
-
-            if hasattr(vault_window, 'vault_key'):
-                print(f"DEBUG: Vault key exists: {vault_window.vault_key is not None}")
-
-            has_data = (hasattr(vault_window, 'vault_data') and
-                        vault_window.vault_data and
-                        vault_window.vault_data.get("data"))
-
-            has_key = (hasattr(vault_window, 'vault_key') and
-                       vault_window.vault_key)
-
-            print(f"DEBUG: Final check - has_data: {has_data}, has_key: {has_key}")
+            if self.main_app.stacked_widget.currentWidget() != vault_window:
+                return False
 
+            vault_data = getattr(vault_window, 'vault_data', None)
+            has_data = bool(vault_data and vault_data.get("data"))
+            has_key = bool(getattr(vault_window, 'vault_key', None))
             return has_data and has_key
 
         except Exception as e:
-            print(f"DEBUG: Error in vault check: {e}")
-            import traceback
-            traceback.print_exc()
+            print(f"Error checking whether the vault is open: {e}")
             return False
 
     def load_vault_from_main_app(self):
@@ -295,12 +462,10 @@ class VaultOverlay(QWidget):
                 self.vault_key = vault_key
                 self.vault_data = load_vault(vault_key)
 
-                if hasattr(self, 'post_login_action') and self.post_login_action == 'epic':
-                    print("Redirecting to Epic accounts after login")
-                    self.show_epic_account_list()
-                else:
-                    print("Showing default Valorant accounts after login")
-                    self.show_account_list()
+                from core.activity_log import open_activity_log
+                open_activity_log(vault_key)
+
+                self.show_account_list()
             else:
                 self.show_error("Invalid vault password")
 
@@ -308,520 +473,82 @@ class VaultOverlay(QWidget):
             print(f"Vault unlock error: {e}")
             self.show_error("Failed to unlock vault")
 
-    def show_account_list(self):
-        """Show list of Valorant accounts with proper styling"""
-        self.clear_layout()
-
-        # Title section
-        title_layout = QVBoxLayout()
-        title_layout.setSpacing(5)
-
-        # Logo
-        from gui.widgets.modern_widgets import LogoWidget
-        logo_label = LogoWidget()
-        title_layout.addWidget(logo_label)
-
-        # App title
-        app_title = QLabel("TheVault")
-        app_title.setFont(QFont("Segoe UI", 28, QFont.Weight.Bold))
-        app_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        app_title.setStyleSheet("color: #ffffff; background: transparent;")
-
-        # Subtitle
-        subtitle = QLabel("Select Valorant Account")
-        subtitle.setFont(QFont("Segoe UI", 14))
-        subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        subtitle.setObjectName("subtitle")
-        subtitle.setStyleSheet("color: #b0b0b0; background: transparent;")
-
-        title_layout.addWidget(app_title)
-        title_layout.addWidget(subtitle)
-
-        # Create title
-        title_widget = QWidget()
-        title_widget.setObjectName("titleWidget")
-        title_widget.setLayout(title_layout)
-        self.layout.addWidget(title_widget)
-
-        self.layout.addSpacing(10)
-
-        # Find Valorant accounts
-        accounts = self.find_valorant_accounts()
-
-        if not accounts:
-            no_accounts = QLabel("No Valorant accounts found")
-            no_accounts.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_accounts.setStyleSheet("color: #888888; font-size: 14px; background: transparent;")
-            self.layout.addWidget(no_accounts)
-
-            instruction = QLabel("Create accounts in folders named:\n'Valorant', 'valorant', or 'val'")
-            instruction.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            instruction.setStyleSheet("color: #b0b0b0; font-size: 12px; font-style: italic; background: transparent;")
-            self.layout.addWidget(instruction)
-        else:
-            # scrollable area for accounts
-            from PyQt6.QtWidgets import QScrollArea
-
-            scroll_area = QScrollArea()
-            scroll_area.setWidgetResizable(True)
-            scroll_area.setFixedHeight(220)
-            scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-            scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-            scroll_area.setStyleSheet("""
-                QScrollArea {
-                    border: none;
-                    background: transparent;
-                }
-                QScrollArea > QWidget > QWidget {
-                    background: transparent;
-                }
-                QScrollBar:vertical {
-                    background: rgba(255, 255, 255, 0.1);
-                    width: 12px;
-                    border-radius: 6px;
-                    margin: 0px;
-                }
-                QScrollBar::handle:vertical {
-                    background: rgba(255, 255, 255, 0.3);
-                    border-radius: 6px;
-                    min-height: 20px;
-                }
-                QScrollBar::handle:vertical:hover {
-                    background: rgba(255, 255, 255, 0.5);
-                }
-                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                    border: none;
-                    background: none;
-                    height: 0px;
-                }
-            """)
-
-            # widget to hold account buttons
-            accounts_widget = QWidget()
-            accounts_widget.setStyleSheet("background: transparent;")
-            accounts_layout = QVBoxLayout(accounts_widget)
-            accounts_layout.setSpacing(8)
-            accounts_layout.setContentsMargins(5, 5, 5, 5)
-
-            # Add account buttons
-            for account in accounts:
-                account_btn = QPushButton(account['title'])
-                account_btn.setFixedHeight(40)
-                account_btn.setStyleSheet("""
-                    QPushButton {
-                        background: rgba(255, 255, 255, 0.08);
-                        border: 1px solid rgba(255, 255, 255, 0.15);
-                        border-radius: 8px;
-                        color: #ffffff;
-                        font-weight: bold;
-                        font-size: 12px;
-                        text-align: left;
-                        padding-left: 15px;
-                    }
-                    QPushButton:hover {
-                        background: rgba(255, 255, 255, 0.15);
-                        border: 1px solid rgba(255, 255, 255, 0.25);
-                    }
-                    QPushButton:pressed {
-                        background: rgba(255, 255, 255, 0.2);
-                    }
-                """)
-                account_btn.clicked.connect(lambda checked, acc=account: self.select_account(acc))
-                accounts_layout.addWidget(account_btn)
-
-            accounts_layout.addStretch()
-
-            scroll_area.setWidget(accounts_widget)
-            self.layout.addWidget(scroll_area)
-
-        self.layout.addSpacing(25)
-
-        # Cancel button
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.setMinimumHeight(45)
-        cancel_btn.setFont(QFont("Segoe UI", 11, QFont.Weight.Medium))
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.1);
-                color: #ffffff;
-                border: 2px solid rgba(255, 255, 255, 0.25);
-                border-radius: 12px;
-                padding: 12px 24px;
-                font-weight: 600;
-                text-transform: uppercase;
-                letter-spacing: 1px;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.15);
-                border: 2px solid rgba(255, 255, 255, 0.35);
-            }
-            QPushButton:pressed {
-                background: rgba(255, 255, 255, 0.2);
-            }
-        """)
-        cancel_btn.clicked.connect(self.close_overlay)
-        self.layout.addWidget(cancel_btn)
-
-    def find_valorant_accounts(self):
-        """Find accounts only in Valorant-related folders"""
+    def find_accounts(self, folder_names):
+        """Accounts with a username and password in the given folders"""
         accounts = []
-        valorant_folders = ['valorant', 'Valorant', 'val']
 
-        for folder_name, folder_data in self.vault_data.items():
-            if folder_name not in valorant_folders:
+        for folder_name, folder_data in (self.vault_data or {}).items():
+            if folder_name not in folder_names:
                 continue
 
-            entries = folder_data.get("entries", [])
-
-            for entry in entries:
-                username = None
-                password = None
-                title = None
-
-                # Find username
-                for field in ['Username', 'username', 'User', 'user', 'Email', 'email']:
-                    if field in entry and entry[field]:
-                        username = entry[field]
-                        break
-
-                # Find password
-                for field in ['Password', 'password', 'Pass', 'pass']:
-                    if field in entry and entry[field]:
-                        password = entry[field]
-                        break
-
-                # Find title
-                for field in ['Title', 'title', 'Name', 'name']:
-                    if field in entry and entry[field]:
-                        title = entry[field]
-                        break
+            for entry in folder_data.get("entries", []):
+                username = _first_field(entry, USERNAME_FIELDS)
+                password = _first_field(entry, PASSWORD_FIELDS)
 
                 # Use username as fallback if no title
-                if not title:
-                    title = username
+                title = _first_field(entry, TITLE_FIELDS) or username
 
                 if username and password and title:
                     accounts.append({
                         'username': username,
                         'password': password,
                         'title': title,
-                        'folder': folder_name
+                        'folder': folder_name,
+                        'entry_id': entry.get('_meta', {}).get('id')
                     })
 
         return accounts
 
-    def select_account(self, account):
-        """Fill selected account into Riot Client"""
-        print(f"Selected account: {account['title']}")
-
-        try:
-            import pyautogui
-            import time
-
-            self.hide()
-            time.sleep(0.5)
-
-            pyautogui.typewrite(account['username'])
-            pyautogui.press('tab')
-            pyautogui.typewrite(account['password'])
-            pyautogui.press('enter')
-
-            print("Account filled successfully!")
-
-            from gui.analytics_manager import track_valorant_autofill_success
-            track_valorant_autofill_success()
-
-            self.close_overlay()
-
-
-        except Exception as e:
-            print(f"Fill error: {e}")
-            from gui.analytics_manager import track_valorant_autofill_error
-            track_valorant_autofill_error("autofill_failed")
-            self.show_error("Failed to fill account")
-
-    def show_error(self, message):
-        if hasattr(self, 'error_label'):
-            self.error_label.setText(message)
-            self.error_label.show()
-
-    def clear_layout(self):
-        while self.layout.count():
-            child = self.layout.takeAt(0)
-            if child.widget():
-                child.widget().deleteLater()
-
-    def center_on_screen(self):
-        from PyQt6.QtGui import QGuiApplication
-        screen = QGuiApplication.primaryScreen().geometry()
-        x = (screen.width() - self.width()) // 2
-        y = (screen.height() - self.height()) // 2
-        self.move(x, y)
-
-    def show_overlay(self):
-        from gui.analytics_manager import track_valorant_autofill_triggered
-        track_valorant_autofill_triggered()
-        self.show()
-        self.raise_()
-        self.activateWindow()
-
-    def close_overlay(self):
-        from gui.analytics_manager import track_valorant_autofill_cancelled
-        track_valorant_autofill_cancelled()
+    # =============================================================================
+    # AUTOFILL
+    # =============================================================================
 
+    def _hide_for_fill(self):
+        """Hide and let focus return to the launcher before input is sent"""
+        from PyQt6.QtWidgets import QApplication
         self.hide()
-        self.finished.emit()
-
-    def find_epic_accounts(self):
-        """Find accounts only in Epic Games-related folders"""
-        accounts = []
-        epic_folders = ['epic', 'Epic', 'epic games', 'Epic Games', 'epicgames', 'EpicGames']
-
-        for folder_name, folder_data in self.vault_data.items():
-            if folder_name not in epic_folders:
-                continue
-
-            entries = folder_data.get("entries", [])
-
-            for entry in entries:
-                username = None
-                password = None
-                title = None
-
-                # Find username
-                for field in ['Username', 'username', 'User', 'user', 'Email', 'email']:
-                    if field in entry and entry[field]:
-                        username = entry[field]
-                        break
-
-                # Find password
-                for field in ['Password', 'password', 'Pass', 'pass']:
-                    if field in entry and entry[field]:
-                        password = entry[field]
-                        break
-
-                # Find title
-                for field in ['Title', 'title', 'Name', 'name']:
-                    if field in entry and entry[field]:
-                        title = entry[field]
-                        break
-
-                # Use username as fallback if no title
-                if not title:
-                    title = username
-
-                if username and password and title:
-                    accounts.append({
-                        'username': username,
-                        'password': password,
-                        'title': title,
-                        'folder': folder_name
-                    })
+        QApplication.processEvents()
 
-        return accounts
-
-    def show_epic_account_list(self):
-        """Show list of Epic Games accounts with proper styling"""
-        self.clear_layout()
-
-        # Title section
-        title_layout = QVBoxLayout()
-        title_layout.setSpacing(5)
-
-        from gui.widgets.modern_widgets import LogoWidget
-        logo_label = LogoWidget()
-        title_layout.addWidget(logo_label)
-
-        app_title = QLabel("TheVault")
-        app_title.setFont(QFont("Segoe UI", 28, QFont.Weight.Bold))
-        app_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        app_title.setStyleSheet("color: #ffffff; background: transparent;")
-
-        subtitle = QLabel("Select Epic Games Account")
-        subtitle.setFont(QFont("Segoe UI", 14))
-        subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        subtitle.setObjectName("subtitle")
-        subtitle.setStyleSheet("color: #b0b0b0; background: transparent;")
-
-        title_layout.addWidget(app_title)
-        title_layout.addWidget(subtitle)
-
-        title_widget = QWidget()
-        title_widget.setObjectName("titleWidget")
-        title_widget.setLayout(title_layout)
-        self.layout.addWidget(title_widget)
-
-        self.layout.addSpacing(10)
-
-        # Find Epic accounts
-        accounts = self.find_epic_accounts()
-
-        if not accounts:
-            no_accounts = QLabel("No Epic Games accounts found")
-            no_accounts.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            no_accounts.setStyleSheet("color: #888888; font-size: 14px; background: transparent;")
-            self.layout.addWidget(no_accounts)
-
-            instruction = QLabel("Create accounts in folders named:\n'Epic', 'Epic Games', or 'epicgames'")
-            instruction.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            instruction.setStyleSheet("color: #b0b0b0; font-size: 12px; font-style: italic; background: transparent;")
-            self.layout.addWidget(instruction)
-        else:
-            from PyQt6.QtWidgets import QScrollArea
-
-            scroll_area = QScrollArea()
-            scroll_area.setWidgetResizable(True)
-            scroll_area.setFixedHeight(220)
-            scroll_area.setHorizontalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAlwaysOff)
-            scroll_area.setVerticalScrollBarPolicy(Qt.ScrollBarPolicy.ScrollBarAsNeeded)
-            scroll_area.setStyleSheet("""
-                QScrollArea {
-                    border: none;
-                    background: transparent;
-                }
-                QScrollArea > QWidget > QWidget {
-                    background: transparent;
-                }
-                QScrollBar:vertical {
-                    background: rgba(255, 255, 255, 0.1);
-                    width: 12px;
-                    border-radius: 6px;
-                    margin: 0px;
-                }
-                QScrollBar::handle:vertical {
-                    background: rgba(255, 255, 255, 0.3);
-                    border-radius: 6px;
-                    min-height: 20px;
-                }
-                QScrollBar::handle:vertical:hover {
-                    background: rgba(255, 255, 255, 0.5);
-                }
-                QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-                    border: none;
-                    background: none;
-                    height: 0px;
-                }
-            """)
-
-            accounts_widget = QWidget()
-            accounts_widget.setStyleSheet("background: transparent;")
-            accounts_layout = QVBoxLayout(accounts_widget)
-            accounts_layout.setSpacing(8)
-            accounts_layout.setContentsMargins(5, 5, 5, 5)
-
-            # Add account buttons
-            for account in accounts:
-                account_btn = QPushButton(account['title'])
-                account_btn.setFixedHeight(40)
-                account_btn.setStyleSheet("""
-                    QPushButton {
-                        background: rgba(255, 255, 255, 0.08);
-                        border: 1px solid rgba(255, 255, 255, 0.15);
-                        border-radius: 8px;
-                        color: #ffffff;
-                        font-weight: bold;
-                        font-size: 12px;
-                        text-align: left;
-                        padding-left: 15px;
-                    }
-                    QPushButton:hover {
-                        background: rgba(255, 255, 255, 0.15);
-                        border: 1px solid rgba(255, 255, 255, 0.25);
-                    }
-                    QPushButton:pressed {
-                        background: rgba(255, 255, 255, 0.2);
-                    }
-                """)
-                account_btn.clicked.connect(lambda checked, acc=account: self.select_epic_account(acc))
-                accounts_layout.addWidget(account_btn)
-
-            accounts_layout.addStretch()
-            scroll_area.setWidget(accounts_widget)
-            self.layout.addWidget(scroll_area)
-
-        self.layout.addSpacing(25)
-
-        # Cancel button
-        cancel_btn = QPushButton("Cancel")
-        cancel_btn.setMinimumHeight(45)
-        cancel_btn.setFont(QFont("Segoe UI", 11, QFont.Weight.Medium))
-        cancel_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.1);
-                color: #ffffff;
-                border: 2px solid rgba(255, 255, 255, 0.25);
-                border-radius: 12px;
-                padding: 12px 24px;
-                font-weight: 600;
-                text-transform: uppercase;
-                letter-spacing: 1px;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.15);
-                border: 2px solid rgba(255, 255, 255, 0.35);
-            }
-            QPushButton:pressed {
-                background: rgba(255, 255, 255, 0.2);
-            }
-        """)
-        cancel_btn.clicked.connect(self.close_overlay)
-        self.layout.addWidget(cancel_btn)
-
-    def select_epic_account(self, account):
-        """Fill selected Epic Games account"""
-        print(f"Selected Epic account: {account['title']}")
+    def select_account(self, account):
+        """Fill the selected account into the launcher"""
+        profile = self.profile
+        print(f"Selected {profile.game_name} account: {account['title']}")
 
         try:
-            import pyautogui
-            import time
-
-            self.hide()
-            time.sleep(0.5)
-
-            # Epic Games specific autofill logic
-            # Stage 1: Email
-            pyautogui.hotkey('ctrl', 'a')
-            pyautogui.typewrite(account['username'])
-            pyautogui.press('enter')
+            from game_integration import injection
 
-            # Stage 2: Password
-            time.sleep(1)  # Wait for password screen to load
-            pyautogui.press('tab')
-            pyautogui.typewrite(account['password'])
+            self._hide_for_fill()
+            injection.CredentialInjector().run(profile.fill_steps, account)
 
-            # 3 tabs to sign-in button
-            for i in range(3):
-                pyautogui.press('tab')
-            pyautogui.press('enter')
+            print(f"{profile.game_name} account filled successfully!")
 
-            print("Epic account filled successfully!")
+            from gui.analytics_manager import track_autofill_success
+            track_autofill_success(profile.analytics_name)
 
-            # Track analytics for Epic Games
-            from gui.analytics_manager import track_epic_autofill_success
-            track_epic_autofill_success()
+            from core.activity_log import log_activity, AUTOFILL
+            log_activity(AUTOFILL, title=account['title'], folder=account['folder'],
+                         entry_id=account.get('entry_id'), game=profile.game_name)
 
             self.close_overlay()
 
         except Exception as e:
-            print(f"Epic fill error: {e}")
-            from gui.analytics_manager import track_epic_autofill_error
-            track_epic_autofill_error("autofill_failed")
-            self.show_error("Failed to fill Epic Games account")
+            print(f"{profile.game_name} fill error: {e}")
+            from gui.analytics_manager import track_autofill_error
+            track_autofill_error(profile.analytics_name, "autofill_failed")
+            self.show_error(f"Failed to fill {profile.game_name} account")
 
-    def standardize_epic_window(self):
-        """Standardize Epic Games window to known size and position"""
+    def standardize_window(self):
+        """Resize the launcher window to the profile's standard size and center it"""
         try:
-            import pygetwindow as gw
+            from game_integration.background_monitor.launcher_monitor import find_window
 
-            windows = gw.getWindowsWithTitle("Epic Games Launcher")
-            if not windows:
+            profile = self.profile
+            window = find_window(profile)
+            if window is None:
                 return False
 
-            epic_window = windows[0]
-
             # Standard size and position
-            standard_width = 1200
-            standard_height = 800
+            standard_width, standard_height = profile.standard_size
 
             # Center on screen
             from PyQt6.QtGui import QGuiApplication
@@ -829,145 +556,117 @@ class VaultOverlay(QWidget):
             standard_x = (screen.width() - standard_width) // 2
             standard_y = (screen.height() - standard_height) // 2
 
-            # Resize and move Epic window
-            epic_window.resizeTo(standard_width, standard_height)
-            epic_window.moveTo(standard_x, standard_y)
+            window.resizeTo(standard_width, standard_height)
+            window.moveTo(standard_x, standard_y)
 
-            print(f"Epic window standardized to {standard_width}x{standard_height} at ({standard_x}, {standard_y})")
+            print(f"{profile.display_name} window standardized to {standard_width}x{standard_height} "
+                  f"at ({standard_x}, {standard_y})")
             return True
 
         except Exception as e:
-            print(f"Failed to standardize Epic window: {e}")
+            print(f"Failed to standardize {self.profile.display_name} window: {e}")
             return False
 
-    def show_epic_mode_selection(self):
-        """Show Epic-specific Auto-Fill Mode vs Exit choice"""
-        self.clear_layout()
+    def handle_autofill_mode(self):
+        """Handle Auto-Fill Mode selection - resize and close, wait for new click"""
+        print(f"{self.profile.display_name} Auto-Fill Mode selected - resizing window")
 
-        # Title section
-        title_layout = QVBoxLayout()
-        title_layout.setSpacing(5)
+        if not self.standardize_window():
+            self.show_error(f"Failed to standardize {self.profile.display_name} window")
+            return
 
-        from gui.widgets.modern_widgets import LogoWidget
-        logo_label = LogoWidget()
-        title_layout.addWidget(logo_label)
+        print(f"{self.profile.display_name} window resized - closing overlay, waiting for username field click")
 
-        app_title = QLabel("TheVault")
-        app_title.setFont(QFont("Segoe UI", 28, QFont.Weight.Bold))
-        app_title.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        app_title.setStyleSheet("color: #ffffff; background: transparent;")
+        # Hide overlay and reset flag without disabling detection
+        self.hide()
 
-        subtitle = QLabel("Epic Games Auto-Fill")
-        subtitle.setFont(QFont("Segoe UI", 14))
-        subtitle.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        subtitle.setObjectName("subtitle")
-        subtitle.setStyleSheet("color: #b0b0b0; background: transparent;")
+        # Reset the overlay shown flag so user can trigger again
+        detectors = getattr(self.main_app, 'launcher_detectors', {})
+        if self.profile.name in detectors:
+            detectors[self.profile.name].reset_overlay_flag_after_resize()
 
-        title_layout.addWidget(app_title)
-        title_layout.addWidget(subtitle)
+    # =============================================================================
+    # WINDOW
+    # =============================================================================
 
-        title_widget = QWidget()
-        title_widget.setObjectName("titleWidget")
-        title_widget.setLayout(title_layout)
-        self.layout.addWidget(title_widget)
+    def show_error(self, message):
+        error_label = self.error_labels.get(self.stack.currentWidget())
+        if error_label:
+            error_label.setText(message)
+            error_label.show()
 
-        self.layout.addSpacing(20)
+    def center_on_screen(self):
+        from PyQt6.QtGui import QGuiApplication
+        screen = QGuiApplication.primaryScreen().geometry()
+        x = (screen.width() - self.width()) // 2
+        y = (screen.height() - self.height()) // 2
+        self.move(x, y)
 
-        # Message
-        message = QLabel("Epic's resizable window requires standardization for reliable auto-fill")
-        message.setAlignment(Qt.AlignmentFlag.AlignCenter)
-        message.setStyleSheet("color: #ffffff; font-size: 12px; background: transparent;")
-        message.setWordWrap(True)
-        self.layout.addWidget(message)
-
-        self.layout.addSpacing(30)
-
-        # Auto-Fill Mode button
-        autofill_btn = QPushButton("Auto-Fill Mode")
-        autofill_btn.setMinimumHeight(50)
-        autofill_btn.setFont(QFont("Segoe UI", 12, QFont.Weight.Medium))
-        autofill_btn.setStyleSheet("""
-            QPushButton {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #4CAF50, stop:1 #45a049);
-                color: white;
-                border: none;
-                border-radius: 12px;
-                padding: 15px 30px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background: qlineargradient(x1:0, y1:0, x2:1, y2:0,
-                    stop:0 #45a049, stop:1 #3d8b40);
-            }
-            QPushButton:pressed {
-                background: #3d8b40;
-            }
-        """)
-        autofill_btn.clicked.connect(self.handle_epic_autofill_mode)
-        self.layout.addWidget(autofill_btn)
-
-        self.layout.addSpacing(15)
-
-        # Exit button
-        exit_btn = QPushButton("Exit")
-        exit_btn.setMinimumHeight(45)
-        exit_btn.setFont(QFont("Segoe UI", 11, QFont.Weight.Medium))
-        exit_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.1);
-                color: #ffffff;
-                border: 2px solid rgba(255, 255, 255, 0.25);
-                border-radius: 12px;
-                padding: 12px 24px;
-                font-weight: 600;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.15);
-                border: 2px solid rgba(255, 255, 255, 0.35);
-            }
-            QPushButton:pressed {
-                background: rgba(255, 255, 255, 0.2);
-            }
-        """)
-        exit_btn.clicked.connect(self.close_overlay)
-        self.layout.addWidget(exit_btn)
-
-        self.layout.addStretch()
-
-        def close_overlay(self):
-            """Close the overlay and reset detection"""
-            print("Epic overlay closed by user")
-
-            # Track cancellation
-            from gui.analytics_manager import track_epic_autofill_cancelled
-            track_epic_autofill_cancelled()
-
-            self.hide()
-            self.finished.emit()
-
-        """Handle Auto-Fill Mode selection"""
-        print("Epic Auto-Fill Mode selected")
-
-        # Standardize Epic window first
-        if not self.standardize_epic_window():
-            self.show_error("Failed to standardize Epic window")
-            return
+    def show_overlay(self, needs_resize=False):
+        """Show the popup, skipping the password if the vault is already open"""
+        from gui.analytics_manager import track_autofill_triggered
+        track_autofill_triggered(self.profile.analytics_name)
 
-    def handle_epic_autofill_mode(self):
-        """Handle Auto-Fill Mode selection - resize and close, wait for new click"""
-        print("Epic Auto-Fill Mode selected - resizing window")
+        if needs_resize and self.resize_page is not None:
+            self.show_resize_prompt()
+        elif self.is_vault_already_open():
+            self.load_vault_from_main_app()
+            self.show_account_list()
+        else:
+            self.show_vault_login()
 
-        # Standardize Epic window
-        if not self.standardize_epic_window():
-            self.show_error("Failed to standardize Epic window")
-            return
+        self.show()
+        self.raise_()
+        self.activateWindow()
 
-        print("Epic window resized - closing overlay, waiting for username field click")
+    def close_overlay(self):
+        """Close the overlay and reset detection"""
+        from gui.analytics_manager import track_autofill_cancelled
+        track_autofill_cancelled(self.profile.analytics_name)
 
-        # Hide overlay and reset flag without disabling detection
+        # Rows keep no credentials while hidden
+        self._update_account_rows([])
         self.hide()
+        self.finished.emit()
 
-        # Reset the overlay shown flag so user can trigger again
-        if hasattr(self, 'main_app') and hasattr(self.main_app, 'epic_detector'):
-            self.main_app.epic_detector.reset_overlay_flag_after_resize()
\ No newline at end of file
+
+def _first_field(entry, fields):
+    for field in fields:
+        if field in entry and entry[field]:
+            return entry[field]
+    return None
+
+
+class OverlayPool:
+    """Overlays built while the app is idle and reused for every trigger"""
+
+    def __init__(self, main_app):
+        self.main_app = main_app
+        self._overlays = {}
+        self._setup = {}
+
+    def register(self, name, setup=None):
+        """Declare an overlay, setup(overlay) runs once when it is built"""
+        self._setup[name] = setup
+
+    def get(self, name):
+        overlay = self._overlays.get(name)
+        if overlay is None:
+            overlay = VaultOverlay(get_profile(name), main_app=self.main_app)
+            setup = self._setup.get(name)
+            if setup:
+                setup(overlay)
+            self._overlays[name] = overlay
+        return overlay
+
+    def built(self):
+        """Overlays created so far"""
+        return list(self._overlays.values())
+
+    def warm(self):
+        """Build one missing overlay per event loop turn so startup input stays responsive"""
+        missing = [name for name in self._setup if name not in self._overlays]
+        if missing:
+            self.get(missing[0])
+            if len(missing) > 1:
+                QTimer.singleShot(0, self.warm)
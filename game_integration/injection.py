@@ -0,0 +1,396 @@
+"""
+Credential injection into launcher login forms.
+
+A fill is a short list of steps (text, key presses, waits) run against an
+InjectionBackend. On Windows the default backend sends each text field as a
+single batched SendInput call of Unicode key events. Elsewhere it uses
+pyautogui without its per-call pause. Text can also be pasted through the
+clipboard, and the previous clipboard contents are put back afterwards. On
+Windows a pasted value is marked so clipboard history and cloud clipboard
+sync never keep it.
+FakeBackend records the events instead of sending them, for trying fill
+sequences without a desktop session.
+"""
+
+import sys
+import time
+from abc import ABC, abstractmethod
+
+from config import register_setting
+
+TYPE = "type"
+PASTE = "paste"
+
+# Account values a field() step can refer to
+USERNAME_FIELD = "username"
+PASSWORD_FIELD = "password"
+
+# Time for the launcher to read a pasted value before the clipboard is restored
+PASTE_SETTLE_SECONDS = 0.05
+
+CF_UNICODETEXT = 13
+GMEM_MOVEABLE = 0x0002
+CLIPBOARD_OPEN_ATTEMPTS = 10
+
+register_setting("autofill_method", str, TYPE)
+register_setting("autofill_key_interval_ms", int, 0)
+register_setting("autofill_focus_delay_ms", int, 100)
+register_setting("autofill_backend", str, None)
+
+
+# =============================================================================
+# FILL STEPS
+# =============================================================================
+
+def text(value):
+    return ("text", value)
+
+
+def field(name):
+    """Text taken from the values passed to run(), so fill sequences can be declared up front"""
+    return ("field", name)
+
+
+def key(name):
+    return ("key", name)
+
+
+def hotkey(*names):
+    return ("hotkey", names)
+
+
+def wait(seconds):
+    return ("wait", seconds)
+
+
+# =============================================================================
+# BACKENDS
+# =============================================================================
+
+class InjectionBackend(ABC):
+    """Sends input to whichever window has focus"""
+    name = "backend"
+
+    @abstractmethod
+    def write(self, value, interval=0.0):
+        raise NotImplementedError
+
+    @abstractmethod
+    def press(self, key_name):
+        raise NotImplementedError
+
+    @abstractmethod
+    def hotkey(self, *key_names):
+        raise NotImplementedError
+
+    def get_clipboard(self):
+        import pyperclip
+        return pyperclip.paste()
+
+    def set_clipboard(self, value):
+        import pyperclip
+        pyperclip.copy(value)
+
+    def set_private_clipboard(self, value):
+        """Clipboard write for secrets, kept out of clipboard history where the OS allows it"""
+        if sys.platform == "win32":
+            set_windows_private_clipboard(value)
+        else:
+            self.set_clipboard(value)
+
+    def sleep(self, seconds):
+        if seconds > 0:
+            time.sleep(seconds)
+
+
+class PyAutoGuiBackend(InjectionBackend):
+    name = "pyautogui"
+
+    def __init__(self):
+        import pyautogui
+        self._pyautogui = pyautogui
+
+    def write(self, value, interval=0.0):
+        # _pause=False skips pyautogui's PAUSE after every call
+        self._pyautogui.write(value, interval=interval, _pause=False)
+
+    def press(self, key_name):
+        self._pyautogui.press(key_name, _pause=False)
+
+    def hotkey(self, *key_names):
+        self._pyautogui.hotkey(*key_names, _pause=False)
+
+
+class SendInputBackend(InjectionBackend):
+    """Windows SendInput, a whole string goes out as one batch of Unicode key events"""
+    name = "sendinput"
+
+    INPUT_KEYBOARD = 1
+    KEYEVENTF_KEYUP = 0x0002
+    KEYEVENTF_UNICODE = 0x0004
+    VIRTUAL_KEYS = {"tab": 0x09, "enter": 0x0D, "ctrl": 0x11, "shift": 0x10, "alt": 0x12, "esc": 0x1B}
+
+    def __init__(self):
+        import ctypes
+        from ctypes import wintypes
+
+        class KEYBDINPUT(ctypes.Structure):
+            _fields_ = [("wVk", wintypes.WORD), ("wScan", wintypes.WORD), ("dwFlags", wintypes.DWORD),
+                        ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t)]
+
+        class MOUSEINPUT(ctypes.Structure):
+            # Only here so the union has the size Windows expects
+            _fields_ = [("dx", wintypes.LONG), ("dy", wintypes.LONG), ("mouseData", wintypes.DWORD),
+                        ("dwFlags", wintypes.DWORD), ("time", wintypes.DWORD), ("dwExtraInfo", ctypes.c_size_t)]
+
+        class INPUTUNION(ctypes.Union):
+            _fields_ = [("ki", KEYBDINPUT), ("mi", MOUSEINPUT)]
+
+        class INPUT(ctypes.Structure):
+            _fields_ = [("type", wintypes.DWORD), ("union", INPUTUNION)]
+
+        self._ctypes = ctypes
+        self._keybdinput = KEYBDINPUT
+        self._input = INPUT
+        self._send_input = ctypes.windll.user32.SendInput
+
+    def _event(self, virtual_key=0, scan=0, flags=0):
+        event = self._input(type=self.INPUT_KEYBOARD)
+        event.union.ki = self._keybdinput(wVk=virtual_key, wScan=scan, dwFlags=flags, time=0, dwExtraInfo=0)
+        return event
+
+    def _send(self, events):
+        if not events:
+            return
+        array = (self._input * len(events))(*events)
+        sent = self._send_input(len(events), array, self._ctypes.sizeof(self._input))
+        if sent != len(events):
+            raise OSError(f"SendInput delivered {sent} of {len(events)} events")
+
+    def _virtual_key(self, key_name):
+        key_name = key_name.lower()
+        if key_name in self.VIRTUAL_KEYS:
+            return self.VIRTUAL_KEYS[key_name]
+        if len(key_name) == 1 and key_name.isalnum():
+            return ord(key_name.upper())
+        raise ValueError(f"Unsupported key: {key_name}")
+
+    def write(self, value, interval=0.0):
+        events = []
+        for unit in _utf16_units(value):
+            events.append(self._event(scan=unit, flags=self.KEYEVENTF_UNICODE))
+            events.append(self._event(scan=unit, flags=self.KEYEVENTF_UNICODE | self.KEYEVENTF_KEYUP))
+            if interval > 0:
+                self._send(events)
+                events = []
+                time.sleep(interval)
+        self._send(events)
+
+    def press(self, key_name):
+        virtual_key = self._virtual_key(key_name)
+        self._send([self._event(virtual_key), self._event(virtual_key, flags=self.KEYEVENTF_KEYUP)])
+
+    def hotkey(self, *key_names):
+        virtual_keys = [self._virtual_key(name) for name in key_names]
+        self._send([self._event(vk) for vk in virtual_keys] +
+                   [self._event(vk, flags=self.KEYEVENTF_KEYUP) for vk in reversed(virtual_keys)])
+
+
+class FakeBackend(InjectionBackend):
+    """Records what would have been sent, nothing reaches the desktop"""
+    name = "fake"
+
+    def __init__(self, clipboard=""):
+        self.events = []
+        self.clipboard = clipboard
+
+    def write(self, value, interval=0.0):
+        self.events.append(("write", value, interval))
+
+    def press(self, key_name):
+        self.events.append(("press", key_name))
+
+    def hotkey(self, *key_names):
+        self.events.append(("hotkey", key_names))
+        if key_names == ("ctrl", "v"):
+            self.events.append(("paste", self.clipboard))
+
+    def get_clipboard(self):
+        return self.clipboard
+
+    def set_clipboard(self, value):
+        self.clipboard = value
+
+    def set_private_clipboard(self, value):
+        self.events.append(("private_clipboard", value))
+        self.clipboard = value
+
+    def sleep(self, seconds):
+        self.events.append(("sleep", seconds))
+
+
+def _utf16_units(value):
+    """SendInput takes UTF-16 code units, characters outside the BMP become surrogate pairs"""
+    encoded = value.encode('utf-16-le')
+    return [int.from_bytes(encoded[i:i + 2], 'little') for i in range(0, len(encoded), 2)]
+
+
+def set_windows_private_clipboard(value):
+    """Put text on the Windows clipboard flagged so history, cloud sync and monitors skip it"""
+    import ctypes
+    from ctypes import wintypes
+
+    user32 = ctypes.WinDLL("user32", use_last_error=True)
+    kernel32 = ctypes.WinDLL("kernel32", use_last_error=True)
+    kernel32.GlobalAlloc.argtypes = [wintypes.UINT, ctypes.c_size_t]
+    kernel32.GlobalAlloc.restype = wintypes.HGLOBAL
+    kernel32.GlobalLock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalLock.restype = wintypes.LPVOID
+    kernel32.GlobalUnlock.argtypes = [wintypes.HGLOBAL]
+    kernel32.GlobalFree.argtypes = [wintypes.HGLOBAL]
+    user32.OpenClipboard.argtypes = [wintypes.HWND]
+    user32.SetClipboardData.argtypes = [wintypes.UINT, wintypes.HANDLE]
+    user32.SetClipboardData.restype = wintypes.HANDLE
+    user32.RegisterClipboardFormatW.argtypes = [wintypes.LPCWSTR]
+    user32.RegisterClipboardFormatW.restype = wintypes.UINT
+
+    no = (0).to_bytes(4, 'little')
+    formats = [
+        (CF_UNICODETEXT, (value + "\0").encode('utf-16-le')),
+        # Its presence alone tells clipboard monitors to ignore this content
+        (user32.RegisterClipboardFormatW("ExcludeClipboardContentFromMonitorProcessing"), b"\0"),
+        (user32.RegisterClipboardFormatW("CanIncludeInClipboardHistory"), no),
+        (user32.RegisterClipboardFormatW("CanUploadToCloudClipboard"), no),
+    ]
+
+    # Another process may be holding the clipboard for a moment
+    for _ in range(CLIPBOARD_OPEN_ATTEMPTS):
+        if user32.OpenClipboard(None):
+            break
+        time.sleep(0.01)
+    else:
+        raise OSError("Clipboard is in use by another application")
+
+    try:
+        user32.EmptyClipboard()
+        for clipboard_format, data in formats:
+            handle = kernel32.GlobalAlloc(GMEM_MOVEABLE, len(data))
+            if not handle:
+                raise ctypes.WinError(ctypes.get_last_error())
+            ctypes.memmove(kernel32.GlobalLock(handle), data, len(data))
+            kernel32.GlobalUnlock(handle)
+            # The clipboard owns the memory once SetClipboardData succeeds
+            if not user32.SetClipboardData(clipboard_format, handle):
+                kernel32.GlobalFree(handle)
+                raise ctypes.WinError(ctypes.get_last_error())
+    finally:
+        user32.CloseClipboard()
+
+
+def get_injection_backend():
+    """Backend from the autofill_backend setting, else the fastest one for this platform"""
+    from config import get_setting
+
+    name = get_setting("autofill_backend")
+    if name == FakeBackend.name:
+        return FakeBackend()
+    if name == PyAutoGuiBackend.name:
+        return PyAutoGuiBackend()
+
+    if sys.platform == "win32":
+        try:
+            return SendInputBackend()
+        except Exception as e:
+            print(f"SendInput unavailable, falling back to pyautogui: {e}")
+    return PyAutoGuiBackend()
+
+
+# =============================================================================
+# INJECTOR
+# =============================================================================
+
+class CredentialInjector:
+    """Runs fill steps against a backend and reports how long they took"""
+
+    def __init__(self, backend=None, method=None, key_interval_ms=None, focus_delay_ms=None):
+        from config import get_setting
+
+        self.backend = backend or get_injection_backend()
+        self.method = method or get_setting("autofill_method")
+        self.key_interval = (key_interval_ms if key_interval_ms is not None
+                             else get_setting("autofill_key_interval_ms")) / 1000
+        self.focus_delay = (focus_delay_ms if focus_delay_ms is not None
+                            else get_setting("autofill_focus_delay_ms")) / 1000
+        self.last_timings = {}
+        self._send_seconds = 0.0
+
+    def _send(self, action, *args):
+        """Call a backend send, counting its time as injection time"""
+        start = time.perf_counter()
+        try:
+            action(*args)
+        finally:
+            self._send_seconds += time.perf_counter() - start
+
+    def _paste(self, value):
+        self._send(self.backend.set_private_clipboard, value)
+        self._send(self.backend.hotkey, "ctrl", "v")
+        self.backend.sleep(PASTE_SETTLE_SECONDS)
+
+    def run(self, steps, values=None):
+        """Wait for focus to return to the launcher, then send every step
+
+        field() steps are typed or pasted as values[name].
+        """
+        self.backend.sleep(self.focus_delay)
+
+        pasting = self.method == PASTE
+        saved_clipboard = None
+        if pasting:
+            try:
+                saved_clipboard = self.backend.get_clipboard()
+            except Exception as e:
+                print(f"Could not read clipboard before autofill: {e}")
+
+        start = time.perf_counter()
+        self._send_seconds = 0.0
+        try:
+            for kind, value in steps:
+                if kind == "field":
+                    kind, value = "text", values[value]
+
+                if kind == "text":
+                    if pasting:
+                        self._paste(value)
+                    else:
+                        self._send(self.backend.write, value, self.key_interval)
+                elif kind == "key":
+                    self._send(self.backend.press, value)
+                elif kind == "hotkey":
+                    self._send(self.backend.hotkey, *value)
+                elif kind == "wait":
+                    self.backend.sleep(value)
+                else:
+                    raise ValueError(f"Unknown fill step: {kind}")
+        finally:
+            if pasting:
+                # Never leave a password on the clipboard
+                self.backend.set_clipboard(saved_clipboard or "")
+
+        total_ms = (time.perf_counter() - start) * 1000
+        self.last_timings = {
+            "backend": self.backend.name,
+            "method": self.method,
+            "total_ms": total_ms,
+            # Only the sends themselves, waits and paste settle time are the launcher's
+            "inject_ms": self._send_seconds * 1000,
+        }
+        print(f"Autofill sent {len(steps)} steps via {self.backend.name} ({self.method}) "
+              f"in {self.last_timings['inject_ms']:.1f}ms")
+
+        try:
+            from gui.analytics_manager import update_metric
+            update_metric("performance.autofill_inject_ms", round(self.last_timings["inject_ms"], 1))
+        except Exception as e:
+            print(f"Autofill timing not recorded: {e}")
+        return self.last_timings
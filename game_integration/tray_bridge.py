@@ -10,18 +10,23 @@ class GameIntegrationBridge(QObject):
     def __init__(self):
         super().__init__()
 
-        self.riot_detector = None
+        # Launcher detectors by profile name
+        self.detectors = {}
         self.overlay_manager = None
 
         # Track monitoring state
         self.is_monitoring = False
 
-    def set_riot_detector(self, riot_detector):
-        self.riot_detector = riot_detector
+    def add_detector(self, detector):
+        self.detectors[detector.profile.name] = detector
 
-        if hasattr(riot_detector, 'username_field_detected'):
-            riot_detector.username_field_detected.connect(self._on_riot_field_detected)
-            print("Bridge: Connected to RiotDetector signals")
+        name = detector.profile.display_name
+        detector.username_field_detected.connect(lambda: self._on_field_detected(name))
+        print(f"Bridge: Connected to {name} detector signals")
+
+    def set_detectors(self, detectors):
+        for detector in detectors:
+            self.add_detector(detector)
 
     def set_overlay_manager(self, overlay_manager):
         self.overlay_manager = overlay_manager
@@ -31,67 +36,27 @@ class GameIntegrationBridge(QObject):
         """Start all game monitoring systems"""
         self.is_monitoring = True
 
-        if self.riot_detector and hasattr(self.riot_detector, 'start_monitoring'):
-            self.riot_detector.start_monitoring()
-            print("Bridge: Started Riot monitoring")
-
-        # Add Epic monitoring
-        if self.epic_detector and hasattr(self.epic_detector, 'start_monitoring'):
-            self.epic_detector.start_monitoring()
-            print("Bridge: Started Epic monitoring")
-
-    def stop_monitoring(self):
-        """Stop all game monitoring systems"""
-        self.is_monitoring = False
-
-        if self.riot_detector and hasattr(self.riot_detector, 'stop_monitoring'):
-            self.riot_detector.stop_monitoring()
-            print("Bridge: Stopped Riot monitoring")
-
-        # Add Epic monitoring
-        if self.epic_detector and hasattr(self.epic_detector, 'stop_monitoring'):
-            self.epic_detector.stop_monitoring()
-            print("Bridge: Stopped Epic monitoring")
-
-    def get_monitoring_status(self):
-        """Get overall monitoring status"""
-        statuses = []
-
-        if self.is_riot_monitoring_active():
-            statuses.append("Riot active")
-
-        if self.is_epic_monitoring_active():
-            statuses.append("Epic active")
-
-        if statuses:
-            return "; ".join(statuses)
-        elif self.is_monitoring:
-            return "Game integration ready"
-        else:
-            return "Game integration stopped"
-
+        for detector in self.detectors.values():
+            detector.start_monitoring()
+            print(f"Bridge: Started {detector.profile.display_name} monitoring")
 
     def stop_monitoring(self):
         """Stop all game monitoring systems"""
         self.is_monitoring = False
 
-        if self.riot_detector and hasattr(self.riot_detector, 'stop_monitoring'):
-            self.riot_detector.stop_monitoring()
-            print("Bridge: Stopped Riot monitoring")
+        for detector in self.detectors.values():
+            detector.stop_monitoring()
+            print(f"Bridge: Stopped {detector.profile.display_name} monitoring")
 
-
-    def is_riot_monitoring_active(self):
-        """Check if Riot monitoring is active"""
-        if self.riot_detector and hasattr(self.riot_detector, 'monitoring'):
-            return self.riot_detector.monitoring
-        return False
+    def is_monitoring_active(self, name):
+        """Check if monitoring is active for one launcher profile"""
+        detector = self.detectors.get(name)
+        return bool(detector and detector.monitoring)
 
     def get_monitoring_status(self):
         """Get overall monitoring status"""
-        statuses = []
-
-        if self.is_riot_monitoring_active():
-            statuses.append("Riot active")
+        statuses = [f"{detector.profile.display_name} active"
+                    for detector in self.detectors.values() if detector.monitoring]
 
         if statuses:
             return "; ".join(statuses)
@@ -100,9 +65,8 @@ class GameIntegrationBridge(QObject):
         else:
             return "Game integration stopped"
 
-    def _on_riot_field_detected(self):
-        print("Bridge: Riot username field detected by existing detector")
-
+    def _on_field_detected(self, game_name):
+        print(f"Bridge: {game_name} username field detected")
 
     def notify_overlay_shown(self, game_name="Riot Client"):
         print(f"Bridge: Overlay shown for {game_name}")
@@ -120,26 +84,10 @@ class GameIntegrationBridge(QObject):
         print(f"Bridge: Autofill error in {game_name}: {error_message}")
         self.autofill_error.emit(game_name, error_message)
 
-    def initialize_with_existing_systems(self, riot_detector=None, overlay_manager=None):
+    def initialize_with_existing_systems(self, detectors=None, overlay_manager=None):
         """Helper method to set both systems at once"""
-        if riot_detector:
-            self.set_riot_detector(riot_detector)
+        if detectors:
+            self.set_detectors(detectors)
         if overlay_manager:
             self.set_overlay_manager(overlay_manager)
         print("Bridge: Initialized with existing game systems")
-
-    def set_epic_detector(self, epic_detector):
-        self.epic_detector = epic_detector
-
-        if hasattr(epic_detector, 'username_field_detected'):
-            epic_detector.username_field_detected.connect(self._on_epic_field_detected)
-            print("Bridge: Connected to EpicDetector signals")
-
-    def _on_epic_field_detected(self):
-        print("Bridge: Epic username field detected by existing detector")
-
-    def is_epic_monitoring_active(self):
-        """Check if Epic monitoring is active"""
-        if self.epic_detector and hasattr(self.epic_detector, 'monitoring'):
-            return self.epic_detector.monitoring
-        return False
\ No newline at end of file
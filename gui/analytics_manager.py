@@ -86,6 +86,7 @@ class AnalyticsManager:
                         "avg_startup_time_ms": 0,
                         "vault_decrypt_time_ms": 0,
                         "avg_save_time_ms": 0,
+                        "autofill_inject_ms": 0,
                     }
                 }
                 self.save_data_locally()
@@ -94,25 +95,17 @@ class AnalyticsManager:
             import traceback
             raise
 
-    def send_to_oracle():
+    def send_to_oracle(self):
+        """Queue the current snapshot for the background uploader"""
         try:
-            manager = get_or_create_manager()
-            if not manager or not manager.analytics_data.get("consent_given", False):
+            if not self.analytics_data or not self.analytics_data.get("consent_given", False):
                 return False
 
-            import requests
-            response = requests.post(
-                "http://141.148.36.8/analytics",
-                json=manager.analytics_data,
-                timeout=10
-            )
-
-            if response.status_code == 200:
-                print("Analytics sent to Oracle successfully")
-                return True
-            else:
-                print(f"Oracle send failed: {response.status_code}")
-                return False
+            from .analytics_uploader import get_uploader
+            uploader = get_uploader()
+            queued = uploader.enqueue(dict(self.analytics_data))
+            uploader.start()
+            return queued
 
         except Exception as e:
             print(f"Oracle send failed: {e}")
@@ -204,13 +197,15 @@ def update_vault_stats(vault_data: dict):
     if not vault_data or not isinstance(vault_data, dict):
         return
 
+    from core.vault_format import entry_count
+
     total_passwords = 0
     total_folders = len(vault_data)
     largest_folder_size = 0
 
     for folder_name, folder_data in vault_data.items():
-        entries = folder_data.get("entries", [])
-        folder_size = len(entries)
+        # Counts come from the folder index, nothing is decrypted
+        folder_size = entry_count(folder_data)
         total_passwords += folder_size
         largest_folder_size = max(largest_folder_size, folder_size)
 
@@ -313,116 +308,57 @@ def should_collect_analytics():
     except Exception as e:
         return False
 
-def track_valorant_autofill_triggered():
-    """Track when auto-fill overlay appears"""
+def _autofill_usage(manager, game):
+    """Feature usage counters for one launcher profile, created on first use"""
+    usage = manager.analytics_data["feature_usage"]
+    for metric, default in (("triggered_count", 0), ("successful_fills", 0), ("cancelled_count", 0),
+                            ("error_count", 0), ("first_used", None), ("last_used", None)):
+        usage.setdefault(f"{game}_autofill_{metric}", default)
+    return usage
+
+
+def track_autofill_triggered(game):
+    """Track when a launcher's auto-fill overlay appears"""
     manager = get_or_create_manager()
     if not manager:
         return
 
-    manager.analytics_data["feature_usage"]["valorant_autofill_triggered_count"] += 1
+    usage = _autofill_usage(manager, game)
+    usage[f"{game}_autofill_triggered_count"] += 1
 
     # Set first use timestamp
-    if not manager.analytics_data["feature_usage"]["valorant_autofill_first_used"]:
-        manager.analytics_data["feature_usage"]["valorant_autofill_first_used"] = datetime.now().isoformat()
+    if not usage[f"{game}_autofill_first_used"]:
+        usage[f"{game}_autofill_first_used"] = datetime.now().isoformat()
 
-    manager.analytics_data["feature_usage"]["valorant_autofill_last_used"] = datetime.now().isoformat()
+    usage[f"{game}_autofill_last_used"] = datetime.now().isoformat()
     manager.save_data_locally()
 
 
-def track_valorant_autofill_success():
+def track_autofill_success(game):
     """Track successful credential filling"""
     manager = get_or_create_manager()
     if not manager:
         return
 
-    manager.analytics_data["feature_usage"]["valorant_autofill_successful_fills"] += 1
+    _autofill_usage(manager, game)[f"{game}_autofill_successful_fills"] += 1
     manager.save_data_locally()
 
 
-def track_valorant_autofill_cancelled():
+def track_autofill_cancelled(game):
     """Track when user cancels auto-fill"""
     manager = get_or_create_manager()
     if not manager:
         return
 
-    manager.analytics_data["feature_usage"]["valorant_autofill_cancelled_count"] += 1
+    _autofill_usage(manager, game)[f"{game}_autofill_cancelled_count"] += 1
     manager.save_data_locally()
 
 
-def track_valorant_autofill_error(error_type):
+def track_autofill_error(game, error_type):
     """Track auto-fill errors"""
     manager = get_or_create_manager()
     if not manager:
         return
 
-    manager.analytics_data["feature_usage"]["valorant_autofill_error_count"] += 1
+    _autofill_usage(manager, game)[f"{game}_autofill_error_count"] += 1
     manager.save_data_locally()
-
-def track_epic_autofill_triggered():
-    """Track when Epic Games auto-fill overlay appears"""
-    manager = get_or_create_manager()
-    if not manager:
-        return
-
-    # Initialize Epic metrics if they don't exist
-    if "epic_autofill_triggered_count" not in manager.analytics_data["feature_usage"]:
-        manager.analytics_data["feature_usage"].update({
-            "epic_autofill_triggered_count": 0,
-            "epic_autofill_successful_fills": 0,
-            "epic_autofill_cancelled_count": 0,
-            "epic_autofill_error_count": 0,
-            "epic_autofill_first_used": None,
-            "epic_autofill_last_used": None,
-        })
-
-    manager.analytics_data["feature_usage"]["epic_autofill_triggered_count"] += 1
-
-    # Set first use timestamp
-    if not manager.analytics_data["feature_usage"]["epic_autofill_first_used"]:
-        manager.analytics_data["feature_usage"]["epic_autofill_first_used"] = datetime.now().isoformat()
-
-    manager.analytics_data["feature_usage"]["epic_autofill_last_used"] = datetime.now().isoformat()
-    manager.save_data_locally()
-
-
-def track_epic_autofill_success():
-    """Track successful Epic Games credential filling"""
-    manager = get_or_create_manager()
-    if not manager:
-        return
-
-    # Initialize if needed
-    if "epic_autofill_successful_fills" not in manager.analytics_data["feature_usage"]:
-        manager.analytics_data["feature_usage"]["epic_autofill_successful_fills"] = 0
-
-    manager.analytics_data["feature_usage"]["epic_autofill_successful_fills"] += 1
-    manager.save_data_locally()
-
-
-def track_epic_autofill_cancelled():
-    """Track when user cancels Epic Games auto-fill"""
-    manager = get_or_create_manager()
-    if not manager:
-        return
-
-    # Initialize if needed
-    if "epic_autofill_cancelled_count" not in manager.analytics_data["feature_usage"]:
-        manager.analytics_data["feature_usage"]["epic_autofill_cancelled_count"] = 0
-
-    manager.analytics_data["feature_usage"]["epic_autofill_cancelled_count"] += 1
-    manager.save_data_locally()
-
-
-def track_epic_autofill_error(error_type):
-    """Track Epic Games auto-fill errors"""
-    manager = get_or_create_manager()
-    if not manager:
-        return
-
-    # Initialize if needed
-    if "epic_autofill_error_count" not in manager.analytics_data["feature_usage"]:
-        manager.analytics_data["feature_usage"]["epic_autofill_error_count"] = 0
-
-    manager.analytics_data["feature_usage"]["epic_autofill_error_count"] += 1
-    manager.save_data_locally()
-
@@ -0,0 +1,224 @@
+import json
+import os
+import random
+import threading
+import time
+
+
+ANALYTICS_ENDPOINT = "http://141.148.36.8/analytics"
+
+
+def get_spool_file_path():
+    """Get writable path for the pending analytics spool"""
+    from .analytics_manager import get_analytics_file_path
+    return os.path.join(os.path.dirname(get_analytics_file_path()), "analytics_spool.jsonl")
+
+
+class AnalyticsUploader:
+    """Background sender that drains an on-disk spool of analytics payloads"""
+
+    def __init__(self, endpoint=ANALYTICS_ENDPOINT, spool_path=None, batch_size=20,
+                 timeout=10, base_delay=2.0, max_delay=300.0, on_sent=None):
+        self.endpoint = endpoint
+        self.spool_path = spool_path or get_spool_file_path()
+        self.batch_size = batch_size
+        self.timeout = timeout
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.on_sent = on_sent
+
+        self._lock = threading.Lock()
+        self._wake = threading.Event()
+        self._stopping = threading.Event()
+        self._idle = threading.Event()
+        self._idle.set()
+        self._thread = None
+        self._failures = 0
+
+    # =============================================================================
+    # SPOOL
+    # =============================================================================
+
+    def enqueue(self, payload):
+        """Persist a payload to the spool and wake the sender"""
+        try:
+            with self._lock:
+                with open(self.spool_path, 'a', encoding='utf-8') as f:
+                    f.write(json.dumps(payload) + "\n")
+            self._idle.clear()
+            self._wake.set()
+            return True
+        except Exception as e:
+            print(f"Failed to spool analytics: {e}")
+            return False
+
+    def pending_count(self):
+        with self._lock:
+            return len(self._read_spool())
+
+    def _read_spool(self):
+        if not os.path.exists(self.spool_path):
+            return []
+
+        records = []
+        with open(self.spool_path, 'r', encoding='utf-8') as f:
+            for line in f:
+                line = line.strip()
+                if not line:
+                    continue
+                try:
+                    records.append(json.loads(line))
+                except json.JSONDecodeError:
+                    # Drop lines torn by a crash mid-write
+                    continue
+        return records
+
+    def _drop_sent(self, sent_count):
+        """Remove the first sent_count records, keeping anything spooled meanwhile"""
+        with self._lock:
+            remaining = self._read_spool()[sent_count:]
+            if not remaining:
+                if os.path.exists(self.spool_path):
+                    os.remove(self.spool_path)
+                return
+
+            temp_path = self.spool_path + ".tmp"
+            with open(temp_path, 'w', encoding='utf-8') as f:
+                for record in remaining:
+                    f.write(json.dumps(record) + "\n")
+            os.replace(temp_path, self.spool_path)
+
+    def _next_batch(self):
+        """Take up to batch_size records, keeping only the newest snapshot per vault"""
+        with self._lock:
+            records = self._read_spool()[:self.batch_size]
+
+        latest = {}
+        for record in records:
+            key = record.get("vault_id") if isinstance(record, dict) else None
+            latest[key if key else id(record)] = record
+        return len(records), list(latest.values())
+
+    # =============================================================================
+    # SENDING
+    # =============================================================================
+
+    def _post(self, payload):
+        import requests
+
+        response = requests.post(self.endpoint, json=payload, timeout=self.timeout)
+        return response.status_code == 200, response.status_code
+
+    def _backoff_delay(self):
+        delay = min(self.max_delay, self.base_delay * (2 ** (self._failures - 1)))
+        return delay * random.uniform(0.5, 1.0)
+
+    def send_pending(self):
+        """Send one batch from the spool, returns True when the spool made progress"""
+        taken, batch = self._next_batch()
+        if not taken:
+            return False
+
+        # The endpoint takes one snapshot per request
+        for payload in batch:
+            ok, status = self._post(payload)
+            if not ok:
+                raise RuntimeError(f"HTTP {status}")
+
+        self._drop_sent(taken)
+        print(f"Analytics sent to Oracle successfully ({len(batch)} payload(s))")
+        if self.on_sent:
+            try:
+                self.on_sent()
+            except Exception as e:
+                print(f"Analytics sent callback failed: {e}")
+        return True
+
+    def _run(self):
+        while not self._stopping.is_set():
+            try:
+                if self.send_pending():
+                    self._failures = 0
+                    continue
+                self._idle.set()
+                self._wake.wait()
+                self._wake.clear()
+            except Exception as e:
+                self._failures += 1
+                delay = self._backoff_delay()
+                print(f"Oracle send failed: {e} - retrying in {delay:.0f}s")
+                self._stopping.wait(delay)
+
+    # =============================================================================
+    # LIFECYCLE
+    # =============================================================================
+
+    def start(self):
+        if self._thread and self._thread.is_alive():
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        self._wake.set()
+
+    def flush(self, timeout=2.0):
+        """Wait briefly for the spool to drain, anything left is sent next launch"""
+        self._wake.set()
+        return self._idle.wait(timeout)
+
+    def stop(self):
+        self._stopping.set()
+        self._wake.set()
+
+
+def main_thread_callback(callback):
+    """Wrap callback so calls from any thread run it on the Qt application's thread
+
+    The relay behind it is made on the first call, so the wrapper can be
+    created before the QApplication is.
+    """
+    lock = threading.Lock()
+    relays = []
+
+    def call():
+        from PyQt6.QtCore import QCoreApplication
+
+        app = QCoreApplication.instance()
+        if app is None:
+            # No event loop to hand the call to
+            callback()
+            return
+        with lock:
+            if not relays:
+                relays.append(_make_relay(callback, app.thread()))
+        relays[0].called.emit()
+
+    return call
+
+
+def _make_relay(callback, thread):
+    from PyQt6.QtCore import QObject, pyqtSignal
+
+    class Relay(QObject):
+        called = pyqtSignal()
+
+        def deliver(self):
+            callback()
+
+    relay = Relay()
+    # The receiver lives on the application's thread, so emits from any other thread are queued
+    relay.moveToThread(thread)
+    relay.called.connect(relay.deliver)
+    return relay
+
+
+_global_uploader = None
+
+
+def get_uploader():
+    global _global_uploader
+    if _global_uploader is None:
+        from .analytics_manager import mark_as_sent
+        # The UI thread owns analytics_data, so needs_send is cleared there
+        _global_uploader = AnalyticsUploader(on_sent=main_thread_callback(mark_as_sent))
+    return _global_uploader
@@ -19,12 +19,13 @@ from datetime import datetime
 from tray import SystemTrayManager
 from PyQt6.QtWidgets import QSystemTrayIcon
 from game_integration.tray_bridge import GameIntegrationBridge
-from game_integration.background_monitor.epic_detector import EpicDetector
 from gui.widgets.svg_icons import SvgIcon, Icons
 from discord_presence import DiscordPresence
 
 
 class TheVaultApp(QMainWindow):
+    backup_finished = pyqtSignal(bool, str)
+
     def __init__(self):
         startup_start = time.time()
         super().__init__()
@@ -46,7 +47,6 @@ class TheVaultApp(QMainWindow):
 
         self._init_game_integration_bridge()
         self._init_system_tray()
-        self._setup_signal_checking()
 
         # Start monitoring after basic init
         self.start_game_monitoring()
@@ -55,29 +55,44 @@ class TheVaultApp(QMainWindow):
 
         self.drag_position = None
 
-    def _setup_signal_checking(self):
-        """Check for signals from other instances"""
-        from PyQt6.QtCore import QTimer
-        import tempfile
-        import os
+    def attach_instance_server(self, instance_server):
+        """Take commands sent by later launches of the app"""
+        self.instance_server = instance_server
+        instance_server.command_received.connect(self.handle_instance_command)
+
+    def handle_instance_command(self, command, args):
+        from gui import single_instance
+
+        print(f"Command from another launch: {command} {args}")
+        if command == single_instance.SHOW:
+            self.show_main_window()
+        elif command == single_instance.LOCK:
+            self.lock_vault()
+        elif command == single_instance.AUTOFILL:
+            name = args[0].lower() if args else "riot"
+            if name in getattr(self, 'launcher_detectors', {}):
+                self.show_autofill_overlay(name)
+            else:
+                print(f"No autofill overlay for launcher: {name}")
 
-        self.signal_timer = QTimer()
-        self.signal_timer.timeout.connect(self._check_for_signals)
-        self.signal_timer.start(1000)
+    def lock_vault(self):
+        """Forget the unlocked vault and return to the login screen"""
+        from core.activity_log import close_activity_log
 
-    def _check_for_signals(self):
-        """Check if another instance wants us to show"""
-        import tempfile
-        import os
+        vault_model = getattr(self.vault_window, 'vault_model', None)
+        if vault_model and hasattr(self, 'backup_scheduler'):
+            vault_model.unsubscribe(self.backup_scheduler.on_vault_changed)
+        self.vault_window.clear_vault_data()
+        self.security_dashboard.clear_vault_data()
+        close_activity_log()
 
-        signal_file = os.path.join(tempfile.gettempdir(), "thevault_show.signal")
+        overlay_pool = getattr(self, 'overlay_pool', None)
+        for overlay in (overlay_pool.built() if overlay_pool else []):
+            overlay.vault_data = None
+            overlay.vault_key = None
 
-        if os.path.exists(signal_file):
-            try:
-                self.show_main_window()
-                os.remove(signal_file)
-            except:
-                pass
+        # Every post-login page may be showing vault contents
+        self.show_login()
 
     def show_main_window(self):
         """Show and raise the main window (called by tray or signal)"""
@@ -88,30 +103,36 @@ class TheVaultApp(QMainWindow):
             self.showNormal()
 
     def start_game_monitoring(self):
-        """Start background game detection for Riot and Epic"""
-        # Existing Riot detection
-        from game_integration.background_monitor.riot_detector import RiotDetector
+        """Start background launcher detection for every profile with an overlay"""
+        from game_integration.background_monitor.launcher_monitor import get_launcher_scheduler
+        from game_integration.background_monitor.overlay_manager import OverlayPool
 
-        self.riot_detector = RiotDetector()
-        self.riot_detector.username_field_detected.connect(self.show_vault_overlay)
-        self.riot_detector.start_monitoring()
+        # Build the autofill overlays once the UI is idle so a detection only has to show one
+        self.overlay_pool = OverlayPool(self)
+        self.launcher_scheduler = get_launcher_scheduler()
+        self.launcher_detectors = {}
 
-        # New Epic detection
-        self.epic_detector = EpicDetector()
-        self.epic_detector.username_field_detected.connect(self.show_epic_overlay)
-        self.epic_detector.start_monitoring()
+        for name, detector in self.launcher_scheduler.detectors.items():
+            if not detector.profile.fill_steps:
+                print(f"No fill steps for {detector.profile.display_name} - not monitoring it")
+                continue
+
+            detector.username_field_detected.connect(lambda n=name: self.show_autofill_overlay(n))
+            self.overlay_pool.register(name, lambda overlay, d=detector: overlay.finished.connect(d.reset_overlay_flag))
+            self.launcher_detectors[name] = detector
+            detector.start_monitoring()
+
+        # The bridge is created first so the tray can report on these detectors
+        if hasattr(self, 'game_bridge'):
+            self.game_bridge.set_detectors(self.launcher_detectors.values())
+
+        QTimer.singleShot(1000, self.overlay_pool.warm)
 
     def _init_game_integration_bridge(self):
         """Initialize bridge for existing game integration systems"""
         self.game_bridge = GameIntegrationBridge()
 
-        if hasattr(self, 'riot_detector'):
-            self.game_bridge.set_riot_detector(self.riot_detector)
-
-        if hasattr(self, 'epic_detector'):
-            self.game_bridge.set_epic_detector(self.epic_detector)
-
-        print("Game integration bridge initialized with Riot and Epic")
+        print("Game integration bridge initialized")
 
     def _init_system_tray(self):
         """Initialize system tray functionality"""
@@ -131,67 +152,20 @@ class TheVaultApp(QMainWindow):
                     )
                     return
 
-    def show_vault_overlay(self):
-        """Show the vault overlay when username field detected"""
-        print("=== SIGNAL RECEIVED - SHOWING OVERLAY ===")
+    def show_autofill_overlay(self, name):
+        """Show a launcher's autofill overlay when its username field is detected"""
+        print(f"=== {name.upper()} SIGNAL RECEIVED - SHOWING OVERLAY ===")
 
         try:
-            from game_integration.background_monitor.overlay_manager import VaultOverlay
+            overlay = self.overlay_pool.get(name)
+            detector = self.launcher_detectors[name]
 
-            print(f"=== MAIN APP DEBUG ===")
-            print(f"self = {self}")
-            print(f"type(self) = {type(self)}")
-            print(f"About to pass self to VaultOverlay...")
-
-            if not hasattr(self, 'overlay') or self.overlay is None:
-                print("Creating new overlay...")
-                self.overlay = VaultOverlay(main_app=self)
-                self.overlay.finished.connect(self.riot_detector.reset_overlay_flag)
-
-            self.overlay.show_overlay()
+            # Field positions are only known at the profile's standard size
+            needs_resize = detector.profile.standard_size is not None and not detector.is_standard_size()
+            overlay.show_overlay(needs_resize=needs_resize)
 
         except Exception as e:
-            print(f"ERROR: {e}")
-            import traceback
-            traceback.print_exc()
-
-    def show_epic_overlay(self):
-        """Show Epic overlay - either direct autofill or mode selection"""
-        print("=== EPIC SIGNAL RECEIVED ===")
-
-        try:
-            from game_integration.background_monitor.overlay_manager import VaultOverlay
-
-            if not hasattr(self, 'epic_overlay') or self.epic_overlay is None:
-                print("Creating new Epic overlay...")
-                self.epic_overlay = VaultOverlay(main_app=self)
-                self.epic_overlay.finished.connect(self.epic_detector.reset_overlay_flag)
-
-            # Check if Epic is already standard size
-            if self.epic_detector.is_epic_standard_size():
-                print("Epic is standard size - showing direct autofill")
-                # Skip popup, go straight to vault check
-                if self.epic_overlay.is_vault_already_open():
-                    self.epic_overlay.load_vault_from_main_app()
-                    self.epic_overlay.show_epic_account_list()
-                else:
-                    self.epic_overlay.show_vault_login()
-                    self.epic_overlay.post_login_action = 'epic'
-            else:
-                print("Epic needs resize - showing mode selection")
-                # Show resize popup
-                self.epic_overlay.show_epic_mode_selection()
-
-            # Track Epic analytics
-            from gui.analytics_manager import track_epic_autofill_triggered
-            track_epic_autofill_triggered()
-
-            self.epic_overlay.show()
-            self.epic_overlay.raise_()
-            self.epic_overlay.activateWindow()
-
-        except Exception as e:
-            print(f"ERROR showing Epic overlay: {e}")
+            print(f"ERROR showing {name} overlay: {e}")
             import traceback
             traceback.print_exc()
 
@@ -552,8 +526,11 @@ class TheVaultApp(QMainWindow):
         """Switch to a specific tab view"""
         # If switching to security dashboard, pass current vault data
         if hasattr(self, 'security_dashboard') and widget == self.security_dashboard:
-            if hasattr(self, 'vault_window') and hasattr(self.vault_window, 'vault_data'):
-                self.security_dashboard.load_vault_data(self.vault_window.vault_data)
+            vault_model = getattr(self.vault_window, 'vault_model', None) if hasattr(self, 'vault_window') else None
+            if vault_model:
+                vault_model.subscribe(self.security_dashboard.on_vault_changed)
+                self.security_dashboard.vault_model = vault_model
+                self.security_dashboard.set_vault_data(vault_model.data)
 
         self.stacked_widget.setCurrentWidget(widget)
 
@@ -705,6 +682,9 @@ class TheVaultApp(QMainWindow):
             self.stacked_widget.addWidget(window)
 
     def _setup_startup_tasks(self):
+        # Rasterize the icons used by every folder/card refresh once the UI is idle
+        QTimer.singleShot(500, SvgIcon.warm_up)
+
         try:
             import dev_tools.dev_manager
             if not dev_tools.dev_manager.DEV_MODE_ACTIVE:
@@ -943,6 +923,7 @@ class TheVaultApp(QMainWindow):
         # Load vault data and switch to vault view
         self.vault_window.load_vault_data(vault_data, username, vault_key)
         self.stacked_widget.setCurrentWidget(self.vault_window)
+        self._start_backup_scheduler()
 
         # Show analytics consent if needed
         from gui.analytics_manager import has_been_prompted_for_consent
@@ -1214,12 +1195,56 @@ class TheVaultApp(QMainWindow):
     # =============================================================================
 
     def _check_for_updates_startup(self):
-        from gui.update_manager import check_for_updates, show_update_popup
-        update_info = check_for_updates()
+        from gui.update_checker import UpdateChecker
+
+        if not hasattr(self, 'update_checker'):
+            self.update_checker = UpdateChecker(self)
+            self.update_checker.update_checked.connect(self._on_update_checked)
+        self.update_checker.check_async()
 
-        if update_info['available']:
+    def _on_update_checked(self, update_info):
+        from gui.update_manager import show_update_popup
+
+        if update_info.get('available'):
             show_update_popup(self, update_info)
 
+    # =============================================================================
+    # AUTOMATIC BACKUPS
+    # =============================================================================
+
+    def _start_backup_scheduler(self):
+        from core.backup_scheduler import BackupScheduler
+        from core.backup_targets import get_backup_targets
+
+        if not hasattr(self, 'backup_scheduler'):
+            self.backup_scheduler = BackupScheduler(
+                get_backup_targets,
+                # Worker thread result, queued onto the UI thread by the signal
+                on_result=self.backup_finished.emit
+            )
+            self.backup_finished.connect(self._on_backup_finished)
+            self.backup_scheduler.start()
+
+        vault_model = getattr(self.vault_window, 'vault_model', None)
+        if vault_model:
+            vault_model.subscribe(self.backup_scheduler.on_vault_changed)
+
+
+    def _on_backup_finished(self, success, message):
+        from core.activity_log import log_activity, BACKUP
+        log_activity(BACKUP, success=success, automatic=True)
+
+        if hasattr(self, 'security_dashboard') and success:
+            self.security_dashboard.update_backup_status()
+
+        if not (hasattr(self, 'tray_manager') and self.tray_manager):
+            return
+
+        if success:
+            self.tray_manager.notifications.show_notification("Vault Backed Up", message, duration=3000)
+        else:
+            self.tray_manager.notifications.show_error("Automatic Backup Failed", message)
+
     # =============================================================================
     # EVENT HANDLERS
     # =============================================================================
@@ -1236,6 +1261,8 @@ class TheVaultApp(QMainWindow):
 
                 new_avg = (current_avg * (total_opens - 1) + duration) / total_opens
                 update_metric("install_metrics.avg_session_length_minutes", new_avg)
+
+                # Written to the spool, the uploader sends it next launch if it can't finish now
                 send_to_oracle()
                 self.session_start = None
 
@@ -1257,14 +1284,14 @@ class TheVaultApp(QMainWindow):
             event.ignore()
         else:
             self._cleanup_session()
+            if hasattr(self, 'backup_scheduler'):
+                self.backup_scheduler.stop()
             if hasattr(self, 'tray_manager') and self.tray_manager:
                 self.tray_manager.stop_monitoring()
             if hasattr(self, 'game_bridge'):
                 self.game_bridge.stop_monitoring()
-            if hasattr(self, 'riot_detector'):
-                self.riot_detector.stop_monitoring()
-            if hasattr(self, 'epic_detector'):
-                self.epic_detector.stop_monitoring()
+            if hasattr(self, 'launcher_scheduler'):
+                self.launcher_scheduler.stop()
             event.accept()
             if hasattr(self, 'discord'):
                 self.discord.disconnect()
@@ -1323,11 +1350,9 @@ def start_app_with_dev_cli():
     # Increment app opens for this session
     analytics_manager.increment_counter("install_metrics.total_app_opens")
 
-    # Check for unsent data from previous session
+    # Queue unsent data from previous session, uploaded in the background
     if analytics_manager.analytics_data.get("needs_send", False):
-        success = analytics_manager.send_to_oracle()
-        if success:
-            analytics_manager.mark_as_sent()
+        analytics_manager.send_to_oracle()
 
     app = QApplication(sys.argv)
     app.setApplicationName("TheVault")
@@ -1344,78 +1369,21 @@ def start_app_with_dev_cli():
 
 
 def start_app():
-    import tempfile
-    import os
-    import atexit
-
-    def is_process_running(pid):
-        """Check if a process is running without psutil"""
-        try:
-            if os.name == 'nt':
-                import subprocess
-                result = subprocess.run(['tasklist', '/FI', f'PID eq {pid}'],
-                                        capture_output=True, text=True)
-                return str(pid) in result.stdout
-            else:
-                os.kill(pid, 0)
-                return True
-        except (OSError, subprocess.SubprocessError):
-            return False
-
-    # Single instance detection using lock file
-    lock_file = os.path.join(tempfile.gettempdir(), "thevault.lock")
-    pid_file = os.path.join(tempfile.gettempdir(), "thevault.pid")
-
-    if os.path.exists(lock_file):
-        try:
-            with open(lock_file, 'r') as f:
-                old_pid = int(f.read().strip())
-
-            if is_process_running(old_pid):
-                print("TheVault is already running.")
+    from gui.single_instance import InstanceServer, parse_command, send_command
 
-                try:
-                    signal_file = os.path.join(tempfile.gettempdir(), "thevault_show.signal")
-                    with open(signal_file, 'w') as f:
-                        f.write("show")
-                    print("Sent show signal to existing instance.")
-                except:
-                    pass
-
-                return
-            else:
-                print("Removing stale lock file...")
-                os.remove(lock_file)
-                if os.path.exists(pid_file):
-                    os.remove(pid_file)
-
-        except (ValueError, FileNotFoundError):
-            print("Removing corrupted lock file...")
-            try:
-                os.remove(lock_file)
-                if os.path.exists(pid_file):
-                    os.remove(pid_file)
-            except:
-                pass
-
-    # Create lock file
-    with open(lock_file, 'w') as f:
-        f.write(str(os.getpid()))
+    # Qt's local sockets need the application object before anything else
+    app = QApplication(sys.argv)
 
-    # Create PID file for communication
-    with open(pid_file, 'w') as f:
-        f.write(str(os.getpid()))
+    # Hand the launch over to a running instance if there is one
+    command, args = parse_command(sys.argv)
+    if send_command(command, args):
+        print("TheVault is already running.")
+        return
 
-    def cleanup_lock():
-        try:
-            if os.path.exists(lock_file):
-                os.remove(lock_file)
-            if os.path.exists(pid_file):
-                os.remove(pid_file)
-        except:
-            pass
-
-    atexit.register(cleanup_lock)
+    instance_server = InstanceServer()
+    if not instance_server.listen() and send_command(command, args):
+        print("TheVault is already running.")
+        return
 
     try:
         load_secrets()
@@ -1435,19 +1403,26 @@ def start_app():
         update_days_since_install()
         update_opens_last_7_days()
 
-        # Check for unsent data
+        # Queue unsent data, uploaded in the background
         if manager and manager.analytics_data.get("needs_send", False):
-            success = manager.send_to_oracle()
-            if success:
-                manager.mark_as_sent()
+            manager.send_to_oracle()
+
+        # Drain anything left in the spool by a previous offline session
+        if manager and manager.analytics_data.get("consent_given", False):
+            from gui.analytics_uploader import get_uploader
+            get_uploader().start()
 
-        app = QApplication(sys.argv)
         app.setQuitOnLastWindowClosed(False)
         app.setApplicationName("TheVault")
         app.setApplicationVersion(get_current_version())
         app.setOrganizationName("AlexBenkarski")
 
         window = TheVaultApp()
+        window.attach_instance_server(instance_server)
+
+        # An updater that just installed this version waits for this before keeping it
+        from gui.update_manager import confirm_update_health
+        QTimer.singleShot(0, confirm_update_health)
 
         if '--minimized' not in sys.argv:
             window.show()
@@ -1459,9 +1434,7 @@ def start_app():
         import traceback
         traceback.print_exc()
 
-        # Clean up lock files on crash
-        cleanup_lock()
-
+        instance_server.close()
         raise
 
 
@@ -0,0 +1,124 @@
+"""
+Single running instance of TheVault.
+
+The first instance listens on a per-user local socket (a named pipe on
+Windows). Later launches connect, send one command and exit, so the running
+instance reacts at once without lock files or polling.
+
+Launch arguments map to commands: --show (the default), --lock and
+--autofill [riot|epic].
+"""
+
+import getpass
+import json
+import re
+
+from PyQt6.QtCore import QObject, pyqtSignal
+from PyQt6.QtNetwork import QAbstractSocket, QLocalServer, QLocalSocket
+
+SHOW = "show"
+LOCK = "lock"
+AUTOFILL = "autofill"
+COMMANDS = (SHOW, LOCK, AUTOFILL)
+
+CONNECT_TIMEOUT_MS = 500
+REPLY_TIMEOUT_MS = 1000
+
+
+def get_server_name():
+    """Per-user name so accounts on one machine don't reach each other's vault"""
+    try:
+        user = getpass.getuser()
+    except Exception:
+        user = "user"
+    return "TheVault-" + re.sub(r"[^A-Za-z0-9_-]", "_", user)
+
+
+def parse_command(argv):
+    """(command, args) for the running instance, command is None for a silent launch"""
+    for position, arg in enumerate(argv[1:], start=1):
+        if arg.startswith("--") and arg[2:] in COMMANDS:
+            return arg[2:], [a for a in argv[position + 1:] if not a.startswith("--")]
+
+    if "--minimized" in argv:
+        # Autostart while already running, nothing to bring up
+        return None, []
+    return SHOW, []
+
+
+def send_command(command, args=(), server_name=None):
+    """Deliver a command to the running instance, False if there is none"""
+    socket = QLocalSocket()
+    socket.connectToServer(server_name or get_server_name())
+    if not socket.waitForConnected(CONNECT_TIMEOUT_MS):
+        return False
+
+    if command:
+        socket.write((json.dumps({"command": command, "args": list(args)}) + "\n").encode('utf-8'))
+        socket.waitForBytesWritten(REPLY_TIMEOUT_MS)
+        if socket.waitForReadyRead(REPLY_TIMEOUT_MS):
+            reply = bytes(socket.readAll()).decode('utf-8', 'replace').strip()
+            if reply != "ok":
+                print(f"Running instance rejected command {command}: {reply}")
+
+    socket.disconnectFromServer()
+    return True
+
+
+class InstanceServer(QObject):
+    """Receives commands from later launches"""
+    command_received = pyqtSignal(str, list)
+
+    def __init__(self, server_name=None, parent=None):
+        super().__init__(parent)
+        self.server_name = server_name or get_server_name()
+        self.server = QLocalServer(self)
+        self.server.setSocketOptions(QLocalServer.SocketOption.UserAccessOption)
+        self.server.newConnection.connect(self._on_new_connection)
+
+    def listen(self):
+        """Become the running instance, False if another one already is"""
+        if self.server.listen(self.server_name):
+            return True
+
+        if self.server.serverError() == QAbstractSocket.SocketError.AddressInUseError:
+            if send_command(None, server_name=self.server_name):
+                # Another launch won the race
+                return False
+
+            # Socket file left behind by a crashed instance, nobody answers on it
+            QLocalServer.removeServer(self.server_name)
+            if self.server.listen(self.server_name):
+                return True
+
+        print(f"Error starting instance server: {self.server.errorString()}")
+        return False
+
+    def close(self):
+        self.server.close()
+
+    def _on_new_connection(self):
+        while self.server.hasPendingConnections():
+            socket = self.server.nextPendingConnection()
+            socket.readyRead.connect(lambda s=socket: self._read_command(s))
+            socket.disconnected.connect(socket.deleteLater)
+
+    def _read_command(self, socket):
+        if not socket.canReadLine():
+            return
+
+        line = bytes(socket.readLine()).decode('utf-8', 'replace')
+        try:
+            message = json.loads(line)
+            command = message.get("command")
+            args = [str(arg) for arg in message.get("args", [])]
+        except (ValueError, AttributeError):
+            command, args = None, []
+
+        if command in COMMANDS:
+            socket.write(b"ok\n")
+            self.command_received.emit(command, args)
+        else:
+            socket.write(b"unknown\n")
+        socket.flush()
+        socket.disconnectFromServer()
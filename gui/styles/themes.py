@@ -586,5 +586,151 @@ QPushButton[smallButton="true"]:focus {
 }
 """
 
+# ===========================================
+# STYLE CLASSES
+# Compiled once into the window stylesheet; widgets pick one with
+# set_style_class() instead of parsing their own setStyleSheet() string.
+# ===========================================
+
+FOLDER_COLORS = {
+    'Battle.net': '#ff6b6b',
+    'Twitch': '#9146ff',
+    'Epic Games': '#0078f2',
+    'Minecraft': '#00c851',
+    'Gmail': '#ea4335',
+    'Random Pass': '#666666',
+    'Social Media': '#1da1f2',
+    'Banking': '#ffa726',
+    'Work': '#795548'
+}
+DEFAULT_FOLDER_COLOR = '#666666'
+
+STYLE_CLASSES = {
+    "folderItem": """
+        background: transparent;
+        border: none;
+        border-radius: 8px;
+    """,
+    "folderItem:hover": """
+        background: rgba(255, 255, 255, 0.06);
+    """,
+    "folderItem[selected=\"true\"]": """
+        background: rgba(76, 175, 80, 0.2);
+        border: 2px solid #4CAF50;
+        border-radius: 8px;
+    """,
+    "folderItemIcon": """
+        color: white;
+        font-size: 18px;
+        background: transparent;
+        border: none;
+    """,
+    "folderItemName": """
+        color: #ffffff;
+        background: transparent;
+        border: none;
+    """,
+    "folderItemCount": """
+        color: #999999;
+        background: transparent;
+        border: none;
+    """,
+    "passwordCard": """
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #404043, stop:1 #373739);
+        border: 1px solid rgba(255, 255, 255, 0.12);
+        border-radius: 12px;
+    """,
+    "passwordCard:hover": """
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #4a4a4d, stop:1 #404043);
+        border: 1px solid rgba(255, 255, 255, 0.25);
+    """,
+    "passwordCard[pressed=\"true\"]": """
+        background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
+            stop:0 #4a4a4d, stop:1 #454548);
+    """,
+    "passwordCardTitle": """
+        color: #ffffff;
+        background: transparent;
+        font-weight: 600;
+        border: none;
+        padding: 0px;
+    """,
+    "passwordCardUsername": """
+        color: #b0b0b0;
+        background: transparent;
+        font-weight: 400;
+        border: none;
+        padding: 0px;
+    """,
+    "duplicatePasswordText": """
+        color: #ff4757;
+        background: transparent;
+    """,
+    "iconButton": """
+        background: rgba(255, 255, 255, 0.08);
+        border: 1px solid rgba(255, 255, 255, 0.15);
+        border-radius: 6px;
+    """,
+    "iconButton:hover": """
+        background: rgba(255, 255, 255, 0.15);
+    """,
+}
+
+# Folder accent colours are a style class keyed by the hex value
+for _color in sorted(set(FOLDER_COLORS.values()) | {DEFAULT_FOLDER_COLOR}):
+    STYLE_CLASSES[f'folderItemAccent[accent="{_color[1:]}"]'] = f"""
+        background: {_color};
+        border-radius: 8px;
+        border: none;
+    """
+
+_compiled_theme = None
+
+
+def _style_class_selector(name):
+    """Turn 'card[pressed="true"]:hover' into a [styleClass] selector"""
+    base = name
+    suffix = ""
+    for marker in ("[", ":"):
+        if marker in base:
+            index = base.index(marker)
+            suffix = base[index:] + suffix
+            base = base[:index]
+    return f'*[styleClass="{base}"]{suffix}'
+
+
+def compile_theme():
+    """Build the full stylesheet once, including every style class"""
+    global _compiled_theme
+    if _compiled_theme is None:
+        rules = [
+            f"{_style_class_selector(name)} {{{body}}}"
+            for name, body in STYLE_CLASSES.items()
+        ]
+        _compiled_theme = DARK_THEME + "\n" + "\n".join(rules)
+    return _compiled_theme
+
+
+def get_folder_accent(folder_name):
+    return FOLDER_COLORS.get(folder_name, DEFAULT_FOLDER_COLOR)[1:]
+
+
+def set_style_class(widget, style_class, **properties):
+    """Select a compiled style class and optional state properties on a widget"""
+    from PyQt6.QtCore import Qt
+
+    widget.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
+    widget.setProperty("styleClass", style_class)
+    for name, value in properties.items():
+        widget.setProperty(name, value)
+
+    # Only re-polish widgets that are already on screen
+    if widget.isVisible():
+        widget.style().unpolish(widget)
+        widget.style().polish(widget)
+
+
 def apply_theme(app_instance):
-    app_instance.setStyleSheet(DARK_THEME)
\ No newline at end of file
+    app_instance.setStyleSheet(compile_theme())
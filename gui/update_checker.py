@@ -0,0 +1,31 @@
+import threading
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+
+class UpdateChecker(QObject):
+    """Runs update checks off the UI thread and reports back through a signal"""
+    update_checked = pyqtSignal(dict)
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._thread = None
+
+    def is_checking(self):
+        return self._thread is not None and self._thread.is_alive()
+
+    def check_async(self, force=False):
+        """Start a background check, ignored if one is already running"""
+        if self.is_checking():
+            return False
+
+        self._thread = threading.Thread(target=self._run_check, args=(force,), daemon=True)
+        self._thread.start()
+        return True
+
+    def _run_check(self, force):
+        from gui.update_manager import check_for_updates
+
+        update_info = check_for_updates(force)
+        # Cross-thread emit is queued onto the receiver's thread by Qt
+        self.update_checked.emit(update_info)
@@ -3,9 +3,10 @@ import json
 import subprocess
 import sys
 import os
+import time
 import webbrowser
 from packaging import version
-from config import is_dev_environment
+from config import is_dev_environment, register_setting
 import dev_tools.dev_manager
 
 # Version management
@@ -13,6 +14,13 @@ VERSION_FILE = "version.txt"
 GITHUB_API_URL = "https://api.github.com/repos/AlexBenkarski/TheVault/releases/latest"
 CACHED_SECRETS = None
 
+register_setting("update_check_interval_hours", int, 6)
+
+# The updater may need a UAC prompt before it connects, give the user time to answer it
+HANDOFF_CONNECT_TIMEOUT = 120
+# Created by the updater before it starts the new version, removed once that version is running
+UPDATE_HEALTH_FLAG = "update_health_check.tmp"
+
 def get_window_title():
     current_version = get_current_version()
 
@@ -124,63 +132,131 @@ def get_current_version():
 
 
 
-def check_for_updates():
-   try:
-       print("Checking for updates...")
+def get_update_cache_path():
+    """Get writable path for the cached release payload"""
+    if getattr(sys, 'frozen', False):
+        app_data = os.path.join(os.path.expanduser("~"), "AppData", "Local", "TheVault")
+        os.makedirs(app_data, exist_ok=True)
+        return os.path.join(app_data, "update_cache.json")
+    return os.path.join(get_app_directory(), "update_cache.json")
 
-       headers = {
-           'User-Agent': 'TheVault-UpdateChecker/1.0',
-           'Accept': 'application/vnd.github.v3+json'
-       }
 
-       response = requests.get(GITHUB_API_URL, headers=headers, timeout=10)
+def load_update_cache():
+    try:
+        with open(get_update_cache_path(), 'r', encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return {}
+
 
-       if response.status_code == 200:
-           release_data = response.json()
-           latest_version = release_data['tag_name'].lstrip('v')
-           current_version = get_current_version()
+def save_update_cache(cache):
+    try:
+        with open(get_update_cache_path(), 'w', encoding='utf-8') as f:
+            json.dump(cache, f)
+    except OSError as e:
+        print(f"Failed to save update cache: {e}")
+
+
+def get_update_check_interval():
+    """Seconds between network checks, configurable through config settings"""
+    from config import get_setting
+    return get_setting("update_check_interval_hours") * 3600
+
+
+def fetch_latest_release(force=False):
+    """Return the latest release payload, using the ETag cache and check interval"""
+    cache = load_update_cache()
+    cached_release = cache.get('release')
+
+    if cached_release and not force:
+        if time.time() - cache.get('checked_at', 0) < get_update_check_interval():
+            print("Using cached release info")
+            return cached_release
+
+    headers = {
+        'User-Agent': 'TheVault-UpdateChecker/1.0',
+        'Accept': 'application/vnd.github.v3+json'
+    }
+    if cached_release and cache.get('etag'):
+        headers['If-None-Match'] = cache['etag']
+
+    response = requests.get(GITHUB_API_URL, headers=headers, timeout=10)
+
+    if response.status_code == 304 and cached_release:
+        # Unchanged since last check, conditional requests don't count against rate limits
+        cache['checked_at'] = time.time()
+        save_update_cache(cache)
+        return cached_release
+
+    if response.status_code == 200:
+        release_data = response.json()
+        save_update_cache({
+            'etag': response.headers.get('ETag'),
+            'checked_at': time.time(),
+            'release': release_data
+        })
+        return release_data
+
+    print(f"Failed to check for updates: HTTP {response.status_code}")
+    return None
+
+
+def parse_release(release_data):
+    latest_version = release_data['tag_name'].lstrip('v')
+    current_version = get_current_version()
 
-           # Add fallback for Unknown version
-           if current_version == "Unknown":
-               current_version = "2.0.6-beta"
-               print("Using fallback version for update check")
+    # Add fallback for Unknown version
+    if current_version == "Unknown":
+        current_version = "2.0.6-beta"
+        print("Using fallback version for update check")
+
+    print(f"Current version: {current_version}")
+    print(f"Latest version: {latest_version}")
+
+    if version.parse(latest_version) > version.parse(current_version):
+        # Find the .exe asset in the release
+        exe_asset = None
+        for asset in release_data['assets']:
+
+            if asset['name'] == 'Vault.exe' or (
+                    asset['name'].endswith('.exe') and 'Setup' not in asset['name']):
+                exe_asset = asset
+                break
+
+        if exe_asset:
+            print(f"Update available: {exe_asset['name']}")
+            return {
+                'available': True,
+                'version': latest_version,
+                'download_url': exe_asset['browser_download_url'],
+                'patch_notes': release_data['body'] or "No patch notes available.",
+                'release_name': release_data['name'],
+                'asset_name': exe_asset['name'],
+                # GitHub publishes "sha256:<hex>" digests for release assets
+                'sha256': (exe_asset.get('digest') or "").partition("sha256:")[2] or None
+            }
+        else:
+            print("No suitable .exe file found in latest release")
+    else:
+        print("No update needed - you have the latest version")
 
-           print(f"Current version: {current_version}")
-           print(f"Latest version: {latest_version}")
+    return {'available': False}
 
-           if version.parse(latest_version) > version.parse(current_version):
-               # Find the .exe asset in the release
-               exe_asset = None
-               for asset in release_data['assets']:
 
-                   if asset['name'] == 'Vault.exe' or (
-                           asset['name'].endswith('.exe') and 'Setup' not in asset['name']):
-                       exe_asset = asset
-                       break
+def check_for_updates(force=False):
+    try:
+        print("Checking for updates...")
 
-               if exe_asset:
-                   print(f"Update available: {exe_asset['name']}")
-                   return {
-                       'available': True,
-                       'version': latest_version,
-                       'download_url': exe_asset['browser_download_url'],
-                       'patch_notes': release_data['body'] or "No patch notes available.",
-                       'release_name': release_data['name'],
-                       'asset_name': exe_asset['name']
-                   }
-               else:
-                   print("No suitable .exe file found in latest release")
-           else:
-               print("No update needed - you have the latest version")
-       else:
-           print(f"Failed to check for updates: HTTP {response.status_code}")
+        release_data = fetch_latest_release(force)
+        if release_data:
+            return parse_release(release_data)
 
-   except requests.exceptions.RequestException as e:
-       print(f"Network error checking for updates: {e}")
-   except Exception as e:
-       print(f"Update check failed: {e}")
+    except requests.exceptions.RequestException as e:
+        print(f"Network error checking for updates: {e}")
+    except Exception as e:
+        print(f"Update check failed: {e}")
 
-   return {'available': False}
+    return {'available': False}
 
 
 def show_update_popup(parent, update_info):
@@ -324,6 +400,85 @@ def show_update_popup(parent, update_info):
         print(f"Error showing update popup: {e}")
 
 
+class UpdateHandoff:
+    """Loopback channel the updater waits on instead of sleeping until we exit"""
+
+    def __init__(self):
+        from multiprocessing.connection import Listener
+        import threading
+
+        self.authkey = os.urandom(16)
+        self.listener = Listener(("127.0.0.1", 0), authkey=self.authkey)
+        self.connection = None
+        self.connected = threading.Event()
+        threading.Thread(target=self._accept, daemon=True).start()
+
+    def _accept(self):
+        try:
+            self.connection = self.listener.accept()
+            self.connected.set()
+        except Exception:
+            # Listener closed before the updater connected
+            pass
+
+    def argument(self):
+        port = self.listener.address[1]
+        return f"{port}:{self.authkey.hex()}:{os.getpid()}"
+
+    def notify_exiting(self):
+        try:
+            if self.connection:
+                self.connection.send("exiting")
+                self.connection.close()
+        except Exception as e:
+            print(f"Update handoff failed: {e}")
+        finally:
+            self.close()
+
+    def close(self):
+        try:
+            self.listener.close()
+        except Exception as e:
+            print(f"Error closing update handoff: {e}")
+
+
+_update_handoff = None
+
+
+def _quit_when_updater_connects(parent, updating_dialog, started):
+    """Quit only once the updater is waiting on the handoff, so it hears that we exited"""
+    from PyQt6.QtCore import QTimer
+    from PyQt6.QtWidgets import QApplication
+
+    if _update_handoff.connected.is_set():
+        app = QApplication.instance()
+        app.aboutToQuit.connect(_update_handoff.notify_exiting)
+        app.quit()
+        return
+
+    if time.monotonic() - started > HANDOFF_CONNECT_TIMEOUT:
+        print("Updater never connected to the handoff, staying open")
+        _update_handoff.close()
+        if updating_dialog:
+            updating_dialog.close()
+        show_error_popup(parent, "The updater did not start.\n\n"
+                                 "If you declined the administrator prompt, please try updating again.")
+        return
+
+    QTimer.singleShot(100, lambda: _quit_when_updater_connects(parent, updating_dialog, started))
+
+
+def confirm_update_health():
+    """Tell a waiting updater this version started properly, it rolls back otherwise"""
+    try:
+        flag_path = os.path.join(get_app_directory(), UPDATE_HEALTH_FLAG)
+        if os.path.exists(flag_path):
+            os.remove(flag_path)
+            print("Reported healthy start to the updater")
+    except Exception as e:
+        print(f"Failed to report healthy start to the updater: {e}")
+
+
 def start_update_process(parent, update_info, update_dialog):
     """Start the update process"""
     try:
@@ -331,7 +486,7 @@ def start_update_process(parent, update_info, update_dialog):
         update_dialog.accept()
 
         # Show updating dialog
-        show_updating_popup(parent, update_info)
+        updating_dialog = show_updating_popup(parent, update_info)
 
         # Find updater.exe
         app_dir = get_app_directory()
@@ -343,8 +498,14 @@ def start_update_process(parent, update_info, update_dialog):
 
             # Launch updater with the .exe download URL
             try:
-                process = subprocess.Popen([
-                    updater_path,
+                global _update_handoff
+                _update_handoff = UpdateHandoff()
+
+                updater_args = [updater_path, '--handoff', _update_handoff.argument()]
+                if update_info.get('sha256'):
+                    updater_args += ['--sha256', update_info['sha256']]
+
+                process = subprocess.Popen(updater_args + [
                     update_info['download_url'],
                     update_info['version'],
                     update_info['patch_notes']
@@ -352,8 +513,9 @@ def start_update_process(parent, update_info, update_dialog):
 
                 print(f"Updater started with PID: {process.pid}")
 
-                from PyQt6.QtWidgets import QApplication
-                QApplication.instance().quit()
+                # Tell the updater the moment we shut down so it can swap immediately,
+                # which needs it connected first (it may relaunch itself elevated)
+                _quit_when_updater_connects(parent, updating_dialog, time.monotonic())
 
             except Exception as e:
                 raise Exception(f"Failed to start updater process: {str(e)}")
@@ -423,9 +585,11 @@ def show_updating_popup(parent, update_info):
         layout.addWidget(wait_label)
 
         dialog.show()
+        return dialog
 
     except Exception as e:
         print(f"Error showing updating popup: {e}")
+        return None
 
 
 def show_error_popup(parent, message):
@@ -1,24 +1,52 @@
+from collections import OrderedDict
+
 from PyQt6.QtSvg import QSvgRenderer
-from PyQt6.QtGui import QPixmap, QPainter, QIcon
-from PyQt6.QtCore import QSize, Qt
+from PyQt6.QtGui import QPixmap, QPainter, QIcon, QGuiApplication
+from PyQt6.QtCore import QSize, Qt, QTimer
 
 
 class SvgIcon:
     """Helper class for creating SVG icons with custom colors and sizes"""
 
+    MAX_CACHE_SIZE = 256
+    _cache = OrderedDict()
+
+    @staticmethod
+    def _device_pixel_ratio() -> float:
+        screen = QGuiApplication.primaryScreen() if QGuiApplication.instance() else None
+        return screen.devicePixelRatio() if screen else 1.0
+
     @staticmethod
     def create_icon(svg_content: str, size: QSize = QSize(24, 24), color: str = "#ffffff") -> QIcon:
-        """Create QIcon from SVG content with custom color"""
+        """Create QIcon from SVG content with custom color, reusing cached rasters"""
+        dpr = SvgIcon._device_pixel_ratio()
+        key = (svg_content, size.width(), size.height(), color, dpr)
+
+        cache = SvgIcon._cache
+        icon = cache.get(key)
+        if icon is not None:
+            cache.move_to_end(key)
+            return icon
+
+        icon = SvgIcon._render_icon(svg_content, size, color, dpr)
+        cache[key] = icon
+        if len(cache) > SvgIcon.MAX_CACHE_SIZE:
+            cache.popitem(last=False)
+        return icon
+
+    @staticmethod
+    def _render_icon(svg_content: str, size: QSize, color: str, dpr: float) -> QIcon:
         # Replace fill colors in SVG
         colored_svg = svg_content.replace('fill="currentColor"', f'fill="{color}"')
         colored_svg = colored_svg.replace('fill="#000"', f'fill="{color}"')
         colored_svg = colored_svg.replace('fill="#000000"', f'fill="{color}"')
 
-        # Create renderer and pixmap
+        # Create renderer and pixmap at device resolution
         renderer = QSvgRenderer()
         renderer.load(colored_svg.encode('utf-8'))
 
-        pixmap = QPixmap(size)
+        pixmap = QPixmap(int(size.width() * dpr), int(size.height() * dpr))
+        pixmap.setDevicePixelRatio(dpr)
         pixmap.fill(Qt.GlobalColor.transparent)
 
         painter = QPainter(pixmap)
@@ -27,6 +55,24 @@ class SvgIcon:
 
         return QIcon(pixmap)
 
+    @staticmethod
+    def clear_cache():
+        SvgIcon._cache.clear()
+
+    @staticmethod
+    def warm_up(specs=None):
+        """Pre-render common icons one per event loop pass so startup stays responsive"""
+        pending = list(specs if specs is not None else COMMON_ICON_SPECS)
+
+        def render_next():
+            if not pending:
+                return
+            svg_content, size, color = pending.pop(0)
+            SvgIcon.create_icon(svg_content, size, color)
+            QTimer.singleShot(0, render_next)
+
+        QTimer.singleShot(0, render_next)
+
 
 # Professional SVG icon library
 class Icons:
@@ -89,4 +135,18 @@ class Icons:
         </svg>'''
     EYE_OFF = '''<svg viewBox="0 0 24 24" fill="currentColor">
                 <path d="M11.83,9L15,12.16C15,12.11 15,12.05 15,12A3,3 0 0,0 12,9C11.94,9 11.89,9 11.83,9M7.53,9.8L9.08,11.35C9.03,11.56 9,11.77 9,12A3,3 0 0,0 12,15C12.22,15 12.44,14.97 12.65,14.92L14.2,16.47C13.53,16.8 12.79,17 12,17A5,5 0 0,1 7,12C7,11.21 7.2,10.47 7.53,9.8M2,4.27L4.28,6.55L4.73,7C3.08,8.3 1.78,10 1,12C2.73,16.39 7,19.5 12,19.5C13.55,19.5 15.03,19.2 16.38,18.66L16.81,19.09L19.73,22L21,20.73L3.27,3M12,7A5,5 0 0,1 17,12C17,12.64 16.87,13.26 16.64,13.82L19.57,16.75C21.07,15.5 22.27,13.86 23,12C21.27,7.61 17,4.5 12,4.5C10.6,4.5 9.26,4.75 8,5.2L10.17,7.35C10.76,7.13 11.37,7 12,7Z"/>
-            </svg>'''
\ No newline at end of file
+            </svg>'''
+
+
+# Icons rendered on every folder/card refresh, warmed up at idle time
+COMMON_ICON_SPECS = [
+    (Icons.PLUS, QSize(16, 16), "#ffffff"),
+    (Icons.EDIT, QSize(16, 16), "#ffffff"),
+    (Icons.DELETE, QSize(16, 16), "#ffffff"),
+    (Icons.COPY, QSize(16, 16), "#ffffff"),
+    (Icons.EYE, QSize(16, 16), "#ffffff"),
+    (Icons.EYE_OFF, QSize(16, 16), "#ffffff"),
+    (Icons.EDIT, QSize(18, 18), "#ffffff"),
+    (Icons.DELETE, QSize(18, 18), "#ffffff"),
+    (Icons.FOLDER, QSize(48, 48), "#666666"),
+]
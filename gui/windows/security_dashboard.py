@@ -5,14 +5,17 @@ Fixed to inherit from QWidget and handle tabs properly
 """
 
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QLabel,
-                             QPushButton, QFrame, QScrollArea, QMessageBox)
+                             QPushButton, QFrame, QScrollArea, QMessageBox, QListWidget,
+                             QInputDialog, QLineEdit)
 from PyQt6.QtCore import Qt, QTimer, pyqtSignal
 from PyQt6.QtGui import QPixmap, QFont
 
-from gui.widgets.modern_widgets import ModernButton
+from gui.widgets.modern_widgets import ModernButton, ModernDialog
 from gui.widgets.svg_icons import SvgIcon, Icons
+from gui.styles.themes import set_style_class
 from PyQt6.QtCore import QSize
 import webbrowser
+import os
 import threading
 
 
@@ -36,11 +39,12 @@ class DuplicatePasswordWidget(QWidget):
 
         self.password_label = QLabel(f'"••••••••" used in {len(self.accounts)} accounts:')
         self.password_label.setFont(QFont("Segoe UI", 11, QFont.Weight.Medium))
-        self.password_label.setStyleSheet("color: #ff4757; background: transparent;")
+        set_style_class(self.password_label, "duplicatePasswordText")
 
         # Eye button
         self.eye_btn = QPushButton()
         self.eye_btn.setFixedSize(24, 24)
+        set_style_class(self.eye_btn, "iconButton")
         self.update_eye_button()
         self.eye_btn.clicked.connect(self.toggle_password_visibility)
 
@@ -57,7 +61,7 @@ class DuplicatePasswordWidget(QWidget):
         for account in self.accounts:
             account_label = QLabel(f"• {account}")
             account_label.setFont(QFont("Segoe UI", 9))
-            account_label.setStyleSheet("color: #ff4757; background: transparent;")
+            set_style_class(account_label, "duplicatePasswordText")
             accounts_layout.addWidget(account_label)
 
         layout.addLayout(top_layout)
@@ -72,16 +76,6 @@ class DuplicatePasswordWidget(QWidget):
             self.eye_btn.setToolTip("Show password")
 
         self.eye_btn.setIcon(icon)
-        self.eye_btn.setStyleSheet("""
-            QPushButton {
-                background: rgba(255, 255, 255, 0.08);
-                border: 1px solid rgba(255, 255, 255, 0.15);
-                border-radius: 6px;
-            }
-            QPushButton:hover {
-                background: rgba(255, 255, 255, 0.15);
-            }
-        """)
 
     def toggle_password_visibility(self):
         self.show_password = not self.show_password
@@ -91,14 +85,227 @@ class DuplicatePasswordWidget(QWidget):
         self.update_eye_button()
 
 
+class RestoreBackupDialog(ModernDialog):
+    """Pick a backup snapshot, preview its contents and restore it"""
+    snapshots_loaded = pyqtSignal(list)
+    preview_ready = pyqtSignal(str)
+    restore_finished = pyqtSignal(bool, str, object)
+    older_password_needed = pyqtSignal(object, str)
+
+    def __init__(self, parent, vault_model):
+        super().__init__(parent, "Restore Backup")
+        self.vault_model = vault_model
+        self.snapshots = []
+        # Password for backups made before the vault had its own key, kept only while the dialog is open
+        self.older_password = None
+        self.setFixedSize(520, 500)
+        self.setStyleSheet("""
+            QDialog {
+                background: #2d2d30;
+                border: 2px solid #4CAF50;
+                border-radius: 12px;
+            }
+            QLabel {
+                background: transparent;
+                color: #ffffff;
+            }
+            QListWidget {
+                background: rgba(255, 255, 255, 0.03);
+                border: 1px solid rgba(255, 255, 255, 0.1);
+                border-radius: 8px;
+                color: #ffffff;
+                padding: 4px;
+            }
+            QListWidget::item:selected {
+                background: rgba(76, 175, 80, 0.3);
+            }
+        """)
+
+        layout = self.setup_basic_layout("Restore from Backup")
+
+        self.snapshot_list = QListWidget()
+        self.snapshot_list.currentRowChanged.connect(self.on_selection_changed)
+        layout.addWidget(self.snapshot_list)
+
+        self.preview_label = QLabel("Loading backups...")
+        self.preview_label.setWordWrap(True)
+        self.preview_label.setStyleSheet("color: #888888;")
+        layout.addWidget(self.preview_label)
+
+        button_layout = QHBoxLayout()
+        self.preview_btn = ModernButton("Preview")
+        self.preview_btn.clicked.connect(self.preview_selected)
+        self.restore_btn = ModernButton("Restore")
+        self.restore_btn.clicked.connect(self.restore_selected)
+        close_btn = ModernButton("Close", primary=False)
+        close_btn.clicked.connect(self.reject)
+
+        button_layout.addWidget(self.preview_btn)
+        button_layout.addWidget(self.restore_btn)
+        button_layout.addWidget(close_btn)
+        layout.addLayout(button_layout)
+
+        self.snapshots_loaded.connect(self.on_snapshots_loaded)
+        self.preview_ready.connect(self.on_preview_ready)
+        self.restore_finished.connect(self.on_restore_finished)
+        self.older_password_needed.connect(self.ask_older_password)
+
+        self.set_busy(True)
+        threading.Thread(target=self.load_snapshots, daemon=True).start()
+
+    def set_busy(self, busy):
+        has_selection = self.snapshot_list.currentRow() >= 0
+        self.preview_btn.setEnabled(not busy and has_selection)
+        self.restore_btn.setEnabled(not busy and has_selection)
+
+    def load_snapshots(self):
+        from core.backup_restore import list_all_snapshots
+        from core.backup_targets import get_backup_targets
+
+        # Checking Drive can refresh its token over the network, so this stays off the UI thread
+        targets = get_backup_targets()
+        if not targets:
+            self.preview_ready.emit("Connect Google Drive or choose a local backup folder first")
+            return
+        self.snapshots_loaded.emit(list_all_snapshots(targets))
+
+    def on_snapshots_loaded(self, snapshots):
+        from core.backup_engine import MANIFEST_SUFFIX
+
+        self.snapshots = snapshots
+        for target, timestamp, obj in snapshots:
+            label = f"{timestamp.strftime('%Y-%m-%d %H:%M:%S')}  -  {target.display_name}"
+            if not obj["name"].endswith(MANIFEST_SUFFIX):
+                label += " (full copy)"
+            self.snapshot_list.addItem(label)
+
+        if snapshots:
+            self.snapshot_list.setCurrentRow(0)
+            self.preview_label.setText("Select a backup to preview or restore")
+        else:
+            self.preview_label.setText("No backups found")
+        self.set_busy(False)
+
+    def on_selection_changed(self, row):
+        if row >= 0:
+            self.preview_label.setText("Select a backup to preview or restore")
+        self.set_busy(False)
+
+    def selected_snapshot(self):
+        row = self.snapshot_list.currentRow()
+        return self.snapshots[row] if 0 <= row < len(self.snapshots) else None
+
+    def preview_selected(self):
+        snapshot = self.selected_snapshot()
+        if not snapshot:
+            return
+
+        target, _, obj = snapshot
+        key = self.vault_model.key
+        older_password = self.older_password
+        self.preview_label.setText("Reading backup...")
+        self.set_busy(True)
+
+        def do_preview():
+            from core.backup_restore import OlderKeyRequired, backup_password_key, preview_snapshot
+            try:
+                older_key = backup_password_key(older_password) if older_password else None
+                folders = preview_snapshot(target, obj, key, older_key)
+                lines = [f"{len(folders)} folders, {sum(folders.values())} entries"]
+                lines.extend(f"  {name}: {count} entries" for name, count in folders.items())
+                self.preview_ready.emit("\n".join(lines))
+            except OlderKeyRequired as e:
+                self.older_password_needed.emit(self.preview_selected, str(e))
+            except Exception as e:
+                self.preview_ready.emit(f"Preview failed: {e}")
+
+        threading.Thread(target=do_preview, daemon=True).start()
+
+    def on_preview_ready(self, text):
+        self.preview_label.setText(text)
+        self.set_busy(False)
+
+    def restore_selected(self):
+        snapshot = self.selected_snapshot()
+        if not snapshot:
+            return
+
+        target, timestamp, obj = snapshot
+        reply = QMessageBox.question(
+            self, "Restore Backup",
+            f"Replace your current vault with the backup from {timestamp.strftime('%Y-%m-%d %H:%M')}?\n\n"
+            "Your current vault is kept as vault.enc.bak.",
+            QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+        )
+        if reply == QMessageBox.StandardButton.Yes:
+            self.start_restore()
+
+    def start_restore(self):
+        snapshot = self.selected_snapshot()
+        if not snapshot:
+            return
+
+        target, _, obj = snapshot
+        key = self.vault_model.key
+        older_password = self.older_password
+        self.preview_label.setText("Restoring backup...")
+        self.set_busy(True)
+
+        def do_restore():
+            from core.backup_restore import OlderKeyRequired, backup_password_key, restore_snapshot
+            try:
+                older_key = backup_password_key(older_password) if older_password else None
+                data = restore_snapshot(target, obj, key, older_key=older_key)
+                self.restore_finished.emit(True, "Vault restored from backup", data)
+            except OlderKeyRequired as e:
+                self.older_password_needed.emit(self.start_restore, str(e))
+            except Exception as e:
+                self.restore_finished.emit(False, f"Restore failed: {e}", None)
+
+        threading.Thread(target=do_restore, daemon=True).start()
+
+    def ask_older_password(self, retry, message):
+        """The backup predates the vault's own key, ask for the password used back then"""
+        self.older_password = None
+        self.preview_label.setText(message)
+        self.set_busy(False)
+        password, ok = QInputDialog.getText(
+            self, "Older Backup",
+            "This backup was made before your vault moved to its own encryption key.\n"
+            "Enter the password you used when the backup was made:",
+            QLineEdit.EchoMode.Password
+        )
+        if not ok or not password:
+            return
+
+        self.older_password = password
+        retry()
+
+    def on_restore_finished(self, success, message, data):
+        self.set_busy(False)
+        if success:
+            self.vault_model.reset(data)
+            QMessageBox.information(self, "Restore Complete", message)
+            self.accept()
+        else:
+            self.preview_label.setText(message)
+
+
 class SecurityDashboard(QWidget):
     """Main security dashboard widget"""
+    backup_status_ready = pyqtSignal(dict)
+    backup_finished = pyqtSignal(bool, str)
 
     def __init__(self):
         super().__init__()
         self.vault_data = None
+        self.analysis_stale = True
         self.show_passwords = False
         self.gdrive_backup = None
+        self.vault_model = None
+        self.backup_status_thread = None
+        self.backup_status_ready.connect(self.apply_backup_status)
+        self.backup_finished.connect(self.backup_completed)
         self.init_ui()
 
     def init_ui(self):
@@ -199,7 +406,7 @@ class SecurityDashboard(QWidget):
         """Create the password security tab with real content"""
         tab_widget = QFrame()
         tab_widget.setStyleSheet("""
-            QFrame {
+            .QFrame {
                 background: rgba(255, 255, 255, 0.03);
                 border: none;
                 border-radius: 12px;
@@ -446,8 +653,20 @@ class SecurityDashboard(QWidget):
         """)
         self.disconnect_btn.hide()
 
+        # Local folder / NAS target alongside Google Drive
+        self.local_backup_btn = ModernButton("Choose Local Backup Folder")
+        self.local_backup_btn.setFixedHeight(36)
+        self.local_backup_btn.clicked.connect(self.choose_local_backup_folder)
+        self.update_local_backup_button()
+
         layout.addWidget(self.connect_btn)
         layout.addWidget(self.backup_now_btn)
+        self.restore_btn = ModernButton("Restore from Backup")
+        self.restore_btn.setFixedHeight(36)
+        self.restore_btn.clicked.connect(self.open_restore_dialog)
+
+        layout.addWidget(self.local_backup_btn)
+        layout.addWidget(self.restore_btn)
         layout.addWidget(self.disconnect_btn)
 
         return widget
@@ -477,10 +696,35 @@ class SecurityDashboard(QWidget):
 
     def set_vault_data(self, vault_data):
         """Set vault data and analyze security"""
+        if vault_data is self.vault_data and not self.analysis_stale:
+            return
+
         self.vault_data = vault_data
+        self.analysis_stale = False
         self.analyze_password_security()
         self.calculate_security_score()
 
+    def clear_vault_data(self):
+        """Drop the unlocked vault and the widgets showing its passwords, used when locking"""
+        if self.vault_model:
+            self.vault_model.unsubscribe(self.on_vault_changed)
+        self.vault_model = None
+        self.vault_data = None
+        self.analysis_stale = True
+        self.show_passwords = False
+        self.update_global_eye_button()
+
+        while self.content_layout.count():
+            child = self.content_layout.takeAt(0)
+            if child.widget():
+                child.widget().deleteLater()
+
+    def on_vault_changed(self, event, payload):
+        """Vault model subscriber, re-analyze on next show instead of every change"""
+        from core.vault_model import VAULT_SAVED
+        if event != VAULT_SAVED:
+            self.analysis_stale = True
+
     def analyze_password_security(self):
         """Analyze vault passwords for security issues"""
         if not self.vault_data:
@@ -682,11 +926,7 @@ This is a one-time setup.""")
             self.show_error(f"Disconnect error: {str(e)}")
 
     def backup_vault_now(self):
-        """Perform manual vault backup"""
-        if not self.gdrive_backup or not self.gdrive_backup.is_authenticated():
-            self.show_error("Not connected to Google Drive")
-            return
-
+        """Perform manual vault backup to every configured target"""
         try:
             from core.vault_manager import get_vault_path
             vault_path = get_vault_path()
@@ -695,12 +935,21 @@ This is a one-time setup.""")
             self.backup_now_btn.setText("Backing up...")
             self.backup_now_btn.setEnabled(False)
 
-            # Perform backup in thread to avoid blocking UI
+            # Perform backup in thread to avoid blocking UI, target checks can reach Drive too
             def do_backup():
-                success, message = self.gdrive_backup.upload_vault_backup(vault_path)
+                from core.backup_targets import backup_to_targets, get_backup_targets, summarize_results
+
+                try:
+                    targets = get_backup_targets()
+                    if targets:
+                        success, message = summarize_results(backup_to_targets(vault_path, targets))
+                    else:
+                        success, message = False, "Connect Google Drive or choose a local backup folder first"
+                except Exception as e:
+                    success, message = False, str(e)
 
                 # Update UI on main thread
-                QTimer.singleShot(0, lambda: self.backup_completed(success, message))
+                self.backup_finished.emit(success, message)
 
             threading.Thread(target=do_backup, daemon=True).start()
 
@@ -709,8 +958,47 @@ This is a one-time setup.""")
             self.backup_now_btn.setText("Backup Now")
             self.backup_now_btn.setEnabled(True)
 
+    def open_restore_dialog(self):
+        """Show the snapshot list for restoring the vault, which finds the targets itself"""
+        if not self.vault_model:
+            self.show_error("Open your vault before restoring a backup")
+            return
+
+        if RestoreBackupDialog(self, self.vault_model).exec():
+            self.set_vault_data(self.vault_model.data)
+
+    def choose_local_backup_folder(self):
+        """Pick a local or network folder to back up into"""
+        from PyQt6.QtWidgets import QFileDialog
+        from core.backup_targets import get_local_backup_directory, set_local_backup_directory
+
+        directory = QFileDialog.getExistingDirectory(
+            self, "Choose Backup Folder", get_local_backup_directory() or os.path.expanduser("~")
+        )
+        if not directory:
+            return
+
+        if set_local_backup_directory(directory):
+            self.update_local_backup_button()
+            self.backup_now_btn.setEnabled(True)
+        else:
+            self.show_error("Could not save the backup folder setting")
+
+    def update_local_backup_button(self):
+        from core.backup_targets import get_local_backup_directory
+
+        directory = get_local_backup_directory()
+        if directory:
+            self.local_backup_btn.setText(f"Local Backups: {os.path.basename(directory) or directory}")
+            self.local_backup_btn.setToolTip(directory)
+        else:
+            self.local_backup_btn.setText("Choose Local Backup Folder")
+
     def backup_completed(self, success, message):
         """Handle backup completion"""
+        from core.activity_log import log_activity, BACKUP
+        log_activity(BACKUP, success=success, automatic=False)
+
         self.backup_now_btn.setText("Backup Now")
         self.backup_now_btn.setEnabled(True)
 
@@ -721,13 +1009,32 @@ This is a one-time setup.""")
             self.show_error(f"Backup failed: {message}")
 
     def update_backup_status(self):
-        """Update Google Drive backup status"""
+        """Refresh Google Drive backup status off the UI thread"""
         if not self.gdrive_backup:
             return
+        if self.backup_status_thread and self.backup_status_thread.is_alive():
+            return
 
+        import threading
+        self.backup_status_thread = threading.Thread(target=self.fetch_backup_status, daemon=True)
+        self.backup_status_thread.start()
+
+    def fetch_backup_status(self):
         try:
             status = self.gdrive_backup.get_backup_status()
+        except Exception as e:
+            print(f"Error fetching backup status: {e}")
+            return
+
+        # Cross-thread emit is queued onto the UI thread by Qt
+        self.backup_status_ready.emit(status)
 
+    def apply_backup_status(self, status):
+        """Show fetched Google Drive backup status"""
+        from core.backup_targets import get_local_backup_directory
+
+        self.update_local_backup_button()
+        try:
             if status["connected"]:
                 self.connection_status_label.setText("Connected to Google Drive")
                 self.connection_status_label.setStyleSheet("color: #4CAF50;")
@@ -753,7 +1060,8 @@ This is a one-time setup.""")
 
                 self.connect_btn.setText("Connect to Google Drive")
                 self.connect_btn.setEnabled(True)
-                self.backup_now_btn.setEnabled(False)
+                # A local folder alone is enough to back up
+                self.backup_now_btn.setEnabled(bool(get_local_backup_directory()))
                 self.disconnect_btn.hide()
 
                 self.last_backup_label.setText("Connect to Google Drive for automatic backups")
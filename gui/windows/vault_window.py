@@ -8,8 +8,28 @@ from gui.update_manager import get_current_version
 from gui.widgets.modern_widgets import (ModernButton, ModernSmallButton, ModernEntryHeader,
                                         ModernEntryFrame, ModernDialog, ModernFormField, ModernLineEdit)
 from gui.widgets.svg_icons import SvgIcon, Icons
+from gui.styles.themes import set_style_class, get_folder_accent
 
 
+def format_relative_time(timestamp):
+    """Short human label for how long ago a timestamp was"""
+    import time
+    from datetime import datetime
+
+    seconds = max(0, time.time() - timestamp)
+    if seconds < 60:
+        return "Just now"
+    if seconds < 3600:
+        return f"{int(seconds // 60)} min ago"
+    if seconds < 86400:
+        hours = int(seconds // 3600)
+        return f"{hours} hour{'s' if hours != 1 else ''} ago"
+    if seconds < 2 * 86400:
+        return "Yesterday"
+    if seconds < 30 * 86400:
+        return f"{int(seconds // 86400)} days ago"
+    return datetime.fromtimestamp(timestamp).strftime("%b %d, %Y")
+
 
 class VaultWindow(QWidget):
     logout_requested = pyqtSignal()
@@ -20,6 +40,7 @@ class VaultWindow(QWidget):
         self.selected_folder = None
         self.vault_data = {}
         self.vault_key = None
+        self.vault_model = None
         self.folder_buttons = {}
         self.init_ui()
 
@@ -60,8 +81,9 @@ class VaultWindow(QWidget):
         """Create the enhanced left sidebar panel without Quick Actions"""
         left_widget = QWidget()
         left_widget.setFixedWidth(280)
+        left_widget.setObjectName("vaultLeftPanel")
         left_widget.setStyleSheet("""
-            QWidget {
+            QWidget#vaultLeftPanel {
                 background: #1a1a1d;
                 border-right: none;
             }
@@ -188,27 +210,7 @@ class VaultWindow(QWidget):
         item_container = QWidget()
         item_container.setFixedHeight(50)
         item_container.setCursor(Qt.CursorShape.PointingHandCursor)
-
-        if is_selected:
-            print(f"APPLYING GREEN STYLE to {folder_name}")
-            item_container.setStyleSheet("""
-                QWidget {
-                    background: rgba(76, 175, 80, 0.2);
-                    border: 2px solid #4CAF50;
-                    border-radius: 8px;
-                }
-            """)
-        else:
-            item_container.setStyleSheet("""
-                QWidget {
-                    background: transparent;
-                    border: none;
-                    border-radius: 8px;
-                }
-                QWidget:hover {
-                    background: rgba(255, 255, 255, 0.06);
-                }
-            """)
+        set_style_class(item_container, "folderItem", selected=is_selected)
 
         container_layout = QHBoxLayout(item_container)
         container_layout.setContentsMargins(12, 8, 12, 8)
@@ -218,29 +220,7 @@ class VaultWindow(QWidget):
         icon_container = QWidget()
         icon_container.setFixedSize(34, 34)
         icon_container.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
-
-        # Improved folder color mapping
-        folder_colors = {
-            'Battle.net': '#ff6b6b',
-            'Twitch': '#9146ff',
-            'Epic Games': '#0078f2',
-            'Minecraft': '#00c851',
-            'Gmail': '#ea4335',
-            'Random Pass': '#666666',
-            'Social Media': '#1da1f2',
-            'Banking': '#ffa726',
-            'Work': '#795548'
-        }
-
-        folder_color = folder_colors.get(folder_name, '#666666')
-
-        icon_container.setStyleSheet(f"""
-            QWidget {{
-                background: {folder_color};
-                border-radius: 8px;
-                border: none;
-            }}
-        """)
+        set_style_class(icon_container, "folderItemAccent", accent=get_folder_accent(folder_name))
 
         # Better folder icon
         icon_layout = QVBoxLayout(icon_container)
@@ -249,7 +229,7 @@ class VaultWindow(QWidget):
 
         # Use emoji that displays consistently
         folder_icon = QLabel("📂")
-        folder_icon.setStyleSheet("color: white; font-size: 18px; background: transparent; border: none;")
+        set_style_class(folder_icon, "folderItemIcon")
         folder_icon.setAlignment(Qt.AlignmentFlag.AlignCenter)
         folder_icon.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
         icon_layout.addWidget(folder_icon)
@@ -261,18 +241,18 @@ class VaultWindow(QWidget):
 
         name_label = QLabel(folder_name)
         name_label.setFont(QFont("Segoe UI", 12, QFont.Weight.Medium))
-        name_label.setStyleSheet("color: #ffffff; background: transparent; border: none;")
+        set_style_class(name_label, "folderItemName")
         name_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
 
         count_text = f"{password_count} password{'s' if password_count != 1 else ''}"
         count_label = QLabel(count_text)
         count_label.setFont(QFont("Segoe UI", 10))
-        count_color = "#999999"
-        count_label.setStyleSheet(f"color: {count_color}; background: transparent; border: none;")
+        set_style_class(count_label, "folderItemCount")
         count_label.setAttribute(Qt.WidgetAttribute.WA_TransparentForMouseEvents, True)
 
         info_layout.addWidget(name_label)
         info_layout.addWidget(count_label)
+        item_container.count_label = count_label
 
         container_layout.addWidget(icon_container)
         container_layout.addLayout(info_layout, 1)
@@ -373,6 +353,7 @@ class VaultWindow(QWidget):
 
         # Folders container widget inside scroll area
         folders_container = QWidget()
+        folders_container.setObjectName("foldersContainer")
         folders_container.setSizePolicy(QSizePolicy.Policy.Preferred, QSizePolicy.Policy.MinimumExpanding)
         self.folders_list_layout = QVBoxLayout(folders_container)
         self.folders_list_layout.setContentsMargins(0, 0, 8, 10)
@@ -404,24 +385,56 @@ class VaultWindow(QWidget):
 
         # Activity container - no borders
         activity_container = QWidget()
-        activity_layout = QVBoxLayout(activity_container)
-        activity_layout.setContentsMargins(0, 0, 0, 0)
-        activity_layout.setSpacing(8)
+        self.activity_layout = QVBoxLayout(activity_container)
+        self.activity_layout.setContentsMargins(0, 0, 0, 0)
+        self.activity_layout.setSpacing(8)
 
-        # Activity items
-        activities = [
-            ("Steam password updated", "2 min ago"),
-            ("Folder deleted", "30 min ago"),
-            ("New folder created", "Yesterday")
-        ]
-
-        for activity, time_ago in activities:
-            item = self.create_activity_item(activity, time_ago)
-            activity_layout.addWidget(item)
+        self.refresh_recent_activity()
 
         layout.addWidget(activity_container)
         return section
 
+    def get_recent_activities(self, limit=3):
+        """(description, time label) pairs from the activity log, or recent entries without one"""
+        from core.activity_log import get_activity_log, describe_event
+        from core.vault_model import entry_meta
+
+        activity_log = get_activity_log()
+        if activity_log:
+            return [(describe_event(event), format_relative_time(event["ts"]))
+                    for event in activity_log.recent(limit)]
+
+        if not self.vault_model:
+            return []
+
+        activities = []
+        for folder_name, entry in self.vault_model.recent_entries(limit):
+            meta = entry_meta(entry)
+            schema = self.vault_model.get_folder(folder_name).get("schema", [])
+            name = self.get_entry_display_name(entry, schema)
+            action = "added" if meta.get("created") == meta.get("modified") else "updated"
+            activities.append((f"{name} {action}", format_relative_time(meta["modified"])))
+        return activities
+
+    def refresh_recent_activity(self):
+        """Rebuild the Recent Activity list"""
+        while self.activity_layout.count():
+            child = self.activity_layout.takeAt(0)
+            if child.widget():
+                child.widget().deleteLater()
+
+        activities = self.get_recent_activities()
+        if not activities:
+            empty_label = QLabel("No recent activity")
+            empty_label.setFont(QFont("Segoe UI", 10))
+            empty_label.setStyleSheet("color: #888888; background: transparent;")
+            self.activity_layout.addWidget(empty_label)
+            return
+
+        for activity, time_ago in activities:
+            item = self.create_activity_item(activity, time_ago)
+            self.activity_layout.addWidget(item)
+
     def create_activity_item(self, activity, time_ago):
         """Create an activity item with dot indicator - no borders"""
         item = QWidget()
@@ -471,13 +484,10 @@ class VaultWindow(QWidget):
             # Force clean styling on the container to remove any inherited indicators
             if hasattr(self, 'folders_container'):
                 self.folders_container.setStyleSheet("""
-                    QWidget {
+                    QWidget#foldersContainer {
                         background: transparent;
                         border: none;
                     }
-                    QWidget > QWidget {
-                        border: none;
-                    }
                 """)
 
             # Get vault folders
@@ -497,11 +507,13 @@ class VaultWindow(QWidget):
                 self.folders_list_layout.addWidget(no_folders_label)
                 return
 
+            from core.vault_format import entry_count as folder_entry_count
+
             # Add enhanced folder items - THIS WAS MISSING!
             for folder_name in vault_folders:
                 # Get entry count for this folder
                 folder_data = self.vault_data.get("data", {}).get(folder_name, {})
-                entry_count = len(folder_data.get("entries", []))
+                entry_count = folder_entry_count(folder_data)
 
                 # Check if this folder is selected
                 is_selected = (folder_name == self.selected_folder)
@@ -544,6 +556,10 @@ class VaultWindow(QWidget):
         from PyQt6.QtGui import QFont
         from PyQt6.QtCore import Qt
 
+        from core.vault_model import entry_id
+        if self.vault_model:
+            self.vault_model.touch_entry(entry_id(entry))
+
         # Calculate height based on number of fields (more compact)
         field_count = len([field for field in schema if entry.get(field, "")])
         base_height = 180  # Header + buttons + padding
@@ -821,8 +837,9 @@ class VaultWindow(QWidget):
     def create_right_panel(self):
         """Create the main content area with card layout"""
         right_widget = QWidget()
+        right_widget.setObjectName("vaultRightPanel")
         right_widget.setStyleSheet("""
-            QWidget {
+            QWidget#vaultRightPanel {
                 background: #1a1a1d;
             }
         """)
@@ -989,20 +1006,7 @@ class VaultWindow(QWidget):
         card.setMinimumWidth(350)
 
         # Modern card styling with depth, elevation, and shadows
-        card.setStyleSheet("""
-            QWidget {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #404043, stop:1 #373739);
-                border: 1px solid rgba(255, 255, 255, 0.12);
-                border-radius: 12px;
-                cursor: pointer;
-            }
-            QWidget:hover {
-                background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                    stop:0 #4a4a4d, stop:1 #404043);
-                border: 1px solid rgba(255, 255, 255, 0.25);
-            }
-        """)
+        set_style_class(card, "passwordCard", pressed=False)
 
         layout = QVBoxLayout(card)
         layout.setContentsMargins(20, 16, 20, 16)
@@ -1016,13 +1020,7 @@ class VaultWindow(QWidget):
         title = self.get_entry_display_name(entry, schema)
         title_label = QLabel(title)
         title_label.setFont(QFont("Segoe UI", 15, QFont.Weight.DemiBold))
-        title_label.setStyleSheet("""
-            color: #ffffff; 
-            background: transparent;
-            font-weight: 600;
-            border: none;
-            padding: 0px;
-        """)
+        set_style_class(title_label, "passwordCardTitle")
         title_label.setWordWrap(False)
 
         top_row.addWidget(title_label)
@@ -1035,13 +1033,7 @@ class VaultWindow(QWidget):
         if username:
             username_label = QLabel(username)
             username_label.setFont(QFont("Segoe UI", 12))
-            username_label.setStyleSheet("""
-                color: #b0b0b0; 
-                background: transparent;
-                font-weight: 400;
-                border: none;
-                padding: 0px;
-            """)
+            set_style_class(username_label, "passwordCardUsername")
             username_label.setWordWrap(False)
             layout.addWidget(username_label)
         else:
@@ -1053,12 +1045,7 @@ class VaultWindow(QWidget):
         # Card click handler with smooth animation feel
         def open_modal(event):
             # Add subtle visual feedback before opening modal
-            card.setStyleSheet(card.styleSheet() + """
-                QWidget {
-                    background: qlineargradient(x1:0, y1:0, x2:0, y2:1,
-                        stop:0 #4a4a4d, stop:1 #454548);
-                }
-            """)
+            set_style_class(card, "passwordCard", pressed=True)
 
             # Open modal after brief delay for visual feedback
             QTimer.singleShot(50, lambda: self.show_entry_modal(entry_idx, entry, schema))
@@ -1117,7 +1104,7 @@ class VaultWindow(QWidget):
 
         # Update header to match mockup style
         self.folder_title.setText(self.selected_folder)
-        self.folder_subtitle.setText(f"{entry_count} passwords • Last updated 2 days ago")
+        self.update_folder_subtitle(self.selected_folder)
 
         # Get schema
         schema = folder_data.get("schema", ["Title", "Username", "Password"])
@@ -1275,10 +1262,24 @@ class VaultWindow(QWidget):
         parent_layout.addWidget(status_bar)
 
     def load_vault_data(self, vault_data, username, vault_key):
+        from core.vault_model import VaultModel
+        from core.activity_log import open_activity_log
+
+        if self.vault_model:
+            self.vault_model.unsubscribe(self.on_vault_changed)
+        self.vault_model = VaultModel(vault_data, vault_key)
+
+        # Log first so the activity panel sees each change as it is recorded
+        activity_log = open_activity_log(vault_key)
+        if activity_log:
+            self.vault_model.subscribe(activity_log.on_vault_changed)
+            activity_log.subscribe(self.on_activity_logged)
+        self.vault_model.subscribe(self.on_vault_changed)
+
         # Structure vault data
         self.vault_data = {
             "username": username,
-            "data": vault_data
+            "data": self.vault_model.data
         }
         self.vault_key = vault_key
         self.selected_folder = None
@@ -1289,9 +1290,120 @@ class VaultWindow(QWidget):
         # CHANGE: Use the enhanced refresh method
         self.refresh_folders_enhanced()  # Instead of self.refresh_folders()
         self.refresh_entries_cards()
+        self.refresh_recent_activity()
 
         return True
 
+    def clear_vault_data(self):
+        """Drop the unlocked vault, used when locking"""
+        from core.activity_log import get_activity_log
+
+        activity_log = get_activity_log()
+        if self.vault_model:
+            self.vault_model.unsubscribe(self.on_vault_changed)
+            if activity_log:
+                self.vault_model.unsubscribe(activity_log.on_vault_changed)
+        if activity_log:
+            activity_log.unsubscribe(self.on_activity_logged)
+
+        self.vault_model = None
+        self.vault_data = {}
+        self.vault_key = None
+        self.selected_folder = None
+
+    def on_vault_changed(self, event, payload):
+        """Update only the parts of the view affected by a vault model change"""
+        from core import vault_model
+        from gui.analytics_manager import update_vault_stats
+
+        if event == vault_model.VAULT_SAVED:
+            return
+
+        folder = payload.get("folder")
+        self.vault_data["data"] = self.vault_model.data
+        update_vault_stats(self.vault_model.data)
+
+        from core.activity_log import get_activity_log
+        if not get_activity_log():
+            self.refresh_recent_activity()
+
+        if event == vault_model.ENTRY_ADDED:
+            self.update_folder_count(folder)
+            if folder == self.selected_folder:
+                if payload["index"] == 0:
+                    self.refresh_entries_cards()
+                else:
+                    self.place_password_card(folder, payload["index"], payload["entry"])
+                    self.update_folder_subtitle(folder)
+
+        elif event == vault_model.ENTRY_CHANGED:
+            if folder == self.selected_folder:
+                self.place_password_card(folder, payload["index"], payload["entry"])
+                self.update_folder_subtitle(folder)
+
+        elif event == vault_model.ENTRY_REMOVED:
+            self.update_folder_count(folder)
+            if folder == self.selected_folder:
+                self.refresh_entries_cards()
+
+        elif event == vault_model.SCHEMA_CHANGED:
+            if folder == self.selected_folder:
+                self.refresh_entries_cards()
+
+        elif event == vault_model.FOLDER_RENAMED:
+            if self.selected_folder == payload["old_folder"]:
+                self.selected_folder = folder
+                self.folder_title.setText(folder)
+            self.refresh_folders_enhanced()
+
+        elif event == vault_model.FOLDER_REMOVED:
+            if folder == self.selected_folder:
+                self.selected_folder = None
+                self.refresh_entries_cards()
+            self.refresh_folders_enhanced()
+
+        else:
+            self.refresh_folders_enhanced()
+            if event == vault_model.VAULT_RESET:
+                self.refresh_entries_cards()
+
+    def on_activity_logged(self, event):
+        self.refresh_recent_activity()
+
+    def place_password_card(self, folder_name, entry_idx, entry):
+        """Create or replace the card for one entry in the grid"""
+        cards_per_row = 2
+        row = entry_idx // cards_per_row
+        col = entry_idx % cards_per_row
+
+        existing = self.cards_layout.itemAtPosition(row, col)
+        if existing and existing.widget():
+            old_card = existing.widget()
+            self.cards_layout.removeWidget(old_card)
+            old_card.deleteLater()
+
+        schema = self.vault_model.get_folder(folder_name).get("schema", ["Title", "Username", "Password"])
+        card = self.create_password_card(entry_idx, entry, schema)
+        self.cards_layout.addWidget(card, row, col)
+
+    def update_folder_count(self, folder_name):
+        folder_item = self.folder_buttons.get(folder_name)
+        if not folder_item or not hasattr(folder_item, 'count_label'):
+            self.refresh_folders_enhanced()
+            return
+
+        count = len(self.vault_model.get_entries(folder_name))
+        folder_item.count_label.setText(f"{count} password{'s' if count != 1 else ''}")
+
+    def update_folder_subtitle(self, folder_name):
+        entry_count = len(self.vault_model.get_entries(folder_name))
+        subtitle = f"{entry_count} passwords"
+
+        last_modified = self.vault_model.folder_last_modified(folder_name)
+        if last_modified:
+            subtitle += f" • Last updated {format_relative_time(last_modified).lower()}"
+        self.folder_subtitle.setText(subtitle)
+
     def get_folder_button_style(self, is_selected=False):
         if is_selected:
             return """
@@ -1500,18 +1612,9 @@ class VaultWindow(QWidget):
                     return
                 new_entry[field] = value
 
-            # Add to vault data
-            self.vault_data["data"][self.selected_folder]["entries"].append(new_entry)
-
-            # Save to backend
-            from core.vault_manager import save_vault
-            save_vault(self.vault_data["data"], self.vault_key)
-
-            from gui.analytics_manager import update_vault_stats
-            update_vault_stats(self.vault_data["data"])
-
-            # Refresh UI
-            self.refresh_entries_cards()
+            # Add to vault, the model notifies the view
+            self.vault_model.add_entry(self.selected_folder, new_entry)
+            self.vault_model.save()
             dialog.accept()
 
         add_btn.clicked.connect(confirm_add)
@@ -1533,6 +1636,10 @@ class VaultWindow(QWidget):
 
         schema = folder_data.get("schema", ["Title", "Username", "Password"])
 
+        # Addressed by id so the edit lands on the right entry even if the list shifts
+        from core.vault_model import entry_id
+        target_id = entry_id(entry)
+
         # Create dialog
         dialog_height = 350 + (len(schema) * 40)
         dialog = ModernDialog(self, "Edit Entry")
@@ -1604,18 +1711,13 @@ class VaultWindow(QWidget):
                     return
                 updated_entry[field] = value
 
-            # Update the entry
-            folder_data["entries"][entry_idx] = updated_entry
-
-            # Save to backend
-            from core.vault_manager import save_vault
-            save_vault(self.vault_data["data"], self.vault_key)
-
-            from gui.analytics_manager import update_vault_stats
-            update_vault_stats(self.vault_data["data"])
-
-            # Refresh UI
-            self.refresh_entries_cards()
+            # Update the entry, the model notifies the view
+            folder_name, current_idx = self.vault_model.locate(target_id)
+            if folder_name is None:
+                error_label.setText("This entry no longer exists")
+                return
+            self.vault_model.update_entry(folder_name, current_idx, updated_entry)
+            self.vault_model.save()
             dialog.accept()
 
         save_btn.clicked.connect(confirm_edit)
@@ -1627,6 +1729,9 @@ class VaultWindow(QWidget):
         dialog.exec()
 
     def delete_entry(self, entry_idx):
+        from core.vault_model import entry_id
+        target_id = entry_id(self.vault_model.get_entries(self.selected_folder)[entry_idx])
+
         # Create confirmation dialog
         dialog = ModernDialog(self, "Delete Entry")
         dialog.setFixedSize(350, 220)
@@ -1664,19 +1769,11 @@ class VaultWindow(QWidget):
         """)
 
         def confirm_delete():
-            # Remove entry from vault data
-            folder_data = self.vault_data["data"][self.selected_folder]
-            folder_data["entries"].pop(entry_idx)
-
-            # Save to backend
-            from core.vault_manager import save_vault
-            save_vault(self.vault_data["data"], self.vault_key)
-
-            from gui.analytics_manager import update_vault_stats
-            update_vault_stats(self.vault_data["data"])
-
-            # Refresh UI
-            self.refresh_entries_cards()
+            # Remove entry, the model notifies the view
+            folder_name, current_idx = self.vault_model.locate(target_id)
+            if folder_name is not None:
+                self.vault_model.remove_entry(folder_name, current_idx)
+                self.vault_model.save()
             dialog.accept()
 
         delete_btn.clicked.connect(confirm_delete)
@@ -1797,26 +1894,12 @@ class VaultWindow(QWidget):
             if not has_title:
                 new_fields = ["Title"] + new_fields
 
-            # Get current folder data
-            current_folder_data = self.vault_data["data"][self.selected_folder]
-
-            # Update the schema
-            current_folder_data["schema"] = new_fields
-
-            # If name changed, rename folder
+            # Update the schema, then rename if needed; the model notifies the view
+            self.vault_model.update_schema(self.selected_folder, new_fields)
             if new_folder_name != self.selected_folder:
-                self.vault_data["data"][new_folder_name] = current_folder_data
-                del self.vault_data["data"][self.selected_folder]
-                self.selected_folder = new_folder_name
-
-            # Save to backend
-            from core.vault_manager import save_vault
-            save_vault(self.vault_data["data"], self.vault_key)
-
-            # Update UI
-            self.refresh_folders_enhanced()
-            self.refresh_entries_cards()
+                self.vault_model.rename_folder(self.selected_folder, new_folder_name)
 
+            self.vault_model.save()
             dialog.accept()
 
         save_btn.clicked.connect(confirm_edit)
@@ -1845,7 +1928,8 @@ class VaultWindow(QWidget):
 
         # Entry count info
         folder_data = self.vault_data.get("data", {}).get(self.selected_folder, {})
-        entry_count = len(folder_data.get("entries", []))
+        from core.vault_format import entry_count as folder_entry_count
+        entry_count = folder_entry_count(folder_data)
 
         if entry_count > 0:
             count_label = QLabel(f"This folder contains {entry_count} entry(ies) that will also be deleted.")
@@ -1878,20 +1962,9 @@ class VaultWindow(QWidget):
         """)
 
         def confirm_delete():
-            # Remove folder from vault data
-            del self.vault_data["data"][self.selected_folder]
-
-            # Save to backend
-            from core.vault_manager import save_vault
-            save_vault(self.vault_data["data"], self.vault_key)
-
-            from gui.analytics_manager import update_vault_stats
-            update_vault_stats(self.vault_data["data"])
-
-            # Reset selection and refresh UI
-            self.selected_folder = None
-            self.refresh_folders_enhanced()
-            self.refresh_entries_cards()
+            # Remove folder, the model resets the selection and refreshes the view
+            self.vault_model.remove_folder(self.selected_folder)
+            self.vault_model.save()
 
             dialog.accept()
 
@@ -2823,19 +2896,9 @@ class FolderCreationDialog(ModernDialog):
         if not has_title:
             schema = ["Title"] + schema
 
-        # Create folder using existing backend
-        from core.vault_manager import add_folder
-        add_folder(self.parent.vault_key, folder_name, schema)
-
-        # Update analytics and UI
-        from gui.analytics_manager import update_vault_stats
-        update_vault_stats(self.parent.vault_data["data"])
-
-        # Reload vault data
-        from core.vault_manager import load_vault
-        updated_vault_data = load_vault(self.parent.vault_key)
-        self.parent.vault_data["data"] = updated_vault_data
-        self.parent.refresh_folders_enhanced()
+        # Add to the in-memory model, no need to reload the vault from disk
+        self.parent.vault_model.add_folder(folder_name, schema)
+        self.parent.vault_model.save()
 
         self.accept()
 
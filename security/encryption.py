@@ -52,6 +52,26 @@ def decrypt_vault(token: bytes, key: bytes) -> dict:
     return json.loads(data.decode('utf-8'))
 
 
+def generate_data_key() -> bytes:
+    """Random 32-byte key that encrypts the vault itself"""
+    return os.urandom(32)
+
+
+def wrap_data_key(data_key: bytes, key_encryption_key: bytes) -> str:
+    """AES key wrap (RFC 3394) of the vault key, base64 for the auth file"""
+    from cryptography.hazmat.primitives.keywrap import aes_key_wrap
+    wrapped = aes_key_wrap(key_encryption_key, data_key, backend=default_backend())
+    return base64.b64encode(wrapped).decode('utf-8')
+
+
+def unwrap_data_key(wrapped_key: str, key_encryption_key: bytes) -> bytes:
+    from cryptography.hazmat.primitives.keywrap import aes_key_unwrap, InvalidUnwrap
+    try:
+        return aes_key_unwrap(key_encryption_key, base64.b64decode(wrapped_key), backend=default_backend())
+    except InvalidUnwrap:
+        raise ValueError("Wrapped vault key does not match this password or recovery key")
+
+
 def ensure_vault_exists(key: bytes, vault_path: str = VAULT_PATH):
     if not os.path.exists(vault_path):
         empty_data = {}
@@ -0,0 +1,144 @@
+"""
+AnalyticsUploader against a local HTTP endpoint.
+"""
+
+import json
+import os
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from gui.analytics_uploader import AnalyticsUploader, main_thread_callback
+
+
+class AnalyticsEndpoint:
+    """Records every POST body and answers with queued status codes, then 200"""
+
+    def __init__(self):
+        self.received = []
+        self.headers = []
+        self.statuses = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    @property
+    def url(self):
+        return f"http://127.0.0.1:{self.server.server_address[1]}/analytics"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _handler(self):
+        endpoint = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_POST(self):
+                body = self.rfile.read(int(self.headers.get("Content-Length") or 0))
+                status = endpoint.statuses.pop(0) if endpoint.statuses else 200
+                if status == 200:
+                    endpoint.received.append(json.loads(body))
+                    endpoint.headers.append(dict(self.headers))
+                self.send_response(status)
+                self.send_header("Content-Length", "0")
+                self.end_headers()
+
+        return Handler
+
+
+class UploaderTests(unittest.TestCase):
+    def setUp(self):
+        self.endpoint = AnalyticsEndpoint()
+        self.addCleanup(self.endpoint.close)
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.spool_path = os.path.join(self.directory.name, "analytics_spool.jsonl")
+        self.sent_calls = []
+
+    def make_uploader(self, **kwargs):
+        uploader = AnalyticsUploader(endpoint=self.endpoint.url, spool_path=self.spool_path,
+                                     base_delay=0.01, max_delay=0.05,
+                                     on_sent=lambda: self.sent_calls.append(threading.current_thread()),
+                                     **kwargs)
+        self.addCleanup(uploader.stop)
+        return uploader
+
+    def test_each_snapshot_is_posted_as_a_single_json_object(self):
+        uploader = self.make_uploader()
+        uploader.enqueue({"vault_id": "a", "opens": 1})
+        uploader.enqueue({"vault_id": "b", "opens": 2})
+
+        while uploader.send_pending():
+            pass
+
+        self.assertEqual(self.endpoint.received, [{"vault_id": "a", "opens": 1}, {"vault_id": "b", "opens": 2}])
+        for headers in self.endpoint.headers:
+            self.assertEqual(headers.get("Content-Type"), "application/json")
+            self.assertNotIn("Content-Encoding", headers)
+        self.assertEqual(uploader.pending_count(), 0)
+        self.assertFalse(os.path.exists(self.spool_path))
+
+    def test_only_the_newest_snapshot_per_vault_is_sent(self):
+        uploader = self.make_uploader()
+        for opens in range(3):
+            uploader.enqueue({"vault_id": "a", "opens": opens})
+
+        uploader.send_pending()
+
+        self.assertEqual(self.endpoint.received, [{"vault_id": "a", "opens": 2}])
+        self.assertEqual(len(self.sent_calls), 1)
+
+    def test_failed_send_keeps_the_spool(self):
+        self.endpoint.statuses = [503]
+        uploader = self.make_uploader()
+        uploader.enqueue({"vault_id": "a"})
+
+        with self.assertRaises(RuntimeError):
+            uploader.send_pending()
+
+        self.assertEqual(uploader.pending_count(), 1)
+        self.assertEqual(self.sent_calls, [])
+
+    def test_spool_survives_a_restart(self):
+        self.make_uploader().enqueue({"vault_id": "a"})
+
+        self.assertTrue(self.make_uploader().send_pending())
+        self.assertEqual(self.endpoint.received, [{"vault_id": "a"}])
+
+    def test_background_thread_retries_until_sent(self):
+        self.endpoint.statuses = [500, 503]
+        uploader = self.make_uploader()
+        uploader.enqueue({"vault_id": "a"})
+        uploader.start()
+
+        self.assertTrue(uploader.flush(timeout=5))
+        self.assertEqual(self.endpoint.received, [{"vault_id": "a"}])
+        self.assertEqual(uploader.pending_count(), 0)
+
+
+class MainThreadCallbackTests(unittest.TestCase):
+    def test_calls_from_a_worker_run_on_the_main_thread(self):
+        from PyQt6.QtCore import QCoreApplication
+
+        ran_on = []
+        callback = main_thread_callback(lambda: ran_on.append(threading.current_thread()))
+        # Wrapped before the application exists, as the dev startup does
+        app = QCoreApplication.instance() or QCoreApplication([])
+
+        # The first call, which makes the relay, comes from the worker
+        for _ in range(2):
+            worker = threading.Thread(target=callback)
+            worker.start()
+            worker.join()
+        self.assertEqual(ran_on, [])
+
+        app.processEvents()
+        self.assertEqual(ran_on, [threading.main_thread()] * 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
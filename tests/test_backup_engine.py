@@ -0,0 +1,207 @@
+"""
+BackupEngine snapshots against an in-memory target.
+"""
+
+import os
+import random
+import tempfile
+import threading
+import unittest
+from datetime import datetime, timedelta, timezone
+
+from core import backup_engine
+from core.backup_engine import CHUNK_PREFIX, MANIFEST_SUFFIX, BackupEngine, split_chunks
+from core.backup_targets import BackupTarget
+from core.vault_format import decode_vault, encode_vault
+
+
+class MemoryTarget(BackupTarget):
+    name = "memory"
+    EPOCH = datetime(2024, 1, 1, tzinfo=timezone.utc)
+
+    def __init__(self):
+        self.objects = {}
+        self.next_id = 1
+        self.puts = []
+        self.on_put = None
+
+    def list_objects(self, prefix):
+        return [{"id": object_id, "name": name, "createdTime": created.isoformat()}
+                for object_id, (name, _, created) in self.objects.items() if name.startswith(prefix)]
+
+    def put_object(self, name, data):
+        object_id = f"object{self.next_id}"
+        # One second per upload keeps upload order visible in createdTime
+        self.objects[object_id] = (name, bytes(data), self.EPOCH + timedelta(seconds=self.next_id))
+        self.next_id += 1
+        self.puts.append(name)
+        if self.on_put:
+            self.on_put(name)
+        return object_id
+
+    def get_object(self, object_id):
+        return self.objects[object_id][1]
+
+    def delete_object(self, object_id):
+        self.objects.pop(object_id, None)
+
+    def download_object(self, object_id, f):
+        f.write(self.get_object(object_id))
+
+
+def make_vault(folder_count=20, entries_per_folder=40):
+    rng = random.Random(1)
+    return {
+        f"folder{index}": {
+            "schema": ["username", "password"],
+            "entries": [{"username": f"user{index}_{n}", "password": "%030x" % rng.getrandbits(120)}
+                        for n in range(entries_per_folder)]
+        }
+        for index in range(folder_count)
+    }
+
+
+class BackupEngineTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.key = os.urandom(32)
+        self.vault_path = self.path("vault.enc")
+        self.target = MemoryTarget()
+        self.engine = BackupEngine(self.target, policy={"last": 100}, state_path=self.path("state.json"))
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def write_vault(self, token):
+        with open(self.vault_path, 'wb') as f:
+            f.write(token)
+
+    def chunk_puts(self):
+        return [name for name in self.target.puts if name.startswith(CHUNK_PREFIX)]
+
+
+class ChunkingTests(unittest.TestCase):
+    def test_chunks_rejoin_and_respect_bounds(self):
+        data = os.urandom(1024 * 1024)
+        chunks = list(split_chunks(data))
+
+        self.assertEqual(b"".join(chunks), data)
+        self.assertTrue(all(len(c) >= backup_engine.MIN_CHUNK_SIZE for c in chunks[:-1]))
+        self.assertTrue(all(len(c) <= backup_engine.MAX_CHUNK_SIZE for c in chunks))
+
+    def test_insertion_only_changes_nearby_chunks(self):
+        data = os.urandom(1024 * 1024)
+        edited = data[:300000] + b"inserted bytes" + data[300000:]
+
+        before = set(split_chunks(data))
+        after = list(split_chunks(edited))
+
+        changed = [c for c in after if c not in before]
+        self.assertLessEqual(len(changed), 2)
+
+
+class SnapshotTests(BackupEngineTestCase):
+    def test_changing_one_folder_reuses_the_other_folders(self):
+        data = make_vault()
+        self.write_vault(encode_vault(data, self.key))
+        self.assertTrue(self.engine.backup(self.vault_path)[0])
+        first_upload = len(self.chunk_puts())
+
+        # Saving re-encrypts only the edited folder, the rest keep their ciphertext
+        loaded = decode_vault(open(self.vault_path, 'rb').read(), self.key)
+        loaded["folder7"]["entries"].append({"username": "new", "password": "secret"})
+        self.write_vault(encode_vault(loaded, self.key))
+        self.target.puts.clear()
+
+        self.assertTrue(self.engine.backup(self.vault_path)[0])
+        self.assertLess(len(self.chunk_puts()), max(2, first_upload // 2))
+
+    def test_unchanged_vault_is_skipped(self):
+        self.write_vault(encode_vault(make_vault(), self.key))
+        self.engine.backup(self.vault_path)
+        self.target.puts.clear()
+
+        ok, message = self.engine.backup(self.vault_path)
+        self.assertTrue(ok)
+        self.assertEqual(self.target.puts, [])
+
+    def test_snapshot_restores_byte_for_byte(self):
+        token = encode_vault(make_vault(), self.key)
+        self.write_vault(token)
+        self.engine.backup(self.vault_path)
+
+        (_, snapshot), = self.engine.list_snapshots()
+        restored = self.path("restored.enc")
+        self.engine.download_snapshot(snapshot, restored)
+
+        with open(restored, 'rb') as f:
+            self.assertEqual(f.read(), token)
+
+
+class PruneTests(BackupEngineTestCase):
+    def setUp(self):
+        super().setUp()
+        self.engine.policy = {"last": 1}
+
+    def manifests(self):
+        return [name for name, _, _ in self.target.objects.values() if name.endswith(MANIFEST_SUFFIX)]
+
+    def test_prune_waits_for_a_backup_still_uploading_to_the_target(self):
+        self.write_vault(encode_vault(make_vault(folder_count=2), self.key))
+        self.engine.backup(self.vault_path)
+        # An expired snapshot so the other engine has something to prune
+        self.target.put_object("vault_backup_20200101_000000" + MANIFEST_SUFFIX, b'{"chunks": []}')
+
+        other = BackupEngine(self.target, policy={"last": 1}, state_path=self.path("other.json"))
+        pruner = threading.Thread(target=other.prune)
+
+        def prune_mid_upload(name):
+            if name.startswith(CHUNK_PREFIX) and not pruner.is_alive():
+                pruner.start()
+                pruner.join(0.2)
+                self.assertTrue(pruner.is_alive())
+
+        self.write_vault(encode_vault(make_vault(folder_count=3), self.key))
+        self.target.on_put = prune_mid_upload
+        self.assertTrue(self.engine.backup(self.vault_path)[0])
+        self.target.on_put = None
+        pruner.join()
+
+        (_, newest), = self.engine.list_snapshots()
+        self.engine.download_snapshot(newest, self.path("restored.enc"))
+
+    def test_unreferenced_chunks_newer_than_every_manifest_are_kept(self):
+        self.write_vault(encode_vault(make_vault(folder_count=2), self.key))
+        self.engine.backup(self.vault_path)
+        self.target.put_object("vault_backup_20200101_000000" + MANIFEST_SUFFIX, b'{"chunks": []}')
+        # Written by a backup that hasn't reached its manifest yet
+        self.target.put_object(CHUNK_PREFIX + "in-flight", b"data")
+        self.target.objects["stale"] = (CHUNK_PREFIX + "stale", b"old", MemoryTarget.EPOCH)
+
+        self.assertEqual(self.engine.prune(), 1)
+
+        names = {name for name, _, _ in self.target.objects.values()}
+        self.assertIn(CHUNK_PREFIX + "in-flight", names)
+        self.assertNotIn(CHUNK_PREFIX + "stale", names)
+        self.assertEqual(len(self.manifests()), 1)
+
+
+class TargetInterfaceTests(unittest.TestCase):
+    def test_target_missing_a_method_fails_when_created(self):
+        class NoDelete(BackupTarget):
+            def list_objects(self, prefix=""):
+                return []
+
+            def put_object(self, name, data):
+                return name
+
+            def get_object(self, object_id):
+                return b""
+
+        with self.assertRaises(TypeError):
+            NoDelete()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,111 @@
+"""
+Restoring snapshots from a local backup folder.
+"""
+
+import base64
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from core.backup_engine import BackupEngine
+from core.backup_restore import OlderKeyRequired, backup_password_key, preview_snapshot, restore_snapshot
+from core.backup_targets import LocalDirectoryTarget
+from core.vault_format import decode_vault, encode_vault, materialize
+from security.encryption import derive_key, generate_data_key
+
+VAULT = {"Games": {"schema": ["username", "password"],
+                   "entries": [{"username": "player", "password": "hunter2"}]}}
+PASSWORD = "Old-password1"
+
+
+class PreMigrationRestoreTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        os.makedirs(self.path("backups"))
+        self.target = LocalDirectoryTarget(self.path("backups"))
+        self.vault_path = self.path("vault.enc")
+
+        vault_salt = os.urandom(16)
+        self.auth_path = self.path("credentials.enc")
+        with open(self.auth_path, 'w') as f:
+            json.dump({"vault_salt": base64.b64encode(vault_salt).decode('utf-8')}, f)
+
+        # Backed up while the vault was still encrypted with the password key itself
+        self.password_key = derive_key(PASSWORD, vault_salt)
+        with open(self.vault_path, 'wb') as f:
+            f.write(encode_vault(VAULT, self.password_key))
+        engine = BackupEngine(self.target, state_path=self.path("state.json"))
+        self.assertTrue(engine.backup(self.vault_path)[0])
+        (_, self.snapshot), = engine.list_snapshots()
+
+        # Then migrated to a random vault key
+        self.data_key = generate_data_key()
+        with open(self.vault_path, 'wb') as f:
+            f.write(encode_vault(VAULT, self.data_key))
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def test_current_key_alone_asks_for_the_older_password(self):
+        with self.assertRaises(OlderKeyRequired):
+            restore_snapshot(self.target, self.snapshot, self.data_key, vault_path=self.vault_path)
+
+    def test_wrong_older_password_is_rejected(self):
+        older_key = backup_password_key("Wrong-password1", self.auth_path)
+        with self.assertRaises(OlderKeyRequired):
+            restore_snapshot(self.target, self.snapshot, self.data_key, vault_path=self.vault_path,
+                             older_key=older_key)
+
+    def test_older_password_restores_under_the_current_key(self):
+        older_key = backup_password_key(PASSWORD, self.auth_path)
+
+        self.assertEqual(preview_snapshot(self.target, self.snapshot, self.data_key, older_key), {"Games": 1})
+        data = restore_snapshot(self.target, self.snapshot, self.data_key, vault_path=self.vault_path,
+                                older_key=older_key)
+
+        self.assertEqual(data, VAULT)
+        with open(self.vault_path, 'rb') as f:
+            self.assertEqual(materialize(decode_vault(f.read(), self.data_key)), VAULT)
+
+
+class PreviewTests(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        backups = os.path.join(self.directory.name, "backups")
+        os.makedirs(backups)
+        self.target = LocalDirectoryTarget(backups)
+
+        self.key = generate_data_key()
+        self.vault = {f"folder{index}": {"schema": ["username", "password"],
+                                         "entries": [{"username": f"user{n}", "password": os.urandom(16).hex()}
+                                                     for n in range(100)]}
+                      for index in range(30)}
+        vault_path = os.path.join(self.directory.name, "vault.enc")
+        with open(vault_path, 'wb') as f:
+            f.write(encode_vault(self.vault, self.key))
+
+        engine = BackupEngine(self.target, state_path=os.path.join(self.directory.name, "state.json"))
+        self.assertTrue(engine.backup(vault_path)[0])
+        (_, self.snapshot), = engine.list_snapshots()
+        self.chunk_count = len(engine.read_manifest(self.snapshot)["chunks"])
+
+    def test_preview_reads_only_the_folder_index(self):
+        with mock.patch.object(self.target, "get_object", wraps=self.target.get_object) as get_object:
+            folders = preview_snapshot(self.target, self.snapshot, self.key)
+
+        self.assertEqual(folders, {name: 100 for name in self.vault})
+        # The manifest and the chunks holding the header, not the whole vault
+        self.assertGreater(self.chunk_count, 4)
+        self.assertLessEqual(get_object.call_count, 3)
+
+    def test_preview_with_the_wrong_key_asks_for_the_older_password(self):
+        with self.assertRaises(OlderKeyRequired):
+            preview_snapshot(self.target, self.snapshot, generate_data_key())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,90 @@
+"""
+BackupScheduler idle detection and queue handling.
+"""
+
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from core.backup_scheduler import NO_TARGETS_MESSAGE, BackupScheduler
+from core.vault_model import ENTRY_CHANGED
+
+
+class SchedulerTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.targets = ["drive"]
+        self.input_idle = 600
+        self.results = []
+
+        patcher = mock.patch("core.backup_targets.backup_to_targets",
+                             side_effect=lambda path, targets: [(mock.Mock(display_name=t), True, "Backed up")
+                                                                for t in targets])
+        self.backup_to_targets = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def scheduler(self):
+        scheduler = BackupScheduler(
+            lambda: self.targets,
+            vault_path_provider=lambda: "vault.enc",
+            queue_path=os.path.join(self.directory.name, "backup_queue.json"),
+            on_result=lambda success, message: self.results.append((success, message)),
+            save_threshold=1, dirty_minutes=30, idle_seconds=60, min_interval_minutes=0,
+            idle_provider=lambda: self.input_idle,
+        )
+        scheduler.enqueue("saves")
+        return scheduler
+
+
+class IdleTests(SchedulerTestCase):
+    def test_recent_input_holds_the_backup(self):
+        self.input_idle = 5
+        scheduler = self.scheduler()
+
+        self.assertFalse(scheduler.run_pending())
+        self.backup_to_targets.assert_not_called()
+        self.assertEqual(len(scheduler.pending_jobs()), 1)
+
+    def test_idle_input_runs_the_backup(self):
+        scheduler = self.scheduler()
+
+        self.assertTrue(scheduler.run_pending())
+        self.assertEqual(scheduler.pending_jobs(), [])
+        self.assertEqual(self.results, [(True, "Backed up")])
+
+    def test_vault_activity_still_counts_as_input(self):
+        scheduler = self.scheduler()
+        scheduler.on_vault_changed(ENTRY_CHANGED, None)
+
+        self.assertFalse(scheduler.run_pending())
+
+    def test_unknown_input_idle_falls_back_to_vault_activity(self):
+        self.input_idle = None
+        scheduler = self.scheduler()
+
+        self.assertTrue(scheduler.run_pending())
+
+
+class NoTargetTests(SchedulerTestCase):
+    def test_job_and_dirty_state_wait_for_a_target(self):
+        self.targets = []
+        scheduler = self.scheduler()
+        scheduler._state["saves"], scheduler._state["dirty_since"] = 3, 1000
+
+        self.assertFalse(scheduler.run_pending())
+        self.assertFalse(scheduler.run_pending())
+
+        self.assertEqual(len(scheduler.pending_jobs()), 1)
+        self.assertEqual((scheduler._state["saves"], scheduler._state["dirty_since"]), (3, 1000))
+        self.assertEqual(self.results, [(False, NO_TARGETS_MESSAGE)])
+
+        self.targets = ["drive"]
+        self.assertTrue(scheduler.run_pending())
+        self.assertEqual(scheduler.pending_jobs(), [])
+        self.assertEqual(scheduler._state["saves"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
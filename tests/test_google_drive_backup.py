@@ -0,0 +1,366 @@
+"""
+GoogleDriveBackup against a local stand-in for the Drive v3 API.
+
+The stand-in keeps files in memory and implements just the calls the backup
+code makes: folder search and creation, paginated listing, resumable uploads,
+media downloads and deletes. Tests can make the next responses fail to check
+retries and folder cache invalidation.
+"""
+
+import functools
+import json
+import os
+import tempfile
+import threading
+import unittest
+import urllib.parse
+from datetime import datetime, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+from core import google_drive_backup
+from core.google_drive_backup import BACKUP_FOLDER_NAME, GoogleDriveBackup
+
+FOLDER_MIME = "application/vnd.google-apps.folder"
+
+
+class FakeDrive:
+    """In-memory Drive: files by id plus pending resumable sessions"""
+
+    def __init__(self):
+        self.lock = threading.Lock()
+        self.files = {}
+        self.sessions = {}
+        self.next_id = 1
+        self.requests = []
+        # (method, path prefix) -> list of status codes to return before behaving normally
+        self.failures = {}
+
+    def new_id(self, prefix):
+        with self.lock:
+            file_id = f"{prefix}{self.next_id}"
+            self.next_id += 1
+        return file_id
+
+    def add_file(self, name, parent, data=b"", mime="application/octet-stream"):
+        file_id = self.new_id("file")
+        self.files[file_id] = {
+            "id": file_id, "name": name, "parents": [parent], "mimeType": mime, "data": data,
+            "createdTime": f"2024-01-01T00:00:{self.next_id:02d}Z"
+        }
+        return file_id
+
+    def fail_next(self, method, path_prefix, *statuses):
+        self.failures.setdefault((method, path_prefix), []).extend(statuses)
+
+    def injected_failure(self, method, path):
+        for (fail_method, prefix), statuses in self.failures.items():
+            if fail_method == method and path.startswith(prefix) and statuses:
+                return statuses.pop(0)
+        return None
+
+    def count(self, method, path_prefix):
+        return sum(1 for m, p in self.requests if m == method and p.startswith(path_prefix))
+
+
+def make_handler(drive):
+    class Handler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def _reply(self, status, body=None, headers=None):
+            payload = json.dumps(body).encode('utf-8') if isinstance(body, (dict, list)) else (body or b"")
+            self.send_response(status)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header("Content-Length", str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+        def _body(self):
+            length = int(self.headers.get("Content-Length") or 0)
+            return self.rfile.read(length) if length else b""
+
+        def _handle(self, method):
+            url = urllib.parse.urlparse(self.path)
+            query = dict(urllib.parse.parse_qsl(url.query))
+            drive.requests.append((method, url.path))
+
+            status = drive.injected_failure(method, url.path)
+            if status:
+                self._body()
+                return self._reply(status, {"error": status})
+
+            handler = getattr(self, f"_{method.lower()}", None)
+            return handler(url.path, query)
+
+        def do_GET(self):
+            self._handle("GET")
+
+        def do_POST(self):
+            self._handle("POST")
+
+        def do_PUT(self):
+            self._handle("PUT")
+
+        def do_DELETE(self):
+            self._handle("DELETE")
+
+        # =====================================================================
+        # FILES
+        # =====================================================================
+
+        def _get(self, path, query):
+            if path == "/drive/v3/files":
+                return self._list(query)
+
+            file_id = path.rsplit("/", 1)[-1]
+            item = drive.files.get(file_id)
+            if item is None:
+                return self._reply(404)
+            return self._reply(200, item["data"])
+
+        def _list(self, query):
+            q = query.get("q", "")
+            matches = [f for f in drive.files.values() if "trashed" not in f]
+            if "mimeType='application/vnd.google-apps.folder'" in q:
+                name = q.split("name='", 1)[1].split("'", 1)[0]
+                matches = [f for f in matches if f["mimeType"] == FOLDER_MIME and f["name"] == name]
+            else:
+                parent = q.split("'", 2)[1]
+                if parent not in drive.files:
+                    return self._reply(404)
+                fragment = q.split("name contains '", 1)[1].split("'", 1)[0]
+                matches = [f for f in matches if parent in f["parents"] and fragment in f["name"]]
+
+            matches.sort(key=lambda f: f["createdTime"], reverse=True)
+            start = int(query.get("pageToken", 0))
+            size = int(query.get("pageSize", 100))
+            page = matches[start:start + size]
+            result = {"files": [{k: v for k, v in f.items() if k in ("id", "name", "createdTime")}
+                                for f in page]}
+            if start + size < len(matches):
+                result["nextPageToken"] = str(start + size)
+            return self._reply(200, result)
+
+        def _post(self, path, query):
+            body = json.loads(self._body() or b"{}")
+
+            if path == "/drive/v3/files":
+                file_id = drive.add_file(body["name"], "root", mime=body.get("mimeType"))
+                return self._reply(200, {"id": file_id})
+
+            if path == "/upload/drive/v3/files" and query.get("uploadType") == "resumable":
+                parent = body["parents"][0]
+                if parent not in drive.files:
+                    return self._reply(404)
+                session_id = drive.new_id("session")
+                drive.sessions[session_id] = {
+                    "name": body["name"], "parent": parent, "data": b"",
+                    "size": int(self.headers["X-Upload-Content-Length"])
+                }
+                location = f"http://{self.headers['Host']}/upload/session/{session_id}"
+                return self._reply(200, {}, {"Location": location})
+
+            return self._reply(400)
+
+        def _put(self, path, query):
+            session_id = path.rsplit("/", 1)[-1]
+            session = drive.sessions.get(session_id)
+            chunk = self._body()
+            if session is None:
+                return self._reply(404)
+
+            content_range = self.headers["Content-Range"].split(" ", 1)[1]
+            if not content_range.startswith("*"):
+                start = int(content_range.split("-", 1)[0])
+                if start != len(session["data"]):
+                    return self._reply(400)
+                session["data"] += chunk
+
+            if len(session["data"]) == session["size"]:
+                file_id = drive.add_file(session["name"], session["parent"], session["data"])
+                del drive.sessions[session_id]
+                return self._reply(200, {"id": file_id})
+
+            headers = {"Range": f"bytes=0-{len(session['data']) - 1}"} if session["data"] else {}
+            return self._reply(308, None, headers)
+
+        def _delete(self, path, query):
+            file_id = path.rsplit("/", 1)[-1]
+            if drive.files.pop(file_id, None) is None:
+                return self._reply(404)
+            return self._reply(204)
+
+    return Handler
+
+
+class DriveBackupTestCase(unittest.TestCase):
+    def setUp(self):
+        self.drive = FakeDrive()
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), make_handler(self.drive))
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.addCleanup(self.server.server_close)
+        self.addCleanup(self.server.shutdown)
+
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        for name, value in (("UPLOAD_BASE_DELAY", 0), ("UPLOAD_CHUNK_SIZE", 256 * 1024)):
+            patcher = mock.patch.object(google_drive_backup, name, value)
+            patcher.start()
+            self.addCleanup(patcher.stop)
+
+        self.backup = self.make_backup()
+
+    def make_backup(self):
+        directory = self.directory.name
+        with mock.patch.object(GoogleDriveBackup, "_get_app_directory", lambda self: directory):
+            backup = GoogleDriveBackup(api_base=f"http://127.0.0.1:{self.server.server_address[1]}")
+        backup._get_app_directory = lambda: directory
+        backup.access_token = "token"
+        backup.refresh_token = "refresh"
+        return backup
+
+    def saved_state(self):
+        with open(os.path.join(self.directory.name, "gdrive_state.json")) as f:
+            return json.load(f)
+
+
+class FolderCacheTests(DriveBackupTestCase):
+    def test_folder_id_is_looked_up_once_and_persisted(self):
+        folder_id = self.backup._get_or_create_vault_folder()
+
+        self.assertEqual(self.drive.files[folder_id]["name"], BACKUP_FOLDER_NAME)
+        self.assertEqual(self.saved_state()["folder_id"], folder_id)
+
+        # A fresh instance reads the cache instead of searching Drive again
+        lookups = self.drive.count("GET", "/drive/v3/files")
+        self.assertEqual(self.make_backup()._get_or_create_vault_folder(), folder_id)
+        self.assertEqual(self.drive.count("GET", "/drive/v3/files"), lookups)
+
+    def test_existing_folder_is_reused(self):
+        existing = self.drive.add_file(BACKUP_FOLDER_NAME, "root", mime=FOLDER_MIME)
+        self.assertEqual(self.backup._get_or_create_vault_folder(), existing)
+        self.assertEqual(self.drive.count("POST", "/drive/v3/files"), 0)
+
+    def test_listing_a_deleted_folder_invalidates_the_cache(self):
+        folder_id = self.backup._get_or_create_vault_folder()
+        del self.drive.files[folder_id]
+
+        with self.assertRaises(Exception):
+            self.backup.list_backups()
+        self.assertNotIn("folder_id", self.saved_state())
+
+        # The next call creates a new folder
+        self.assertNotEqual(self.backup._get_or_create_vault_folder(), folder_id)
+
+    def test_upload_into_a_deleted_folder_recreates_it(self):
+        folder_id = self.backup._get_or_create_vault_folder()
+        del self.drive.files[folder_id]
+
+        object_id = self.backup.put_object("vault_chunk_abc", b"data")
+
+        new_folder = self.drive.files[object_id]["parents"][0]
+        self.assertNotEqual(new_folder, folder_id)
+        self.assertEqual(self.saved_state()["folder_id"], new_folder)
+
+
+class ListingTests(DriveBackupTestCase):
+    def test_list_backups_follows_pagination(self):
+        folder_id = self.backup._get_or_create_vault_folder()
+        for index in range(7):
+            self.drive.add_file(f"vault_backup_2024010{index}.enc", folder_id)
+        self.drive.add_file("not_a_vault_backup_x", folder_id)
+
+        backups = self.backup.list_backups(page_size=3)
+
+        self.assertEqual(len(backups), 7)
+        self.assertEqual(self.drive.count("GET", "/drive/v3/files") - 1, 3)
+        self.assertTrue(all(b["name"].startswith("vault_backup_") for b in backups))
+
+    def test_status_counts_every_page(self):
+        folder_id = self.backup._get_or_create_vault_folder()
+        for index in range(5):
+            self.drive.add_file(f"vault_backup_2024010{index}.enc", folder_id)
+
+        listings = self.drive.count("GET", "/drive/v3/files")
+        with mock.patch.object(self.backup, "list_backups", functools.partial(self.backup.list_backups, page_size=2)):
+            status = self.backup.get_backup_status()
+
+        self.assertEqual(status["backup_count"], 5)
+        self.assertEqual(self.drive.count("GET", "/drive/v3/files") - listings, 3)
+        self.assertIsNone(status["error"])
+
+
+class UploadTests(DriveBackupTestCase):
+    def test_put_object_round_trip(self):
+        data = os.urandom(600 * 1024)
+        object_id = self.backup.put_object("vault_chunk_1", data)
+
+        self.assertEqual(self.backup.get_object(object_id), data)
+        # Three 256 KiB chunks after the initial offset query
+        self.assertEqual(self.drive.count("PUT", "/upload/session/"), 4)
+
+    def test_put_object_retries_transient_errors(self):
+        self.drive.fail_next("PUT", "/upload/session/", 503, 500)
+        self.drive.fail_next("POST", "/upload/drive/v3/files", 429)
+
+        object_id = self.backup.put_object("vault_chunk_2", b"x" * 1000)
+
+        self.assertEqual(self.drive.files[object_id]["data"], b"x" * 1000)
+
+    def test_put_object_gives_up_after_the_retry_limit(self):
+        self.drive.fail_next("PUT", "/upload/session/", *([503] * (google_drive_backup.UPLOAD_RETRIES + 1)))
+
+        with self.assertRaises(google_drive_backup.UploadRetryableError):
+            self.backup.put_object("vault_chunk_3", b"data")
+
+    def test_session_discarded_by_drive_is_restarted_a_limited_number_of_times(self):
+        attempts = google_drive_backup.UPLOAD_SESSION_RESTARTS + 1
+        self.drive.fail_next("PUT", "/upload/session/", *([404] * attempts))
+
+        with self.assertRaisesRegex(Exception, "discarding"):
+            self.backup.put_object("vault_chunk_5", b"data")
+        self.assertEqual(self.drive.count("POST", "/upload/drive/v3/files"), attempts)
+
+    def test_delete_object(self):
+        object_id = self.backup.put_object("vault_chunk_4", b"data")
+        self.backup.delete_object(object_id)
+        self.assertNotIn(object_id, self.drive.files)
+        # Deleting again is not an error
+        self.backup.delete_object(object_id)
+
+
+class TokenTests(DriveBackupTestCase):
+    def test_expired_token_is_refreshed_before_object_calls(self):
+        object_id = self.backup.put_object("vault_chunk_6", b"data")
+
+        def refresh():
+            self.backup.access_token = "fresh"
+            self.backup.token_expires = datetime.now() + timedelta(hours=1)
+            return True
+
+        calls = (
+            lambda: self.backup.list_objects("vault_chunk_"),
+            lambda: self.backup.get_object(object_id),
+            lambda: self.backup.delete_object(object_id),
+        )
+        for call in calls:
+            self.backup.token_expires = datetime.now() - timedelta(seconds=1)
+            with mock.patch.object(self.backup, "_refresh_access_token", side_effect=refresh) as refreshed:
+                call()
+            refreshed.assert_called_once()
+
+    def test_failed_refresh_stops_the_call(self):
+        self.backup.token_expires = datetime.now() - timedelta(seconds=1)
+        requests_made = len(self.drive.requests)
+
+        with mock.patch.object(self.backup, "_refresh_access_token", return_value=False):
+            with self.assertRaisesRegex(Exception, "not connected"):
+                self.backup.list_objects("vault_chunk_")
+        self.assertEqual(len(self.drive.requests), requests_made)
+
+
+if __name__ == "__main__":
+    unittest.main()
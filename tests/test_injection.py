@@ -0,0 +1,149 @@
+"""
+CredentialInjector fill sequences against FakeBackend.
+"""
+
+import time
+import unittest
+from unittest import mock
+
+from game_integration import injection
+from game_integration.injection import PASTE, TYPE, CredentialInjector, FakeBackend, InjectionBackend
+
+
+class SlowBackend(FakeBackend):
+    """Sends take real time and sleeps really sleep, like a desktop backend"""
+
+    SEND_SECONDS = 0.02
+
+    def write(self, value, interval=0.0):
+        time.sleep(self.SEND_SECONDS)
+        super().write(value, interval)
+
+    def press(self, key_name):
+        time.sleep(self.SEND_SECONDS)
+        super().press(key_name)
+
+    def sleep(self, seconds):
+        super().sleep(seconds)
+        time.sleep(seconds)
+
+
+class InjectorTestCase(unittest.TestCase):
+    def setUp(self):
+        # Keep the timing metric out of the real analytics file
+        patcher = mock.patch("gui.analytics_manager.update_metric")
+        self.update_metric = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def injector(self, backend, method=TYPE, key_interval_ms=0, focus_delay_ms=100):
+        return CredentialInjector(backend, method=method, key_interval_ms=key_interval_ms,
+                                  focus_delay_ms=focus_delay_ms)
+
+
+class StepTests(InjectorTestCase):
+    def test_typed_steps_are_sent_in_order_after_the_focus_delay(self):
+        backend = FakeBackend()
+        self.injector(backend, key_interval_ms=5).run([
+            injection.text("player"),
+            injection.key("tab"),
+            injection.text("hunter2"),
+            injection.hotkey("ctrl", "a"),
+            injection.wait(1.5),
+            injection.key("enter"),
+        ])
+
+        self.assertEqual(backend.events, [
+            ("sleep", 0.1),
+            ("write", "player", 0.005),
+            ("press", "tab"),
+            ("write", "hunter2", 0.005),
+            ("hotkey", ("ctrl", "a")),
+            ("sleep", 1.5),
+            ("press", "enter"),
+        ])
+
+    def test_unknown_step_is_rejected(self):
+        with self.assertRaises(ValueError):
+            self.injector(FakeBackend()).run([("click", None)])
+
+
+class PasteTests(InjectorTestCase):
+    def test_paste_uses_the_private_clipboard_and_restores_it(self):
+        backend = FakeBackend(clipboard="user's text")
+        self.injector(backend, method=PASTE, focus_delay_ms=0).run([
+            injection.text("player"),
+            injection.key("tab"),
+            injection.text("hunter2"),
+        ])
+
+        self.assertEqual(backend.events, [
+            ("sleep", 0.0),
+            ("private_clipboard", "player"),
+            ("hotkey", ("ctrl", "v")),
+            ("paste", "player"),
+            ("sleep", injection.PASTE_SETTLE_SECONDS),
+            ("press", "tab"),
+            ("private_clipboard", "hunter2"),
+            ("hotkey", ("ctrl", "v")),
+            ("paste", "hunter2"),
+            ("sleep", injection.PASTE_SETTLE_SECONDS),
+        ])
+        self.assertEqual(backend.clipboard, "user's text")
+
+    def test_clipboard_is_restored_when_a_step_fails(self):
+        backend = FakeBackend(clipboard="before")
+        with self.assertRaises(ValueError):
+            self.injector(backend, method=PASTE).run([injection.text("hunter2"), ("bogus", None)])
+        self.assertEqual(backend.clipboard, "before")
+
+    def test_clipboard_is_cleared_when_it_could_not_be_read(self):
+        backend = FakeBackend()
+        backend.get_clipboard = mock.Mock(side_effect=OSError("busy"))
+        self.injector(backend, method=PASTE).run([injection.text("hunter2")])
+        self.assertEqual(backend.clipboard, "")
+
+
+class TimingTests(InjectorTestCase):
+    def test_inject_time_covers_the_sends(self):
+        timings = self.injector(SlowBackend(), focus_delay_ms=0).run([
+            injection.text("player"), injection.key("tab"), injection.text("hunter2"),
+        ])
+
+        self.assertGreaterEqual(timings["inject_ms"], 3 * SlowBackend.SEND_SECONDS * 1000)
+        self.update_metric.assert_called_once_with("performance.autofill_inject_ms",
+                                                   round(timings["inject_ms"], 1))
+
+    def test_waits_and_focus_delay_are_not_inject_time(self):
+        timings = self.injector(SlowBackend(), focus_delay_ms=100).run([
+            injection.text("player"), injection.wait(0.2), injection.key("enter"),
+        ])
+
+        self.assertGreaterEqual(timings["total_ms"], 200)
+        self.assertLess(timings["inject_ms"], 150)
+        self.assertGreaterEqual(timings["inject_ms"], 2 * SlowBackend.SEND_SECONDS * 1000)
+
+    def test_paste_settle_time_is_not_inject_time(self):
+        with mock.patch.object(injection, "PASTE_SETTLE_SECONDS", 0.1):
+            timings = self.injector(SlowBackend(), method=PASTE, focus_delay_ms=0).run([
+                injection.text("player"), injection.text("hunter2"),
+            ])
+
+        self.assertGreaterEqual(timings["total_ms"], 200)
+        self.assertLess(timings["inject_ms"], 100)
+
+
+class BackendInterfaceTests(unittest.TestCase):
+    def test_backend_missing_a_method_fails_when_created(self):
+        class NoHotkey(InjectionBackend):
+            def write(self, value, interval=0.0):
+                pass
+
+            def press(self, key_name):
+                pass
+
+        with self.assertRaises(TypeError):
+            NoHotkey()
+
+
+if __name__ == "__main__":
+    unittest.main()
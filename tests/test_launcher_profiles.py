@@ -0,0 +1,109 @@
+"""
+Launcher profiles drive the autofill overlay's text and fill sequence.
+"""
+
+import os
+import unittest
+from unittest import mock
+
+from game_integration.background_monitor.launcher_profiles import LauncherProfile, get_profile, get_profiles
+from game_integration.injection import CredentialInjector, FakeBackend
+
+ACCOUNT = {"username": "player@example.com", "password": "hunter2", "title": "Main"}
+
+
+def fill_events(profile):
+    backend = FakeBackend()
+    with mock.patch("gui.analytics_manager.update_metric"):
+        CredentialInjector(backend, method="type", key_interval_ms=0, focus_delay_ms=0).run(
+            profile.fill_steps, ACCOUNT)
+    # Drop the focus delay
+    return backend.events[1:]
+
+
+class DisplayTextTests(unittest.TestCase):
+    def test_instruction_lists_each_folder_name_once(self):
+        self.assertEqual(get_profile("riot").folder_instruction(),
+                         "Create accounts in folders named:\n'Valorant' or 'val'")
+        self.assertEqual(get_profile("epic").folder_instruction(),
+                         "Create accounts in folders named:\n'Epic', 'Epic Games', or 'EpicGames'")
+
+    def test_instruction_follows_the_profile_folders(self):
+        profile = LauncherProfile("test", "Test Launcher", ["Test"], vault_folders=["test"])
+        self.assertEqual(profile.folder_instruction(), "Create accounts in folders named:\n'test'")
+
+    def test_prompts_use_the_game_name(self):
+        profile = get_profile("riot")
+        self.assertEqual(profile.account_prompt(), "Select Valorant Account")
+        self.assertEqual(profile.empty_message(), "No Valorant accounts found")
+
+    def test_game_name_defaults_to_the_launcher_name(self):
+        profile = LauncherProfile("test", "Test Launcher", ["Test"])
+        self.assertEqual(profile.account_prompt(), "Select Test Launcher Account")
+        self.assertEqual(profile.analytics_name, "test")
+
+
+class FillStepTests(unittest.TestCase):
+    def test_riot_fill(self):
+        self.assertEqual(fill_events(get_profile("riot")), [
+            ("write", "player@example.com", 0.0),
+            ("press", "tab"),
+            ("write", "hunter2", 0.0),
+            ("press", "enter"),
+        ])
+
+    def test_epic_fill_waits_for_the_password_screen(self):
+        events = fill_events(get_profile("epic"))
+        self.assertEqual(events[:4], [
+            ("hotkey", ("ctrl", "a")),
+            ("write", "player@example.com", 0.0),
+            ("press", "enter"),
+            ("sleep", 1.0),
+        ])
+        self.assertEqual(events[4:6], [("press", "tab"), ("write", "hunter2", 0.0)])
+        self.assertEqual(events[-1], ("press", "enter"))
+
+    def test_every_built_in_profile_fills_both_fields(self):
+        for profile in get_profiles():
+            written = [event[1] for event in fill_events(profile) if event[0] == "write"]
+            self.assertEqual(written, ["player@example.com", "hunter2"], profile.name)
+
+
+class OverlayTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+        from PyQt6.QtWidgets import QApplication
+        cls.app = QApplication.instance() or QApplication([])
+
+    def overlay(self, name):
+        from game_integration.background_monitor.overlay_manager import OverlayPool
+
+        pool = OverlayPool(main_app=None)
+        overlay = pool.get(name)
+        self.addCleanup(overlay.deleteLater)
+        return overlay
+
+    def test_overlay_text_comes_from_the_profile(self):
+        overlay = self.overlay("epic")
+        self.assertEqual(overlay.no_accounts_label.text(), "No Epic Games accounts found")
+        self.assertEqual(overlay.instruction_label.text(), get_profile("epic").folder_instruction())
+
+    def test_resize_page_only_for_profiles_with_a_standard_size(self):
+        self.assertIsNone(self.overlay("riot").resize_page)
+        self.assertIsNotNone(self.overlay("epic").resize_page)
+
+    def test_accounts_come_from_the_profile_folders(self):
+        overlay = self.overlay("riot")
+        overlay.vault_data = {
+            "val": {"entries": [{"username": "a", "password": "b", "title": "Alt"}]},
+            "Epic": {"entries": [{"username": "c", "password": "d"}]},
+        }
+        overlay.show_account_list()
+
+        shown = [button.account["title"] for button in overlay.account_buttons if button.account]
+        self.assertEqual(shown, ["Alt"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,54 @@
+"""
+Dependency-ordered task runs on the thread pool.
+"""
+
+import threading
+import unittest
+
+from core.task_graph import Dep, run_task_graph
+
+
+def add(a, b):
+    return a + b
+
+
+class TaskGraphTests(unittest.TestCase):
+    def test_dependencies_receive_results(self):
+        results = run_task_graph({
+            "a": (add, (1, 2)),
+            "b": (add, (Dep("a"), 10)),
+            "c": (add, (Dep("a"), Dep("b"))),
+        }, max_workers=2)
+
+        self.assertEqual(results, {"a": 3, "b": 13, "c": 16})
+
+    def test_independent_tasks_run_at_the_same_time(self):
+        # Each task waits for the other, so this only finishes if both are running at once
+        barrier = threading.Barrier(2, timeout=5)
+        results = run_task_graph({
+            "a": (barrier.wait, ()),
+            "b": (barrier.wait, ()),
+        }, max_workers=2)
+
+        self.assertEqual(sorted(results.values()), [0, 1])
+
+    def test_check_abandons_the_remaining_tasks(self):
+        def check(name, result):
+            if name == "a":
+                raise KeyError(name)
+
+        ran = []
+        with self.assertRaises(KeyError):
+            run_task_graph({
+                "a": (add, (1, 2)),
+                "b": (ran.append, (Dep("a"),)),
+            }, check=check, max_workers=2)
+        self.assertEqual(ran, [])
+
+    def test_unknown_dependency_is_rejected(self):
+        with self.assertRaises(ValueError):
+            run_task_graph({"a": (add, (Dep("missing"), 1))})
+
+
+if __name__ == "__main__":
+    unittest.main()
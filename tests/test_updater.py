@@ -0,0 +1,275 @@
+"""
+Updater downloads against a local HTTP server.
+
+The server serves in-memory files with optional Range support, so the
+parallel ranged download, resume, hash checks and delta updates can run
+without GitHub.
+"""
+
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import unittest
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from unittest import mock
+
+import updater
+
+
+class ReleaseServer:
+    """Serves {path: bytes} and records every Range it was asked for"""
+
+    def __init__(self, files, ranges=True):
+        self.files = dict(files)
+        self.ranges = ranges
+        self.requested_ranges = []
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), self._handler())
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+
+    def url(self, path):
+        return f"http://127.0.0.1:{self.server.server_address[1]}{path}"
+
+    def close(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _handler(self):
+        release = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def log_message(self, format, *args):
+                pass
+
+            def do_GET(self):
+                data = release.files.get(self.path)
+                if data is None:
+                    self.send_response(404)
+                    self.send_header("Content-Length", "0")
+                    self.end_headers()
+                    return
+
+                match = re.match(r"bytes=(\d+)-(\d*)", self.headers.get("Range", ""))
+                if match and release.ranges:
+                    start = int(match.group(1))
+                    end = int(match.group(2)) if match.group(2) else len(data) - 1
+                    release.requested_ranges.append((start, end))
+                    body = data[start:end + 1]
+                    self.send_response(206)
+                    self.send_header("Content-Range", f"bytes {start}-{end}/{len(data)}")
+                else:
+                    body = data
+                    self.send_response(200)
+
+                self.send_header("Content-Length", str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+        return Handler
+
+
+def sha256(data):
+    return hashlib.sha256(data).hexdigest()
+
+
+class UpdaterTestCase(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+        # Keep updater.log out of the source tree
+        patcher = mock.patch.object(updater, "log_message", lambda message: None)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    def path(self, name):
+        return os.path.join(self.directory.name, name)
+
+    def serve(self, files, ranges=True):
+        server = ReleaseServer(files, ranges)
+        self.addCleanup(server.close)
+        return server
+
+
+class DownloadTests(UpdaterTestCase):
+    def setUp(self):
+        super().setUp()
+        self.data = os.urandom(3 * 1024 * 1024 + 123)
+
+    def test_parallel_ranged_download(self):
+        server = self.serve({"/Vault.exe": self.data})
+        target = self.path("new.exe")
+
+        self.assertTrue(updater.download_exe(server.url("/Vault.exe"), target, expected_sha256=sha256(self.data)))
+
+        with open(target, 'rb') as f:
+            self.assertEqual(f.read(), self.data)
+        # The probe plus one request per segment
+        self.assertGreaterEqual(len(server.requested_ranges), updater.DOWNLOAD_SEGMENTS + 1)
+        self.assertFalse(os.path.exists(target + ".part"))
+
+    def test_single_stream_when_ranges_are_unsupported(self):
+        server = self.serve({"/Vault.exe": self.data}, ranges=False)
+        target = self.path("new.exe")
+
+        self.assertTrue(updater.download_exe(server.url("/Vault.exe"), target, expected_sha256=sha256(self.data)))
+        with open(target, 'rb') as f:
+            self.assertEqual(f.read(), self.data)
+
+    def test_download_resumes_from_saved_segment_positions(self):
+        server = self.serve({"/Vault.exe": self.data})
+        url = server.url("/Vault.exe")
+        target = self.path("new.exe")
+        part_path = target + ".part"
+
+        # A previous run finished the first half of every segment
+        segment_size = -(-len(self.data) // updater.DOWNLOAD_SEGMENTS)
+        segments = []
+        with open(part_path, 'wb') as f:
+            f.truncate(len(self.data))
+            for start in range(0, len(self.data), segment_size):
+                end = min(start + segment_size, len(self.data)) - 1
+                position = start + (end - start) // 2
+                f.seek(start)
+                f.write(self.data[start:position])
+                segments.append({"start": start, "end": end, "position": position})
+        with open(part_path + ".json", 'w') as f:
+            json.dump({"url": url, "size": len(self.data), "segments": segments}, f)
+
+        self.assertTrue(updater.download_exe(url, target, expected_sha256=sha256(self.data)))
+
+        with open(target, 'rb') as f:
+            self.assertEqual(f.read(), self.data)
+        resumed_from = sorted(start for start, _ in server.requested_ranges[1:])
+        self.assertEqual(resumed_from, [segment["position"] for segment in segments])
+
+    def test_hash_mismatch_is_rejected_and_not_resumed(self):
+        server = self.serve({"/Vault.exe": self.data})
+        target = self.path("new.exe")
+
+        self.assertFalse(updater.download_exe(server.url("/Vault.exe"), target, expected_sha256="0" * 64))
+        self.assertFalse(os.path.exists(target))
+        self.assertFalse(os.path.exists(target + ".part"))
+
+    def test_download_without_a_published_hash_is_refused(self):
+        server = self.serve({"/Vault.exe": self.data})
+        target = self.path("new.exe")
+
+        self.assertFalse(updater.download_exe(server.url("/Vault.exe"), target))
+        self.assertEqual(server.requested_ranges, [])
+
+    def test_manifest_and_app_hashes_must_agree(self):
+        server = self.serve({"/Vault.exe": self.data})
+        manifest = {"size": len(self.data), "sha256": sha256(self.data)}
+
+        self.assertFalse(updater.download_exe(server.url("/Vault.exe"), self.path("new.exe"), manifest,
+                                              expected_sha256="0" * 64))
+        self.assertEqual(server.requested_ranges, [])
+
+        self.assertTrue(updater.download_exe(server.url("/Vault.exe"), self.path("new.exe"), manifest,
+                                             expected_sha256=sha256(self.data).upper()))
+
+    def test_adaptive_chunks_change_read_size(self):
+        server = self.serve({"/Vault.exe": self.data})
+        reads = []
+        original_read = updater.requests.packages.urllib3.response.HTTPResponse.read
+
+        def recording_read(response, amt=None, *args, **kwargs):
+            reads.append(amt)
+            return original_read(response, amt, *args, **kwargs)
+
+        with mock.patch.object(updater.requests.packages.urllib3.response.HTTPResponse, "read", recording_read):
+            self.assertTrue(updater.download_exe(server.url("/Vault.exe"), self.path("new.exe"),
+                                                 expected_sha256=sha256(self.data)))
+
+        self.assertIn(updater.MIN_CHUNK_SIZE, reads)
+        self.assertTrue(any(amt and amt > updater.MIN_CHUNK_SIZE for amt in reads))
+
+
+class DeltaTests(UpdaterTestCase):
+    def setUp(self):
+        super().setUp()
+        self.old = os.urandom(2 * 1024 * 1024)
+        self.installed = self.path("Vault.exe")
+        with open(self.installed, 'wb') as f:
+            f.write(self.old)
+
+    def release(self, new, manifest=None):
+        release_path = self.path("release.exe")
+        with open(release_path, 'wb') as f:
+            f.write(new)
+        manifest = manifest or updater.build_release_manifest(release_path)
+        server = self.serve({"/Vault.exe": new,
+                             "/Vault.exe" + updater.MANIFEST_SUFFIX: json.dumps(manifest).encode('utf-8')})
+        return server, manifest
+
+    def remote_bytes(self, server):
+        return sum(end - start + 1 for start, end in server.requested_ranges)
+
+    def rebuild(self, server, manifest):
+        target = self.path("new.exe")
+        self.assertTrue(updater.delta_update(server.url("/Vault.exe"), self.installed, target, manifest))
+        with open(target, 'rb') as f:
+            return f.read()
+
+    def test_blocks_shifted_by_an_insertion_are_found(self):
+        # A few bytes early in the file move every later block off its old offset
+        new = self.old[:1000] + b"inserted" + self.old[1000:]
+        server, manifest = self.release(new)
+
+        self.assertEqual(updater.fetch_release_manifest(server.url("/Vault.exe")), manifest)
+        self.assertEqual(self.rebuild(server, manifest), new)
+        self.assertLessEqual(self.remote_bytes(server), 2 * updater.BLOCK_SIZE)
+
+    def test_changed_region_is_the_only_download(self):
+        changed = os.urandom(100 * 1024)
+        new = self.old[:500000] + changed + self.old[500000:]
+        server, manifest = self.release(new)
+
+        self.assertEqual(self.rebuild(server, manifest), new)
+        self.assertLessEqual(self.remote_bytes(server), len(changed) + 2 * updater.BLOCK_SIZE)
+
+    def test_unrelated_exe_skips_the_delta_after_the_probe(self):
+        with open(self.installed, 'wb') as f:
+            f.write(os.urandom(len(self.old)))
+        server, manifest = self.release(self.old)
+
+        with mock.patch.object(updater, "DELTA_PROBE_BYTES", 512 * 1024):
+            self.assertFalse(updater.delta_update(server.url("/Vault.exe"), self.installed,
+                                                  self.path("new.exe"), manifest))
+        self.assertEqual(server.requested_ranges, [])
+
+    def test_scan_over_its_time_budget_skips_the_delta(self):
+        new = self.old[:1000] + b"inserted" + self.old[1000:]
+        server, manifest = self.release(new)
+
+        with mock.patch.object(updater, "DELTA_SCAN_SECONDS", 0):
+            self.assertIsNone(updater.find_local_blocks(self.installed, manifest))
+
+    def test_reconstruction_is_verified_against_the_manifest(self):
+        new = self.old[:1000] + b"inserted" + self.old[1000:]
+        server, manifest = self.release(new)
+        manifest["sha256"] = "0" * 64
+
+        self.assertFalse(updater.delta_update(server.url("/Vault.exe"), self.installed, self.path("new.exe"),
+                                              manifest))
+
+
+class ArgumentTests(unittest.TestCase):
+    def test_sha256_argument(self):
+        digest = "ab" * 32
+        parsed, remaining = updater.parse_sha256_arg(["updater", "--sha256", digest.upper(), "url", "1.0"])
+        self.assertEqual(parsed, digest)
+        self.assertEqual(remaining, ["updater", "url", "1.0"])
+
+    def test_malformed_sha256_argument_is_dropped(self):
+        with mock.patch.object(updater, "log_message", lambda message: None):
+            parsed, remaining = updater.parse_sha256_arg(["updater", "--sha256", "nothex", "url"])
+        self.assertIsNone(parsed)
+        self.assertEqual(remaining, ["updater", "url"])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,49 @@
+"""
+Recovery key tasks for vaults that predate the wrapped data key.
+"""
+
+import base64
+import os
+import unittest
+
+from auth.auth_manager import derive_recovery_key_hash, generate_recovery_key
+from core.task_graph import Dep, run_task_graph
+from core.vault_manager import InvalidRecoveryKey, _require_valid_recovery_key, recovery_unlock_tasks
+from security.encryption import encrypt_password_with_recovery_key
+
+
+def legacy_auth_data(password, recovery_key):
+    recovery_salt = os.urandom(16)
+    return {
+        "recovery_salt": base64.b64encode(recovery_salt).decode('utf-8'),
+        "recovery_hash": derive_recovery_key_hash(recovery_key, recovery_salt),
+        "vault_salt": base64.b64encode(os.urandom(16)).decode('utf-8'),
+        "encrypted_password": encrypt_password_with_recovery_key(password, recovery_key),
+    }
+
+
+class LegacyRecoveryTests(unittest.TestCase):
+    @classmethod
+    def setUpClass(cls):
+        cls.recovery_key = generate_recovery_key()
+        cls.auth_data = legacy_auth_data("Old-password1", cls.recovery_key)
+
+    def test_decrypt_waits_for_the_recovery_check(self):
+        tasks = recovery_unlock_tasks(self.auth_data, self.recovery_key)
+        dependencies = [arg.name for arg in tasks["old_password"][1] if isinstance(arg, Dep)]
+        self.assertEqual(dependencies, ["recovery_check"])
+
+    def test_wrong_key_is_reported_as_invalid(self):
+        wrong_key = generate_recovery_key()
+        with self.assertRaises(InvalidRecoveryKey):
+            run_task_graph(recovery_unlock_tasks(self.auth_data, wrong_key), check=_require_valid_recovery_key)
+
+    def test_right_key_recovers_the_old_password(self):
+        results = run_task_graph(recovery_unlock_tasks(self.auth_data, self.recovery_key),
+                                 check=_require_valid_recovery_key)
+        self.assertEqual(results["old_password"], "Old-password1")
+        self.assertEqual(len(results["old_password_key"]), 32)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -34,12 +34,13 @@ class TrayBackgroundMonitor(QThread):
         try:
             status_messages = []
 
-            if hasattr(self.game_integration_manager, 'riot_detector'):
-                if self.game_integration_manager.riot_detector.monitoring:
-                    status_messages.append("Riot monitoring active")
-                    self.game_integration_status.emit("Riot Client", True)
+            for detector in getattr(self.game_integration_manager, 'detectors', {}).values():
+                game_name = detector.profile.display_name
+                if detector.monitoring:
+                    status_messages.append(f"{game_name} monitoring active")
+                    self.game_integration_status.emit(game_name, True)
                 else:
-                    self.game_integration_status.emit("Riot Client", False)
+                    self.game_integration_status.emit(game_name, False)
 
             if status_messages:
                 self.monitoring_status_changed.emit("; ".join(status_messages))
@@ -185,13 +185,9 @@ class SystemTrayManager:
             if enabled:
                 if hasattr(self.game_integration_manager, 'start_monitoring'):
                     self.game_integration_manager.start_monitoring()
-                elif hasattr(self.game_integration_manager, 'riot_detector'):
-                    self.game_integration_manager.riot_detector.start_monitoring()
             else:
                 if hasattr(self.game_integration_manager, 'stop_monitoring'):
                     self.game_integration_manager.stop_monitoring()
-                elif hasattr(self.game_integration_manager, 'riot_detector'):
-                    self.game_integration_manager.riot_detector.stop_monitoring()
 
         except Exception as e:
             self.notifications.show_error(
@@ -226,8 +222,6 @@ class SystemTrayManager:
             try:
                 if hasattr(self.game_integration_manager, 'stop_monitoring'):
                     self.game_integration_manager.stop_monitoring()
-                elif hasattr(self.game_integration_manager, 'riot_detector'):
-                    self.game_integration_manager.riot_detector.stop_monitoring()
             except Exception as e:
                 print(f"Warning: Error stopping game integration: {e}")
 
@@ -57,43 +57,249 @@ def get_app_directory():
         return os.path.dirname(os.path.abspath(__file__))
 
 
-def download_exe(download_url, temp_exe_path):
+DOWNLOAD_SEGMENTS = 4
+MIN_CHUNK_SIZE = 64 * 1024
+MAX_CHUNK_SIZE = 1024 * 1024
+SEGMENT_RETRIES = 3
+
+
+def create_download_session(pool_size=DOWNLOAD_SEGMENTS):
+    session = requests.Session()
+    adapter = requests.adapters.HTTPAdapter(pool_connections=1, pool_maxsize=pool_size)
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    session.headers.update({
+        'User-Agent': 'TheVault-Updater/1.0',
+        'Accept': 'application/octet-stream'
+    })
+    return session
+
+
+def probe_download(session, download_url):
+    """Return (final_url, total_size, supports_ranges) after following redirects"""
+    response = session.get(download_url, headers={'Range': 'bytes=0-0'}, stream=True,
+                           timeout=30, allow_redirects=True)
     try:
-        log_message(f"Downloading new version...")
-        log_message(f"URL: {download_url}")
-
-        headers = {
-            'User-Agent': 'TheVault-Updater/1.0',
-            'Accept': 'application/octet-stream'
-        }
+        if response.status_code == 206:
+            content_range = response.headers.get('Content-Range', '')
+            total_size = int(content_range.rsplit('/', 1)[-1])
+            return response.url, total_size, True
 
-        response = requests.get(download_url, stream=True, headers=headers, timeout=30)
         response.raise_for_status()
+        return response.url, int(response.headers.get('content-length', 0)), False
+    finally:
+        response.close()
 
-        total_size = int(response.headers.get('content-length', 0))
-        downloaded = 0
 
-        with open(temp_exe_path, 'wb') as f:
-            for chunk in response.iter_content(chunk_size=8192):
-                if chunk:
-                    f.write(chunk)
-                    downloaded += len(chunk)
+def load_download_state(state_path, total_size, url_key):
+    try:
+        with open(state_path, 'r', encoding='utf-8') as f:
+            state = json.load(f)
+        if state.get("size") == total_size and state.get("url") == url_key:
+            return state
+    except Exception:
+        pass
+    return None
 
-                    # Show progress
-                    if total_size > 0:
-                        progress = (downloaded / total_size) * 100
-                        print(f"\rDownload Progress: {progress:.1f}%", end='', flush=True)
 
-        print()
+def save_download_state(state_path, state, lock):
+    with lock:
+        try:
+            with open(state_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f)
+        except Exception:
+            pass
+
 
-        # Verify download
-        if os.path.exists(temp_exe_path) and os.path.getsize(temp_exe_path) > 0:
-            log_message(f"Download completed successfully! Size: {os.path.getsize(temp_exe_path)} bytes")
+def download_segment(session, url, part_path, segment, state, state_path, lock, progress):
+    """Fetch one byte range into the shared part file, resuming from its saved position"""
+    for attempt in range(SEGMENT_RETRIES):
+        position = segment["position"]
+        if position > segment["end"]:
             return True
+
+        chunk_size = MIN_CHUNK_SIZE
+        try:
+            response = session.get(url, headers={'Range': f"bytes={position}-{segment['end']}"},
+                                   stream=True, timeout=30)
+            if response.status_code != 206:
+                raise Exception(f"Unexpected HTTP {response.status_code} for ranged request")
+
+            with response, open(part_path, 'r+b') as f:
+                f.seek(position)
+                started = time.time()
+                last_saved = started
+                while True:
+                    # Read from the raw stream so each read uses the current chunk size
+                    chunk = response.raw.read(chunk_size, decode_content=True)
+                    if not chunk:
+                        break
+                    f.write(chunk)
+                    segment["position"] += len(chunk)
+                    with lock:
+                        progress[0] += len(chunk)
+
+                    # Grow chunks on fast links, shrink them on slow ones
+                    elapsed = time.time() - started
+                    if elapsed < 0.25 and chunk_size < MAX_CHUNK_SIZE:
+                        chunk_size *= 2
+                    elif elapsed > 1.0 and chunk_size > MIN_CHUNK_SIZE:
+                        chunk_size //= 2
+                    started = time.time()
+
+                    # Persist progress about once a second, after the bytes hit the file
+                    if started - last_saved > 1.0:
+                        f.flush()
+                        save_download_state(state_path, state, lock)
+                        last_saved = started
+
+            if segment["position"] > segment["end"]:
+                return True
+            raise Exception("Connection closed before segment completed")
+
+        except Exception as e:
+            log_message(f"Segment {segment['start']}-{segment['end']} attempt {attempt + 1} failed: {str(e)}")
+            save_download_state(state_path, state, lock)
+            time.sleep(2 ** attempt)
+
+    return False
+
+
+def download_single_stream(session, download_url, temp_exe_path):
+    response = session.get(download_url, stream=True, timeout=30)
+    response.raise_for_status()
+
+    total_size = int(response.headers.get('content-length', 0))
+    downloaded = 0
+
+    with open(temp_exe_path, 'wb') as f:
+        for chunk in response.iter_content(chunk_size=MIN_CHUNK_SIZE):
+            if chunk:
+                f.write(chunk)
+                downloaded += len(chunk)
+
+                # Show progress
+                if total_size > 0:
+                    progress = (downloaded / total_size) * 100
+                    print(f"\rDownload Progress: {progress:.1f}%", end='', flush=True)
+
+    print()
+    return total_size
+
+
+def verify_download(temp_exe_path, expected_size, expected_sha256):
+    import hashlib
+
+    actual_size = os.path.getsize(temp_exe_path) if os.path.exists(temp_exe_path) else 0
+    if actual_size == 0 or (expected_size and actual_size != expected_size):
+        log_message(f"Download failed: expected {expected_size} bytes, got {actual_size}")
+        return False
+
+    file_hash = hashlib.sha256()
+    with open(temp_exe_path, 'rb') as f:
+        for block in iter(lambda: f.read(MAX_CHUNK_SIZE), b""):
+            file_hash.update(block)
+    if file_hash.hexdigest() != expected_sha256.lower():
+        log_message("Download failed: SHA-256 does not match the published hash")
+        return False
+
+    log_message("SHA-256 verified")
+    return True
+
+
+def sha256_conflict(manifest, expected_sha256):
+    """True if the release manifest and the app's asset digest name different hashes"""
+    if not manifest or not expected_sha256:
+        return False
+    if manifest["sha256"].lower() == expected_sha256.lower():
+        return False
+    log_message("Update refused: the release manifest and the app report different SHA-256 hashes")
+    return True
+
+
+def download_exe(download_url, temp_exe_path, manifest=None, expected_sha256=None):
+    """Download in parallel byte ranges, resuming any previous partial download
+
+    The hash comes from the release manifest and the one the app passed from
+    the release's asset digest, which must agree when both are present.
+    Without either, nothing is installed, since a preallocated part file
+    always has the right size.
+    """
+    if sha256_conflict(manifest, expected_sha256):
+        return False
+    if manifest:
+        expected_sha256 = manifest["sha256"]
+    if not expected_sha256:
+        log_message("Download refused: no published SHA-256 to verify the new version against")
+        return False
+
+    try:
+        log_message(f"Downloading new version...")
+        log_message(f"URL: {download_url}")
+
+        from concurrent.futures import ThreadPoolExecutor
+        import threading
+
+        session = create_download_session()
+        final_url, total_size, supports_ranges = probe_download(session, download_url)
+        expected_size = manifest["size"] if manifest else total_size
+
+        if not supports_ranges or total_size == 0:
+            log_message("Server does not support ranged downloads, using a single stream")
+            download_single_stream(session, download_url, temp_exe_path)
+            return verify_download(temp_exe_path, expected_size, expected_sha256)
+
+        part_path = temp_exe_path + ".part"
+        state_path = part_path + ".json"
+        state = load_download_state(state_path, total_size, download_url)
+
+        if state is None or not os.path.exists(part_path):
+            segment_size = -(-total_size // DOWNLOAD_SEGMENTS)
+            state = {
+                "url": download_url,
+                "size": total_size,
+                "segments": [
+                    {"start": start, "end": min(start + segment_size, total_size) - 1, "position": start}
+                    for start in range(0, total_size, segment_size)
+                ]
+            }
+            with open(part_path, 'wb') as f:
+                f.truncate(total_size)
         else:
-            log_message("Download failed: File is empty or doesn't exist")
+            log_message("Resuming previous partial download")
+
+        lock = threading.Lock()
+        progress = [sum(seg["position"] - seg["start"] for seg in state["segments"])]
+        save_download_state(state_path, state, lock)
+
+        with ThreadPoolExecutor(max_workers=DOWNLOAD_SEGMENTS) as pool:
+            futures = [
+                pool.submit(download_segment, session, final_url, part_path, segment,
+                            state, state_path, lock, progress)
+                for segment in state["segments"]
+            ]
+            while not all(future.done() for future in futures):
+                print(f"\rDownload Progress: {progress[0] / total_size * 100:.1f}%", end='', flush=True)
+                time.sleep(0.2)
+            results = [future.result() for future in futures]
+
+        print()
+
+        if not all(results):
+            log_message("Download incomplete, progress saved for the next attempt")
             return False
 
+        if not verify_download(part_path, expected_size, expected_sha256):
+            # Corrupt data can't be resumed, start over next time
+            os.remove(part_path)
+            os.remove(state_path)
+            return False
+
+        os.replace(part_path, temp_exe_path)
+        os.remove(state_path)
+        log_message(f"Download completed successfully! Size: {os.path.getsize(temp_exe_path)} bytes")
+        return True
+
     except requests.exceptions.RequestException as e:
         log_message(f"Network error during download: {str(e)}")
         return False
@@ -102,88 +308,372 @@ def download_exe(download_url, temp_exe_path):
         return False
 
 
-def backup_current_exe(current_exe_path, backup_path):
+# =============================================================================
+# DELTA UPDATES
+# Each release publishes <asset>.manifest.json next to the exe with the file
+# size, SHA-256 and per-block hashes. Like rsync, every block carries a weak
+# Adler-32 checksum as well, so the installed exe can be scanned with a rolling
+# window and blocks are found at any offset, not just where they used to be.
+# Blocks already present are copied locally; only the rest are fetched with
+# Range requests. The scan runs in Python at roughly half a second per
+# unmatched MB, so it gives up in favour of the full download once the match
+# rate or the time spent shows a delta isn't worth it.
+# =============================================================================
+
+BLOCK_SIZE = 64 * 1024
+MANIFEST_SUFFIX = ".manifest.json"
+
+ADLER_MODULUS = 65521
+# How often the scan checks its budgets, in bytes of the installed exe
+SCAN_CHECK_INTERVAL = 256 * 1024
+# After this much of the installed exe, at least this share must have matched
+DELTA_PROBE_BYTES = 4 * 1024 * 1024
+DELTA_MIN_MATCH_RATIO = 0.25
+DELTA_SCAN_SECONDS = 10.0
+
+
+def build_release_manifest(exe_path, block_size=BLOCK_SIZE):
+    """Build the manifest published alongside a release exe"""
+    import hashlib
+    import zlib
+
+    file_hash = hashlib.sha256()
+    blocks = []
+    weak = []
+    with open(exe_path, 'rb') as f:
+        while True:
+            block = f.read(block_size)
+            if not block:
+                break
+            file_hash.update(block)
+            blocks.append(hashlib.sha256(block).hexdigest())
+            weak.append(zlib.adler32(block))
+
+    return {
+        "size": os.path.getsize(exe_path),
+        "sha256": file_hash.hexdigest(),
+        "block_size": block_size,
+        "blocks": blocks,
+        "weak": weak
+    }
+
+
+def fetch_release_manifest(download_url):
     try:
-        log_message("Creating backup of current version...")
+        headers = {'User-Agent': 'TheVault-Updater/1.0'}
+        response = requests.get(download_url + MANIFEST_SUFFIX, headers=headers, timeout=15)
+        if response.status_code != 200:
+            log_message(f"No release manifest available (HTTP {response.status_code})")
+            return None
+
+        manifest = response.json()
+        if not all(key in manifest for key in ("size", "sha256", "block_size", "blocks", "weak")):
+            log_message("Release manifest is incomplete, ignoring it")
+            return None
+        return manifest
+
+    except Exception as e:
+        log_message(f"Failed to fetch release manifest: {str(e)}")
+        return None
+
+
+def find_local_blocks(exe_path, manifest):
+    """Map block hash -> offset for release blocks found anywhere in the installed exe
+
+    Returns None when too little matches or the scan runs over its time budget.
+    """
+    import hashlib
+    import mmap
+    import time
+    import zlib
+
+    block_size = manifest["block_size"]
+    candidates = {}
+    for weak, strong in zip(manifest["weak"], manifest["blocks"]):
+        candidates.setdefault(weak, set()).add(strong)
+
+    index = {}
+    with open(exe_path, 'rb') as f:
+        if os.path.getsize(exe_path) < block_size:
+            return index
+
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            last = len(data) - block_size
+            position = 0
+            checksum = None
+            matched = 0
+            started = time.monotonic()
+            next_check = SCAN_CHECK_INTERVAL
+
+            while position <= last:
+                if position >= next_check:
+                    next_check = position + SCAN_CHECK_INTERVAL
+                    if position >= DELTA_PROBE_BYTES and matched < position * DELTA_MIN_MATCH_RATIO:
+                        log_message(f"Only {matched} of the first {position} bytes match the release, "
+                                    f"skipping the delta")
+                        return None
+                    if time.monotonic() - started > DELTA_SCAN_SECONDS:
+                        log_message("Scanning for reusable blocks took too long, skipping the delta")
+                        return None
+
+                if checksum is None:
+                    checksum = zlib.adler32(data[position:position + block_size])
+                    a, b = checksum & 0xFFFF, checksum >> 16
+
+                strong_hashes = candidates.get(checksum)
+                if strong_hashes:
+                    strong = hashlib.sha256(data[position:position + block_size]).hexdigest()
+                    if strong in strong_hashes:
+                        index.setdefault(strong, position)
+                        matched += block_size
+                        # Matched blocks don't overlap, restart the window after this one
+                        position += block_size
+                        checksum = None
+                        continue
+
+                if position == last:
+                    break
+
+                # Slide the window one byte: drop data[position], add the byte after the window
+                outgoing = data[position]
+                a = (a - outgoing + data[position + block_size]) % ADLER_MODULUS
+                b = (b - block_size * outgoing + a - 1) % ADLER_MODULUS
+                checksum = (b << 16) | a
+                position += 1
+
+    return index
+
+
+def plan_delta(manifest, local_index):
+    """Split the new file into local block copies and coalesced remote byte ranges"""
+    block_size = manifest["block_size"]
+    size = manifest["size"]
+    plan = []
+
+    for block_number, block_hash in enumerate(manifest["blocks"]):
+        start = block_number * block_size
+        end = min(start + block_size, size) - 1
+
+        if block_hash in local_index:
+            # ("local", source offset in installed exe, length)
+            plan.append(("local", local_index[block_hash], end - start + 1))
+        elif plan and plan[-1][0] == "remote" and plan[-1][2] == start - 1:
+            plan[-1] = ("remote", plan[-1][1], end)
+        else:
+            # ("remote", first byte, last byte) in the new exe
+            plan.append(("remote", start, end))
+
+    return plan
+
 
-        if not os.path.exists(current_exe_path):
-            log_message(f"Error: Current executable not found at {current_exe_path}")
+def delta_update(download_url, current_exe_path, temp_exe_path, manifest):
+    """Rebuild the new exe from local blocks plus ranged downloads"""
+    import hashlib
+
+    try:
+        local_index = find_local_blocks(current_exe_path, manifest)
+        if local_index is None:
             return False
+        plan = plan_delta(manifest, local_index)
+
+        remote_bytes = sum(last - first + 1 for kind, first, last in plan if kind == "remote")
+        log_message(f"Delta update: downloading {remote_bytes} of {manifest['size']} bytes")
 
-        shutil.copy2(current_exe_path, backup_path)
-        log_message(f"Backup created successfully at {backup_path}")
+        headers = {
+            'User-Agent': 'TheVault-Updater/1.0',
+            'Accept': 'application/octet-stream'
+        }
+
+        file_hash = hashlib.sha256()
+        with open(current_exe_path, 'rb') as local_file, open(temp_exe_path, 'wb') as out:
+            for kind, first, second in plan:
+                if kind == "local":
+                    local_file.seek(first)
+                    data = local_file.read(second)
+                    out.write(data)
+                    file_hash.update(data)
+                    continue
+
+                range_headers = dict(headers, Range=f"bytes={first}-{second}")
+                response = requests.get(download_url, headers=range_headers, stream=True, timeout=30)
+                if response.status_code != 206:
+                    raise Exception(f"Server does not support ranged downloads (HTTP {response.status_code})")
+
+                for chunk in response.iter_content(chunk_size=BLOCK_SIZE):
+                    if chunk:
+                        out.write(chunk)
+                        file_hash.update(chunk)
+
+        if os.path.getsize(temp_exe_path) != manifest["size"] or file_hash.hexdigest() != manifest["sha256"]:
+            raise Exception("Reconstructed file does not match release manifest")
+
+        log_message("Delta update reconstructed and verified")
         return True
 
     except Exception as e:
-        log_message(f"Backup failed: {str(e)}")
+        log_message(f"Delta update failed: {str(e)}")
         return False
 
 
-def replace_executable(temp_exe_path, current_exe_path, backup_path):
+# =============================================================================
+# APP HANDOFF
+# The app listens on a loopback socket and passes "--handoff port:key:pid".
+# It sends "exiting" from aboutToQuit, and we then wait on the process
+# itself rather than sleeping and polling the exe lock.
+# =============================================================================
+
+def parse_handoff_args(argv):
+    """Strip --handoff from argv, returning (handoff, remaining args)"""
+    remaining = list(argv)
+    if "--handoff" not in remaining:
+        return None, remaining
+
+    index = remaining.index("--handoff")
     try:
-        log_message("Installing new version...")
+        port, authkey, pid = remaining[index + 1].split(":")
+        handoff = {"port": int(port), "authkey": bytes.fromhex(authkey), "pid": int(pid)}
+    except (IndexError, ValueError):
+        log_message("Ignoring malformed --handoff argument")
+        handoff = None
 
-        # Wait for main app to fully close
-        log_message("Waiting for main application to close...")
-        time.sleep(3)
+    del remaining[index:index + 2]
+    return handoff, remaining
 
-        # Additional check to ensure file isn't locked
-        max_attempts = 10
-        for attempt in range(max_attempts):
-            try:
-                # Test if we can open the file for writing
-                with open(current_exe_path, 'r+b'):
-                    pass
-                break
-            except (PermissionError, OSError):
-                if attempt < max_attempts - 1:
-                    log_message(f"File still locked, waiting... (attempt {attempt + 1}/{max_attempts})")
-                    time.sleep(2)
-                else:
-                    raise Exception("Could not access executable file - it may still be running")
-
-        # Remove current executable
-        if os.path.exists(current_exe_path):
-            os.remove(current_exe_path)
-            log_message("Removed old executable")
 
-        # Move new executable to main location
-        shutil.move(temp_exe_path, current_exe_path)
-        log_message("New executable installed!")
+def parse_sha256_arg(argv):
+    """Strip --sha256 from argv, returning (hex digest or None, remaining args)"""
+    remaining = list(argv)
+    if "--sha256" not in remaining:
+        return None, remaining
+
+    index = remaining.index("--sha256")
+    digest = remaining[index + 1] if index + 1 < len(remaining) else ""
+    del remaining[index:index + 2]
+
+    if len(digest) != 64 or any(c not in "0123456789abcdefABCDEF" for c in digest):
+        log_message("Ignoring malformed --sha256 argument")
+        return None, remaining
+    return digest.lower(), remaining
 
-        # Verify the new file is in place and has content
-        if os.path.exists(current_exe_path) and os.path.getsize(current_exe_path) > 0:
-            log_message(f"Installation verified. New file size: {os.path.getsize(current_exe_path)} bytes")
 
-            # Remove backup since update was successful
-            if os.path.exists(backup_path):
-                os.remove(backup_path)
-                log_message("Backup removed after successful installation")
+def connect_handoff(handoff):
+    """Connect to the exiting app, None means it is already gone"""
+    if not handoff:
+        return None
+    try:
+        from multiprocessing.connection import Client
+        return Client(("127.0.0.1", handoff["port"]), authkey=handoff["authkey"])
+    except Exception as e:
+        log_message(f"App handoff channel unavailable ({str(e)}), assuming it has exited")
+        return None
 
+
+def wait_for_process_exit(pid, timeout):
+    if sys.platform == "win32":
+        SYNCHRONIZE = 0x00100000
+        kernel32 = ctypes.windll.kernel32
+        handle = kernel32.OpenProcess(SYNCHRONIZE, False, pid)
+        if not handle:
+            return True  # Already exited
+        try:
+            WAIT_OBJECT_0 = 0
+            return kernel32.WaitForSingleObject(handle, int(timeout * 1000)) == WAIT_OBJECT_0
+        finally:
+            kernel32.CloseHandle(handle)
+
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        try:
+            os.kill(pid, 0)
+        except OSError:
             return True
-        else:
-            raise Exception("New executable was not properly installed")
+        time.sleep(0.05)
+    return False
+
+
+def wait_for_app_exit(connection, handoff, timeout=30):
+    """Block until the app has announced its exit and its process is gone"""
+    if connection:
+        try:
+            if connection.poll(timeout):
+                log_message(f"App handoff: {connection.recv()}")
+        except (EOFError, OSError):
+            pass  # Channel closed, the app is exiting
+        finally:
+            connection.close()
+
+    if handoff:
+        if not wait_for_process_exit(handoff["pid"], timeout):
+            log_message("Warning: app process still running after handoff timeout")
+            return False
+        log_message("Main application has exited")
+    return True
+
+
+# =============================================================================
+# INSTALL
+# =============================================================================
+
+def stage_new_executable(temp_exe_path, current_exe_path):
+    """Move the download next to the installed exe so the swap is a pair of renames"""
+    staged_path = current_exe_path + ".new"
+    if os.path.exists(staged_path):
+        os.remove(staged_path)
+    shutil.move(temp_exe_path, staged_path)
+    return staged_path
+
+
+def rename_with_retry(source, destination, attempts=20):
+    for attempt in range(attempts):
+        try:
+            os.replace(source, destination)
+            return
+        except PermissionError:
+            if attempt == attempts - 1:
+                raise
+            time.sleep(0.1)
+
+
+def replace_executable(staged_exe_path, current_exe_path, backup_path):
+    """Swap executables by rename, rolling back to the old exe on failure"""
+    log_message("Installing new version...")
+
+    try:
+        if os.path.exists(backup_path):
+            os.remove(backup_path)
+
+        rename_with_retry(current_exe_path, backup_path)
+    except Exception as e:
+        log_message(f"Installation failed, could not move current executable: {str(e)}")
+        return False
+
+    try:
+        rename_with_retry(staged_exe_path, current_exe_path)
+        log_message(f"New executable installed! Size: {os.path.getsize(current_exe_path)} bytes")
+        return True
 
     except Exception as e:
         log_message(f"Installation failed: {str(e)}")
+        rollback_executable(current_exe_path, backup_path)
+        return False
 
-        # Restore backup if something went wrong
-        try:
-            if os.path.exists(backup_path):
-                log_message("Restoring backup...")
-                if os.path.exists(current_exe_path):
-                    try:
-                        os.remove(current_exe_path)
-                    except:
-                        pass
-                shutil.move(backup_path, current_exe_path)
-                log_message("Backup restored successfully!")
-            else:
-                log_message("No backup available to restore!")
-        except Exception as restore_error:
-            log_message(f"CRITICAL: Failed to restore backup: {restore_error}")
-            log_message("Manual intervention may be required!")
 
+def rollback_executable(current_exe_path, backup_path):
+    try:
+        if not os.path.exists(backup_path):
+            log_message("No backup available to restore!")
+            return False
+
+        log_message("Restoring previous version...")
+        if os.path.exists(current_exe_path):
+            os.replace(current_exe_path, current_exe_path + ".failed")
+        os.replace(backup_path, current_exe_path)
+        log_message("Previous version restored")
+        return True
+
+    except Exception as restore_error:
+        log_message(f"CRITICAL: Failed to restore backup: {restore_error}")
+        log_message("Manual intervention may be required!")
         return False
 
 
@@ -212,25 +702,65 @@ def create_patch_notes_flag(patch_notes, app_dir):
 
 
 def restart_application(exe_path):
+    """Start The Vault, returns the process or None if it could not be launched"""
     try:
         log_message("Restarting The Vault...")
 
         # Ensure the executable is actually there and executable
         if not os.path.exists(exe_path):
             log_message(f"Error: Executable not found at {exe_path}")
-            return False
+            return None
 
         # Start the new executable
         app_dir = os.path.dirname(exe_path)
         process = subprocess.Popen([exe_path], cwd=app_dir,
-                                   creationflags=subprocess.CREATE_NEW_PROCESS_GROUP)
+                                   creationflags=getattr(subprocess, "CREATE_NEW_PROCESS_GROUP", 0))
 
-        log_message(f"The Vault restarted successfully! PID: {process.pid}")
-        return True
+        log_message(f"The Vault started with PID: {process.pid}")
+        return process
 
     except Exception as e:
         log_message(f"Failed to restart application: {str(e)}")
-        return False
+        return None
+
+
+# =============================================================================
+# STARTUP HEALTH CHECK
+# The new version removes UPDATE_HEALTH_FLAG once its event loop is running.
+# If it exits first or never gets that far, the update is rolled back.
+# =============================================================================
+
+UPDATE_HEALTH_FLAG = "update_health_check.tmp"
+STARTUP_HEALTH_TIMEOUT = 90
+
+
+def create_health_flag(app_dir, new_version):
+    flag_path = os.path.join(app_dir, UPDATE_HEALTH_FLAG)
+    with open(flag_path, 'w', encoding='utf-8') as f:
+        f.write(new_version)
+    return flag_path
+
+
+def wait_for_healthy_start(process, flag_path, timeout=STARTUP_HEALTH_TIMEOUT):
+    """True once the started app has removed the health flag"""
+    deadline = time.time() + timeout
+    while time.time() < deadline:
+        if not os.path.exists(flag_path):
+            log_message("New version reported a healthy start")
+            return True
+        if process.poll() is not None:
+            log_message(f"New version exited during startup with code {process.returncode}")
+            return False
+        time.sleep(0.25)
+
+    log_message(f"New version did not report a healthy start within {timeout}s")
+    try:
+        # The exe can't be swapped back while it is still running
+        process.terminate()
+        process.wait(10)
+    except (OSError, subprocess.TimeoutExpired):
+        pass
+    return False
 
 
 def cleanup_temp_files(app_dir):
@@ -253,6 +783,11 @@ def cleanup_temp_files(app_dir):
 
 
 def main():
+    # Release tooling: updater.py --make-manifest Vault.exe > Vault.exe.manifest.json
+    if len(sys.argv) == 3 and sys.argv[1] == "--make-manifest":
+        print(json.dumps(build_release_manifest(sys.argv[2])))
+        return
+
     if not run_as_admin():
         log_message("Requesting administrator privileges...")
         sys.exit(0)
@@ -270,13 +805,16 @@ def main():
     new_version = None
     patch_notes = "Update completed successfully!"
 
-    for i, arg in enumerate(sys.argv[1:], 1):  # Skip argv[0]
+    handoff, args = parse_handoff_args(sys.argv)
+    expected_sha256, args = parse_sha256_arg(args)
+
+    for i, arg in enumerate(args[1:], 1):  # Skip argv[0]
         if "github.com" in arg and arg.endswith(".exe"):
             download_url = arg
-            if i + 1 < len(sys.argv):
-                new_version = sys.argv[i + 1]
-            if i + 2 < len(sys.argv):
-                patch_notes = " ".join(sys.argv[i + 2:])
+            if i + 1 < len(args):
+                new_version = args[i + 1]
+            if i + 2 < len(args):
+                patch_notes = " ".join(args[i + 2:])
             break
 
     if not download_url or not new_version:
@@ -323,20 +861,40 @@ def main():
 
     success = False
 
+    previous_version = None
+    try:
+        with open(os.path.join(app_dir, "version.txt"), 'r', encoding='utf-8') as f:
+            previous_version = f.read().strip()
+    except OSError:
+        pass
+
+    # Connect before downloading so the app can announce its exit
+    handoff_connection = connect_handoff(handoff)
+
     try:
         # Step 1: Download new executable
         log_message("Step 1/5: Downloading new version...")
-        if not download_exe(download_url, temp_exe_path):
-            raise Exception("Failed to download new version")
-
-        # Step 2: Create backup
-        log_message("Step 2/5: Creating backup...")
-        if not backup_current_exe(current_exe_path, backup_exe_path):
-            raise Exception("Failed to create backup")
+        manifest = fetch_release_manifest(download_url)
+        if sha256_conflict(manifest, expected_sha256):
+            raise Exception("Release hashes disagree, update cancelled")
+        downloaded = manifest is not None and delta_update(download_url, current_exe_path, temp_exe_path, manifest)
+        if not downloaded:
+            if manifest is not None:
+                log_message("Falling back to full download")
+            if not download_exe(download_url, temp_exe_path, manifest, expected_sha256):
+                raise Exception("Failed to download new version")
+
+        # Step 2: Stage next to the current exe and wait for the app to exit
+        log_message("Step 2/5: Waiting for The Vault to exit...")
+        staged_exe_path = stage_new_executable(temp_exe_path, current_exe_path)
+        exited = wait_for_app_exit(handoff_connection, handoff)
+        handoff_connection = None
+        if not exited:
+            raise Exception("The Vault did not exit, update cancelled")
 
         # Step 3: Replace executable
         log_message("Step 3/5: Installing new version...")
-        if not replace_executable(temp_exe_path, current_exe_path, backup_exe_path):
+        if not replace_executable(staged_exe_path, current_exe_path, backup_exe_path):
             raise Exception("Failed to install new version")
 
         # Step 4: Update version file and create patch notes flag
@@ -344,23 +902,46 @@ def main():
         update_version_file(new_version, app_dir)
         create_patch_notes_flag(patch_notes, app_dir)
 
-        # Step 5: Restart application
+        # Step 5: Restart application and keep it only if it starts properly
         log_message("Step 5/5: Restarting The Vault...")
-        if restart_application(current_exe_path):
+        health_flag = create_health_flag(app_dir, new_version)
+        process = restart_application(current_exe_path)
+        if process and wait_for_healthy_start(process, health_flag):
             success = True
             log_message("Update completed successfully!")
+            try:
+                os.remove(backup_exe_path)
+            except OSError:
+                pass
         else:
-            log_message("Warning: Update completed but failed to restart application")
-            log_message("Please manually start The Vault")
-            success = True  # Update still successful
+            log_message("New version failed to start, rolling back")
+            if rollback_executable(current_exe_path, backup_exe_path):
+                if previous_version:
+                    update_version_file(previous_version, app_dir)
+                # The old version has no new patch notes to show
+                for flag in (health_flag, os.path.join(app_dir, "update_completed.tmp")):
+                    try:
+                        os.remove(flag)
+                    except OSError:
+                        pass
+                restart_application(current_exe_path)
 
     except Exception as e:
         log_message(f"Update failed: {str(e)}")
         log_message("The original version should be restored.")
 
     finally:
+        if handoff_connection:
+            handoff_connection.close()
+
         # Cleanup temporary files
         cleanup_temp_files(app_dir)
+        try:
+            staged_path = current_exe_path + ".new"
+            if os.path.exists(staged_path):
+                os.remove(staged_path)
+        except OSError:
+            pass
         # Also cleanup temp download file
         try:
             if os.path.exists(temp_exe_path):